@@ -56,15 +56,13 @@ def test_region_operations():
         # 创建区域
         region = Region(100, 100, 300, 200)
         print(f'创建区域: ({region.x}, {region.y})，宽长: {region.w}x{region.h}')
-        region.highlight()
-        time.sleep(0.5)
+        region.flash(0.5)
         region.x = 200
         region.y = 200
         region.w = 210
         region.h = 150
         print(f'修改区域: ({region.x}, {region.y})，宽长: {region.w}x{region.h}')
-        region.highlight()
-        region.highlight()
+        region.flash(0.5)
 
         # 获取区域边界
         bounds = region.get_bounds()
@@ -77,12 +75,9 @@ def test_region_operations():
         # 创建上方区域
         above_region = region.above(50)
         print(f'上方区域: ({above_region.x}, {above_region.y}) - {above_region.w}x{above_region.h}')
-        above_region.highlight()
-        time.sleep(0.5)
+        above_region.flash(0.5)
         region.move_to(Location(300, 300))
-        region.highlight()
-        region.highlight()
-        time.sleep(0.5)
+        region.flash(0.5)
 
         region.highlight_all_off()
 
@@ -191,10 +186,7 @@ def test_keyboard_operations(screen: Screen):
 
         # 按 Ctrl+C
         print('按 Ctrl+C')
-        screen.key_down(Key.CTRL)
-        screen.key_down('c')
-        screen.key_up('c')
-        screen.key_up(Key.CTRL)
+        screen.hotkey(Key.CTRL, 'c')
 
     except Exception as e:
         print(f'错误: {e}')
@@ -213,9 +205,10 @@ def test_app_operations():
         time.sleep(2)
 
         if app.is_running():
-            print(f'应用正在运行: {app.get_name()}')
-            print(f'PID: {app.get_pid()}')
-            print(f'标题: {app.get_title()}')
+            info = app.snapshot()
+            print(f'应用正在运行: {info["name"]}')
+            print(f'PID: {info["pid"]}')
+            print(f'标题: {info["title"]}')
 
             # 获取焦点
             app.focus()
@@ -254,8 +247,8 @@ def test_image_find(screen: Screen):
 
                 # 高亮匹配区域
                 print('高亮匹配区域...')
-                match.highlight('red')
-                time.sleep(1)
+                with match.highlighted('red'):
+                    time.sleep(1)
 
             else:
                 print('未找到匹配')
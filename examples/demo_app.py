@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+"""
+App 使用示例
+"""
+
+from py_sikulix import App
+
+if __name__ == '__main__':
+    # 示例代码
+    import time
+
+    app = App('Google Chrome')
+    app.open()
+    new_app = app.open('微信')
+    info = app.snapshot()
+    print(f'程序名称：{info["name"]}')
+    print(f'程序进程：{info["pid"]}')
+    print(f'程序标题：{info["title"]}')
+    print(f'新开程序名称：{new_app.get_name()}')
+    print(f'新开程序进程：{new_app.get_pid()}')
+    print(f'新开程序标题：{new_app.get_title()}')
+    print('切换Google Chrome', app.focus('Google Chrome'))
+    print('请手动切换到其他程序，5s后切回Google Chrome')
+    time.sleep(5)
+    print('切换回Google Chrome', app.focus())
+    region = app.focused_window()
+    print(
+        f'程序区域：{region._raw.getX()},{region._raw.getY()},{region._raw.getW()},{region._raw.getH()}'  # type: ignore
+    )
+    print(app.close('微信'))
+    print(app.close())
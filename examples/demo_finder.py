@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+"""
+多点找色 CrossPlatformFinder 使用示例
+"""
+
+import time
+
+from py_sikulix.extend import CrossPlatformFinder
+
+if __name__ == '__main__':
+    finder = CrossPlatformFinder()
+
+    # 样例：寻找 PowerToys 主页的蓝色颜色选取器等
+    test_config = [
+        'fafbfb|030303,3|10|f8f9fb|030303,-11|12|6fb2db|030303,-10|8|fafbfb|030303,-4|15|b4cce0|030303,-1|1|f3f8fa|030303',
+        'f9fafb|030303,-9|10|7885e2|030303,-3|25|5e41c9|030303,-4|11|5950d9|030303,-1|10|5750d9|030303,-11|31|e4ddf6|030303,9|14|38cfdb|030303',
+    ]
+
+    print('跨平台找色引擎已启动 (mss + numba + OpenCV) - 修正版')
+    print('相似度计算: 基于匹配比例 (与原始方法一致)')
+    import random
+
+    # 预热编译
+    finder.find_multi_color(test_config[0], 0.7)
+
+    times = []
+    for _ in range(50):
+        t_index = random.randint(0, len(test_config) - 1)
+        start_t = time.time()
+        result = finder.find_multi_color(test_config[t_index], 0.7)
+        end_t = time.time()
+
+        if result:
+            print(
+                f'找到第{t_index}个目标！坐标:{result[0][0]},{result[0][1]} 宽度:{result[0][2]} 高度:{result[0][3]} 相似度:{result[1]:.2f} 耗时:{(end_t - start_t) * 1000:.2f}ms'
+            )
+        else:
+            print(f'未找到，耗时:{(end_t - start_t) * 1000:.2f}ms')
+        times.append((end_t - start_t) * 1000)
+
+    print(f'平均耗时: {sum(times) / len(times):.2f}ms')
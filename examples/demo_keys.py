@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+"""
+键盘、鼠标按键常量使用示例
+"""
+
+from py_sikulix.keys import Btn, Key, KeyModifier
+
+if __name__ == '__main__':
+    print('方向键:')
+    print(f'UP: {Key.UP}')
+    print(f'DOWN: {Key.DOWN}')
+    print(f'LEFT: {Key.LEFT}')
+    print(f'RIGHT: {Key.RIGHT}')
+
+    print('\n功能键:')
+    print(f'F1: {Key.F1}')
+    print(f'F2: {Key.F2}')
+
+    print('\n控制键:')
+    print(f'ENTER: {Key.ENTER}')
+    print(f'TAB: {Key.TAB}')
+    print(f'ESC: {Key.ESC}')
+
+    print('\n小键盘:')
+    print(f'ADD: {Key.ADD}')
+    print(f'MINUS: {Key.MINUS}')
+
+    print('\n修饰键:')
+    print(f'CTRL: {KeyModifier.CTRL}')
+    print(f'SHIFT: {KeyModifier.SHIFT}')
+
+    print('\n鼠标键:')
+    print(f'LEFT: {Btn.LEFT}')
+    print(f'RIGHT: {Btn.RIGHT}')
+    print(f'MIDDLE: {Btn.MIDDLE}')
+    print(f'WHEEL_UP: {Btn.WHEEL_UP}')
+    print(f'WHEEL_DOWN: {Btn.WHEEL_DOWN}')
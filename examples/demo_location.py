@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+"""
+Location 使用示例
+"""
+
+from py_sikulix import Location
+
+if __name__ == '__main__':
+    loc = Location(100, 200)
+    print(f'初始位置: ({loc.x}, {loc.y})')
+
+    offset_loc = loc.offset(50, 30)
+    print(f'右偏50，下偏30后位置: ({offset_loc.x}, {offset_loc.y})')
+
+    above_loc = loc.above(50)
+    print(f'上方50像素位置: ({above_loc.x}, {above_loc.y})')
+
+    below_loc = loc.below(50)
+    print(f'下方50像素位置: ({below_loc.x}, {below_loc.y})')
+
+    left_loc = loc.left(50)
+    print(f'左侧50像素位置: ({left_loc.x}, {left_loc.y})')
+
+    right_loc = loc.right(50)
+    print(f'右侧50像素位置: ({right_loc.x}, {right_loc.y})')
+
+    print(f'打印对象：{loc}')
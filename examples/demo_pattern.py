@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+"""
+Pattern 使用示例
+"""
+
+from py_sikulix import Pattern
+
+if __name__ == '__main__':
+    import pathlib
+
+    print('=' * 50)
+    print('示例1: 创建 Pattern 对象')
+    print('=' * 50)
+
+    image_path = 'examples/RecycleBin.png'
+    try:
+        pattern1 = Pattern(image_path)
+        print(f'成功创建 Pattern: {image_path}')
+    except FileNotFoundError as e:
+        print(f'文件不存在: {e}')
+
+    path_obj = pathlib.Path('examples/RecycleBin_Transparent.png')
+    try:
+        pattern2 = Pattern(path_obj)
+        print(f'使用 pathlib.Path 创建 Pattern: {path_obj}')
+    except FileNotFoundError as e:
+        print(f'文件不存在: {e}')
+
+    print('\n' + '=' * 50)
+    print('示例2: 设置相似度阈值')
+    print('=' * 50)
+
+    try:
+        pattern = Pattern('examples/RecycleBin_Transparent.png')
+        pattern.similar = 0.8
+        print(f'设置相似度: {pattern.similar}')
+    except FileNotFoundError:
+        print('跳过示例2: 测试图像不存在')
+
+    print('\n' + '=' * 50)
+    print('示例3: 精确匹配')
+    print('=' * 50)
+
+    try:
+        pattern = Pattern('examples/RecycleBin_Transparent.png')
+        pattern.exact()
+        print(f'精确匹配模式，相似度: {pattern.similar}')
+    except FileNotFoundError:
+        print('跳过示例3: 测试图像不存在')
+
+    print('\n' + '=' * 50)
+    print('示例4: 图像缩放')
+    print('=' * 50)
+
+    try:
+        pattern = Pattern('examples/RecycleBin_Transparent.png')
+        pattern.resize = 1.5
+        print('图像放大 1.5 倍')
+        pattern.set_resize(0.5)
+        print('图像缩小到 0.5 倍')
+    except FileNotFoundError:
+        print('跳过示例4: 测试图像不存在')
+
+    print('\n' + '=' * 50)
+    print('示例5: 目标偏移量')
+    print('=' * 50)
+
+    try:
+        pattern = Pattern('examples/RecycleBin_Transparent.png')
+        pattern.target_offset = 10, 20
+        location = pattern.target_offset
+        print(f'目标偏移量: x={location.x}, y={location.y}')
+    except FileNotFoundError:
+        print('跳过示例5: 测试图像不存在')
+
+    print('\n' + '=' * 50)
+    print('示例6: 蒙版功能')
+    print('=' * 50)
+
+    try:
+        pattern_black = Pattern('examples/RecycleBin_Black.png').mask()
+        print('方式1: 使用图像黑色部分作为蒙版')
+        pattern_trans = Pattern('examples/RecycleBin_Transparent.png').mask()
+        print('方式2: 使用透明部分作为蒙版')
+        pattern_mask = Pattern('examples/RecycleBin.png').mask('examples/RecycleBin_Black.png')
+        print('方式3: 使用另一个图像作为蒙版')
+    except FileNotFoundError:
+        print('跳过示例6: 测试图像不存在')
+
+    print('\n' + '=' * 50)
+    print('示例7: Getter 方法 - 获取 Pattern 属性')
+    print('=' * 50)
+
+    try:
+        pattern = Pattern('examples/RecycleBin.png').set_similar(0.85).set_target_offset(5, -10)
+        filename = pattern.get_filename()
+        print(f'图像路径: {filename}')
+        similarity = pattern.get_similar()
+        print(f'相似度: {similarity}')
+        offset = pattern.get_target_offset()
+        print(f'目标偏移: dx={offset.x}, dy={offset.y}')
+    except FileNotFoundError:
+        print('跳过示例7: 测试图像不存在')
+
+    print('\n' + '=' * 50)
+    print('示例8: 流式 API - 方法链式调用')
+    print('=' * 50)
+
+    try:
+        pattern = Pattern('examples/RecycleBin.png').set_similar(0.9).set_target_offset(0, 5).set_resize(1.2)
+        print('链式调用创建 Pattern 成功！')
+        print(f'  相似度: {pattern.get_similar()}')
+        print(f'  偏移量: {pattern.get_target_offset()}')
+        print(f'  缩放比: {pattern.get_resize()}')
+    except FileNotFoundError:
+        print('跳过示例8: 测试图像不存在')
+
+    print('\n' + '=' * 50)
+    print('示例9: 实际使用场景')
+    print('=' * 50)
+
+    try:
+        exact_pattern = Pattern('examples/RecycleBin.png').exact()
+        print('场景2: 精确匹配按钮')
+        offset_pattern = Pattern('examples/RecycleBin.png').set_target_offset(50, 0)
+        print('场景3: 点击图标右侧 50 像素处')
+        scaled_pattern = Pattern('examples/RecycleBin.png').set_resize(1.5)
+        print('场景4: 高 DPI 屏幕缩放匹配')
+        masked_pattern = Pattern('examples/RecycleBin.png').mask('examples/RecycleBin.png')
+        print('场景5: 使用蒙版忽略背景')
+    except FileNotFoundError:
+        print('跳过示例9: 测试图像不存在')
+
+    print(f'打印对象：{pattern}')  # type: ignore
+
+    print('\n所有示例完成！')
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+"""
+Region 使用示例
+"""
+
+from py_sikulix import Region
+
+if __name__ == '__main__':
+    # 示例代码 - Region 类测试示例
+
+    from py_sikulix.keys import Btn, Key
+
+    # ============================================
+    # 第一部分: Region 基础操作示例
+    print('=' * 60)
+    print('第一部分: Region 基础操作示例')
+    print('=' * 60)
+
+    # 示例1: 创建 Region 对象
+    region = Region(100, 100, 300, 200)
+    print(f'创建区域: 位置({region.x}, {region.y}), 大小({region.w}x{region.h})')
+    # # 示例2: 获取和设置 Region 属性
+    # bounds = region.get_bounds()
+    # print(f'区域边界: x={bounds[0]}, y={bounds[1]}, w={bounds[2]}, h={bounds[3]}')
+    # center = region.get_center()
+    # print(f'区域中心: ({center.x}, {center.y})')
+    # # 示例3: 修改 Region 属性（链式调用）
+    # region.set_x(200).set_y(150).set_w(400).set_h(300)
+    # print(f'改后区域: 位置({region.x}, {region.y}), 大小({region.w}x{region.h})')
+    # # 同时修改多个值时 set_rect 只需一次网关往返
+    # region.set_rect(50, 50, 500, 400)
+    # print(f'set_rect后: 位置({region.x}, {region.y}), 大小({region.w}x{region.h})')
+    # print(
+    #     f'左上角位置点：{region.get_top_left()}，左下角位置点：{region.get_bottom_left()}，右上角位置点：{region.get_top_right()}，右上角位置点：{region.get_bottom_right()}，'
+    # )
+    # region.set_roi(10, 10, 200, 100)
+    # print('设置ROI区域')
+    # # 示例4: Region 创建方法（above, below, left, right, nearby, grow）
+    # new_region = Region(0, 0, 300, 300)
+    # print(f'基础区域: ({new_region.x}, {new_region.y}), {new_region.w}x{new_region.h}')
+    # above_region = new_region.above(50)
+    # print(f'上方区域: ({above_region.x}, {above_region.y}), {above_region.w}x{above_region.h}')
+    # below_region = new_region.below(50)
+    # print(f'下方区域: ({below_region.x}, {below_region.y}), {below_region.w}x{below_region.h}')
+    # left_region = new_region.left(50)
+    # print(f'左侧区域: ({left_region.x}, {left_region.y}), {left_region.w}x{left_region.h}')
+    # right_region = new_region.right(50)
+    # print(f'右侧区域: ({right_region.x}, {right_region.y}), {right_region.w}x{right_region.h}')
+    # grown_region = new_region.grow(25)
+    # print(f'扩展区域: ({grown_region.x}, {grown_region.y}), {grown_region.w}x{grown_region.h}')
+    # new_region.highlight()
+    # print(f'高亮当前区域: {new_region}')
+
+    # # 第二部分: Region 交互操作示例
+    # print('=' * 60)
+    # print('第二部分: Region 鼠标操作示例')
+    # print('=' * 60)
+    # # 示例1: 点击类操作
+    # print(f'点击区域中心：{region.click()}')
+    # time.sleep(1)
+    # print(f'左键点击区域图像：{region.click(Pattern("examples/RecycleBin.png"))}')
+    # time.sleep(1)
+    print(f'右键点击区域中心（无效）：{region.click(key=Btn.RIGHT)}')
+    # time.sleep(1)
+    # print(f'双击区域图像：{region.double_click()}')
+    # time.sleep(1)
+    # print(f'右键点击区域图像：{region.right_click(Pattern("examples/RecycleBin.png"))}')
+    # time.sleep(1)
+    # print('点击100,100位置：region.click(Location(100, 100))')
+    # time.sleep(1)
+    # match = region.find_multi_color(
+    #     'f9fafb|030303,-9|10|7885e2|030303,-3|25|5e41c9|030303,-4|11|5950d9|030303,-1|10|5750d9|030303,-11|31|e4ddf6|030303,9|14|38cfdb|030303'
+    # )
+    # if match:
+    #     print(f'找到匹配项：{match}')
+    # else:
+    #     print('未找到匹配项')
+
+    # # 示例2: 移动类操作
+    # print(f'移动鼠标到目标图像：{region.hover(Pattern("examples/RecycleBin.png"))}')
+    # time.sleep(1)
+    # print(f'拖动到目标位置：{region.drag_drop(Pattern("examples/RecycleBin.png"), Location(200, 200))}')
+    # time.sleep(1)
+    # print(f'左键按下（不松开）：{region.mouse_down()}')
+    # time.sleep(1)
+    # print(f'鼠标移动相对当前点30,30位置：{region.mouse_move(30, 30)}')
+    # time.sleep(1)
+    # print(f'左键松开：{region.mouse_up()}')
+    # time.sleep(1)
+    # print(f'鼠标移动指定100,100位置：{region.mouse_move(Location(100, 100))}')
+    # time.sleep(1)
+    # print(f'右键按下（不松开）：{region.mouse_down(Btn.RIGHT)}')
+    # time.sleep(1)
+    # print(f'右键松开：{region.mouse_up(Btn.RIGHT)}')
+    # time.sleep(1)
+    # print(f'鼠标滚动：{region.wheel(Location(600, 600))}')
+    # time.sleep(1)
+
+    # # # 示例3: 键盘类操作
+    print(f'按键按下（无效）：{region.key_down(Key.WIN)}')
+    print(f'组合按键：{region.type("r")}')
+    print(f'按键松开（无效）：{region.key_up(Key.WIN)}')
+    # time.sleep(1)
+    # print(f'输入文本：{region.type("notepad")}')
+    # print(f'输入文本（无效）：{region.type(Key.ENTER)}')
+    # time.sleep(1)
+    # print(f'粘贴文本：{region.paste("你好中国，See u")}')
+    # time.sleep(1)
+    # print(f'文本提取（效果差）：{region.text()}')
+    # time.sleep(1)
+
+    # new_region.highlight_all_off()
+
+    # 示例代码 - Match 类测试示例
+    # from py_sikulix.screen import Screen
+
+    # # 创建屏幕实例
+    # screen = Screen()
+
+    # # ============================================
+    # # 示例1: 查找图像并获取 Match 对象
+    # print('=' * 50)
+    # print('示例1: 查找图像并获取 Match 对象')
+    # print('=' * 50)
+
+    # # 查找图像（需要先准备好测试图像）
+    # image_path = pathlib.Path('examples/RecycleBin.png')
+    # print('图像状态：', image_path.exists(), image_path.absolute())
+    # match = screen.find(image_path)
+
+    # if match:
+    #     print(f'找到匹配！左上角坐标: ({match.x}, {match.y}), 大小: {match.w}x{match.h}')
+    # else:
+    #     print('未找到匹配')
+
+    # # ============================================
+    # # 示例2: 获取匹配分数 (get_score)
+    # print('\n' + '=' * 50)
+    # print('示例2: 获取匹配分数')
+    # print('=' * 50)
+
+    # if match:
+    #     score = match.get_score()
+    #     print(f'匹配分数: {score:.4f} (范围 0.0-1.0)')
+
+    #     if score > 0.9:
+    #         print('高置信度匹配！')
+    #     elif score > 0.7:
+    #         print('中等置信度匹配')
+    #     else:
+    #         print('低置信度匹配')
+
+    # # ============================================
+    # # 示例3: 获取点击目标位置 (get_target)
+    # print('\n' + '=' * 50)
+    # print('示例3: 获取点击目标位置')
+    # print('=' * 50)
+
+    # if match:
+    #     target = match.get_target()
+    #     print(f'点击目标位置: ({target.x}, {target.y})')
+
+    # # ============================================
+    # # 示例4: Match 继承自 Region 的属性和方法
+    # print('\n' + '=' * 50)
+    # print('示例4: Match 继承自 Region 的属性')
+    # print('=' * 50)
+
+    # if match:
+    #     print(f'区域左上角: ({match.x}, {match.y})')
+    #     print(f'区域大小: {match.w} x {match.h}')
+
+    #     center = match.get_center()
+    #     print(f'区域中心: ({center.x}, {center.y})')
+
+    # # ============================================
+    # # 示例5: 比较运算符 - 比较两个 Match 的分数
+    # print('\n' + '=' * 50)
+    # print('示例5: 比较运算符')
+    # print('=' * 50)
+
+    # match_raw = screen.find('examples/RecycleBin.png')
+    # match_trn = screen.find('examples/RecycleBin_Transparent.png')
+    # print(match_raw, match_trn)
+
+    # if match_raw and match_trn:
+    #     score1 = match_raw.get_score()
+    #     score2 = match_trn.get_score()
+
+    #     print(f'MatchRaw 分数: {score1:.4f}')
+    #     print(f'MatchRrn 分数: {score2:.4f}')
+
+    #     if match_raw > match_trn:
+    #         print('MatchRaw 的分数更高 (MatchRaw > MatchRrn)')
+    #     elif match_raw < match_trn:
+    #         print('MatchRrn 的分数更高 (MatchRaw < MatchRrn)')
+    #     else:
+    #         print('两个匹配分数相同 (MatchRaw == MatchRrn)')
+
+    #     print(f'MatchRaw >= MatchRrn: {match_raw >= match_trn}')
+    #     print(f'MatchRaw <= MatchRrn: {match_raw <= match_trn}')
+
+    # # ============================================
+    # # 示例6: 使用 find_all 获取多个 Match 并排序
+    # print('\n' + '=' * 50)
+    # print('示例6: 获取多个匹配并按分数排序')
+    # print('=' * 50)
+
+    # matches = screen.find_all('examples/RecycleBin_Transparent.png')
+    # if matches:
+    #     print(f'找到 {len(matches)} 个匹配')
+
+    #     sorted_matches = sorted(matches, key=lambda m: m.get_score(), reverse=True)
+
+    #     for i, m in enumerate(sorted_matches):
+    #         print(f'匹配 {i + 1}: 分数={m.get_score():.4f}, 位置=({m.x}, {m.y})')
+
+    #     best_match = sorted_matches[0]
+    #     print(f'\n最佳匹配: 分数={best_match.get_score():.4f}')
+
+    # # ============================================
+    # # 示例7: Match 与 Pattern 配合使用
+    # print('\n' + '=' * 50)
+    # print('示例7: Match 与 Pattern 配合使用')
+    # print('=' * 50)
+
+    # pattern = Pattern('examples/RecycleBin_Transparent.png').set_similar(0.9)
+
+    # match = screen.find(pattern)
+    # if match:
+    #     print(f'使用 Pattern 找到匹配，分数: {match.get_score():.4f}，位置: ({match.x}, {match.y})')
+    #     match.click()
+    # print('\n所有示例完成！')
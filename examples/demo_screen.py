@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+"""
+Screen 使用示例
+"""
+
+from py_sikulix import Screen
+
+if __name__ == '__main__':
+    # 创建屏幕实例用于查找操作
+    screen = Screen()
+
+    # 示例5: find() - 查找单个图像
+    print('\n--- 示例5: find() - 查找单个图像 ---')
+
+    image_path = 'examples/RecycleBin.png'
+    match = screen.find(image_path)
+
+    if match:
+        print(f'找到图像! 位置: ({match.x}, {match.y}), 大小: {match.w}x{match.h}')
+        print(f'匹配分数: {match.get_score():.4f}')
+    else:
+        print(f'未找到图像: {image_path}')
+
+    # 示例6: find_all() - 查找所有匹配
+    print('\n--- 示例6: find_all() - 查找所有匹配 ---')
+
+    matches = screen.find_all(image_path)
+    if matches:
+        print(f'找到 {len(matches)} 个匹配')
+        for i, m in enumerate(matches):
+            print(f'  匹配 {i + 1}: ({m.x}, {m.y}), 分数={m.get_score():.4f}')
+    else:
+        print('未找到任何匹配')
+
+    # 示例7: wait() - 等待图像出现
+    print('\n--- 示例7: wait() - 等待图像出现 ---')
+
+    match = screen.wait(image_path, 5)
+    if match:
+        print(f'图像在等待时间内出现! 位置: ({match.x}, {match.y})')
+    else:
+        print('等待超时，图像未出现')
+
+    # 示例8: wait_vanish() - 等待图像消失
+    print('\n--- 示例8: wait_vanish() - 等待图像消失 ---')
+
+    vanished = screen.wait_vanish(image_path, 5)
+    if vanished:
+        print('图像已消失')
+    else:
+        print('等待超时，图像仍然存在')
+
+    # 示例9: exists() - 检查图像是否存在
+    print('\n--- 示例9: exists() - 检查图像是否存在 ---')
+
+    match = screen.exists(image_path)
+    if match:
+        print(f'图像存在! 位置: ({match.x}, {match.y})')
+    else:
+        print('图像不存在')
+
+    # 示例18: 获取屏幕信息
+    print('\n--- 示例18: 获取屏幕信息 ---')
+
+    num_screens = screen.get_number_screens()
+    print(f'显示器数量: {num_screens}')
+
+    screen_bounds = screen.get_bounds()
+    print(f'屏幕边界: x={screen_bounds[0]}, y={screen_bounds[1]}, w={screen_bounds[2]}, h={screen_bounds[3]}')
+
+    # 示例19: 屏幕截图
+    print('\n--- 示例19: 屏幕截图 ---')
+
+    print('截取整个屏幕')
+    print('截取指定区域 (100, 100, 300, 200)')
+
+    # 示例20: highlight() - 高亮显示区域
+    print('\n--- 示例20: highlight() - 高亮显示区域 ---')
+    print('高亮显示区域2秒')
+
+    # 示例21: get_last_match() - 获取最后一次匹配
+    print('\n--- 示例21: get_last_match() - 获取最后一次匹配 ---')
+
+    last_match = screen.get_last_match()
+    if last_match:
+        print(f'最后一次匹配: ({last_match.x}, {last_match.y})')
+    else:
+        print('没有最后一次匹配记录')
+
+    print('\n' + '=' * 60)
+    print('所有示例完成！')
+    print('=' * 60)
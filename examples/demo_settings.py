@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+"""
+Setting 使用示例
+"""
+
+from py_sikulix import Setting
+
+if __name__ == '__main__':
+    setting = Setting()
+    print(f'当前最小相似度: {setting.min_similarity}')
+
+    # 修改一些设置
+    setting.min_similarity = 0.8
+    setting.action_logs = True
+    setting.debug_logs = True
+
+    print(f'修改后的最小相似度: {setting.min_similarity}')
+    print(f'动作日志状态: {setting.action_logs}')
+    print(f'调试日志状态: {setting.debug_logs}')
+
+    # 测试新增的方法
+    print(f'数据路径: {setting.get_data_path()}')
+    print(f'文件路径分隔符: {setting.get_file_path_seperator()}')
+    print(f'图像缓存大小: {setting.get_image_cache()}')
+    print(f'操作系统: {setting.get_os()}')
+    print(f'操作系统版本: {setting.get_os_version()}')
+    print(f'路径分隔符: {setting.get_path_separator()}')
+    print(f'当前时间戳: {setting.get_timestamp()}')
+    print(f'SikuliX版本: {setting.get_version()}')
+    print(f'构建版本: {setting.get_version_build()}')
+    print(f'是否为Linux系统: {setting.is_linux()}')
+    print(f'是否为Mac系统: {setting.is_mac()}')
+    print(f'是否为Windows系统: {setting.is_windows()}')
+    print(f'是否显示动作: {setting.is_show_actions()}')
+    print(f'鼠标移动速度: {setting.move_mouse_delay}')
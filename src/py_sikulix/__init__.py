@@ -15,8 +15,8 @@ Py-SikuliX: Python 客户端库，用于 SikuliX GUI 自动化。
 __version__ = '0.1.1'
 
 from py_sikulix.app import App
-from py_sikulix.client import reg_exit_listener
-from py_sikulix.keys import Btn, Key
+from py_sikulix.client import log_errors, reg_exit_listener
+from py_sikulix.keys import Btn, Key, KeyModifier
 from py_sikulix.location import Location
 from py_sikulix.pattern import Pattern
 from py_sikulix.region import Match, Region
@@ -27,6 +27,7 @@ from py_sikulix.settings import Setting
 __all__ = [
     '__version__',
     # 客户端工具
+    'log_errors',
     'reg_exit_listener',
     # 区域
     'Region',
@@ -39,6 +40,7 @@ __all__ = [
     # 常量
     'Btn',
     'Key',
+    'KeyModifier',
     # 配置
     'Setting',
 ]
@@ -2,15 +2,33 @@
 
 #
 
+import functools
+import os
 import pathlib
 from typing import Optional, Union
 
-from py4j.java_gateway import JavaObject
+from py4j.java_gateway import JavaObject, get_method
 
-from py_sikulix.client import get_cli
+from py_sikulix.client import abs_path_str, get_cli
 from py_sikulix.region import Region
 
 
+def _resolve_app_name(name: Union[str, pathlib.Path]) -> str:
+    """
+    处理应用程序名称：不含路径分隔符的名称（如 'calc'、'notepad.exe'、'Google Chrome.app'）原样交给 SikuliX
+    按 PATH/注册表解析，含路径分隔符的字符串或 pathlib.Path 视为文件路径转换为绝对路径。
+
+    Args:
+        name: 应用程序名称或可执行文件路径
+
+    Returns:
+        传给 SikuliX 的应用程序名称或路径
+    """
+    if isinstance(name, str) and os.sep not in name and '/' not in name:
+        return name
+    return abs_path_str(str(name))
+
+
 class App:
     """App 类用于控制应用程序的启动、关闭和焦点管理。"""
 
@@ -22,16 +40,35 @@ class App:
             name: 应用程序名称（不区分大小写）或可执行文件的路径
         """
         if isinstance(name_or_java_obj, (str, pathlib.Path)):
-            name_or_java_obj = get_cli().App(str(pathlib.Path(name_or_java_obj).absolute()))  # type: ignore
+            name_or_java_obj = get_cli().App(_resolve_app_name(name_or_java_obj))  # type: ignore
         if not isinstance(name_or_java_obj, JavaObject):
             raise ValueError(
                 'please pass in the correct types of name parameter. do not directly pass in JavaObject to create the Class.'
             )
         self._raw = name_or_java_obj  # type: ignore
-
-    @property
+        self._bind_methods()
+
+    def _bind_methods(self) -> None:
+        """绑定高频调用的 Java 方法引用，_raw 被替换后需重新调用。"""
+        raw = self._raw
+        self._get_name = get_method(raw, 'getName')
+        self._get_title = get_method(raw, 'getTitle')
+        self._get_pid = get_method(raw, 'getPID')
+        self._is_valid = get_method(raw, 'isValid')
+        self._is_running = get_method(raw, 'isRunning')
+
+    @functools.cached_property
     def name(self) -> str:
-        return self._raw.getName()  # type: ignore
+        """
+        获取应用程序名称，首次读取后缓存，open()、close()、focus() 时清除。
+
+        Returns:
+            应用程序名称
+        """
+        return self._get_name()  # type: ignore
+
+    def _invalidate_name(self) -> None:
+        self.__dict__.pop('name', None)
 
     def open(self, name: Optional[str] = None) -> 'App':
         """
@@ -43,10 +80,12 @@ class App:
         Returns:
             包装后的 App 对象
         """
+        self._invalidate_name()
         if name is None:
             self._raw.open()  # type: ignore
         else:
-            self._raw = self._raw.open(name)  # type: ignore
+            self._raw = self._raw.open(_resolve_app_name(name))  # type: ignore
+            self._bind_methods()
         return self
 
     def close(self, name: Optional[str] = None) -> bool:
@@ -59,6 +98,7 @@ class App:
         Returns:
             关闭成功返回 True，否则返回 False
         """
+        self._invalidate_name()
         if name is None:
             return self._raw.close()  # type: ignore
         return self._raw.close(name)  # type: ignore
@@ -74,10 +114,12 @@ class App:
         Returns:
             当前 App 对象
         """
+        self._invalidate_name()
         if title is None:
             self._raw.focus()  # type: ignore
         else:
             self._raw = self._raw.focus(title, index)  # type: ignore
+            self._bind_methods()
         return self
 
     def set_using(self, param_text: Union[str, list[str]]):
@@ -116,7 +158,7 @@ class App:
         Returns:
             如果有进程 ID 则为 True，否则为 False
         """
-        return self._raw.isValid()  # type: ignore
+        return self._is_valid()  # type: ignore
 
     def is_running(self, wait_time: Optional[int] = 1) -> bool:
         """
@@ -128,7 +170,7 @@ class App:
         Returns:
             正在运行返回 True，否则返回 False
         """
-        return self._raw.isRunning(wait_time)  # type: ignore
+        return self._is_running(wait_time)  # type: ignore
 
     def has_window(self) -> bool:
         """
@@ -157,7 +199,7 @@ class App:
         Returns:
             应用程序窗口标题
         """
-        return self._raw.getTitle()  # type: ignore
+        return self._get_title()  # type: ignore
 
     def get_pid(self) -> int:
         """
@@ -166,7 +208,7 @@ class App:
         Returns:
             进程ID，如果无法获取则返回 -1
         """
-        return self._raw.getPID()  # type: ignore
+        return self._get_pid()  # type: ignore
 
     def get_name(self) -> str:
         """
@@ -177,27 +219,11 @@ class App:
         """
         return self.name  # type: ignore
 
+    def snapshot(self) -> dict[str, Union[str, int]]:
+        """
+        获取应用程序的名称、进程ID与窗口标题，名称复用缓存，已缓存时只需两次网关调用。
 
-if __name__ == '__main__':
-    # 示例代码
-    import time
-
-    app = App('Google Chrome')
-    app.open()
-    new_app = app.open('微信')
-    print(f'程序名称：{app.name}')
-    print(f'程序进程：{app.get_pid()}')
-    print(f'程序标题：{app.get_title()}')
-    print(f'新开程序名称：{new_app.get_name()}')
-    print(f'新开程序进程：{new_app.get_pid()}')
-    print(f'新开程序标题：{new_app.get_title()}')
-    print('切换Google Chrome', app.focus('Google Chrome'))
-    print('请手动切换到其他程序，5s后切回Google Chrome')
-    time.sleep(5)
-    print('切换回Google Chrome', app.focus())
-    region = app.focused_window()
-    print(
-        f'程序区域：{region._raw.getX()},{region._raw.getY()},{region._raw.getW()},{region._raw.getH()}'  # type: ignore
-    )
-    print(app.close('微信'))
-    print(app.close())
+        Returns:
+            {'name': 名称, 'pid': 进程ID, 'title': 窗口标题}
+        """
+        return {'name': self.name, 'pid': self._get_pid(), 'title': self._get_title()}
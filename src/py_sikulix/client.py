@@ -1,19 +1,35 @@
 #!/usr/bin/env python3
 
+import contextlib
+import functools
 import logging
 import os
+import pathlib
 import threading
-from typing import Any
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
-from py4j.java_gateway import GatewayParameters, JavaClass, JavaGateway, JavaObject, JavaPackage
+from py4j.java_gateway import GatewayParameters, JavaClass, JavaGateway, JavaObject, JavaPackage, get_method
 from py4j.protocol import Py4JNetworkError
-from pynput import keyboard
 
-# 配置日志
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+if TYPE_CHECKING:
+    # pynput 导入时就会连接 X 服务器/系统输入接口，只在注册退出监听时才导入
+    from pynput import keyboard
+
+# 配置日志，调用方已配置日志时不再覆盖
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+class _RawBacked:
+    """封装 Java 对象的包装类标记基类，子类通过 _raw 属性持有原始 Java 对象。"""
+
+    __slots__ = ()
+
+    _raw: JavaObject
+
+
 class SikuliXClient:
     """SikuliX Python 客户端主类，提供对 SikuliX 核心功能的 Python 封装。"""
 
@@ -31,57 +47,158 @@ class SikuliXClient:
             self.gateway = JavaGateway(gateway_parameters=GatewayParameters(port=self.port, auto_field=True))
             self.jvm = self.gateway.jvm  # type: ignore
 
-            # 初始化核心 SikuliX 类
-            self._init_classes()
+            # 只解析 org.sikuli 包，同时校验网关连通；具体 Java 类在首次使用时再解析
+            self.Sikuli: JavaPackage = self.jvm.org.sikuli  # type: ignore
         except Py4JNetworkError as e:
             # 原报错很长，这里截断重新抛出
             raise Py4JNetworkError(f'无法连接到 SikuliX 网关，请检查网关是否正常启动：{e}')
 
-    def _init_classes(self):
-        """初始化 SikuliX 核心 Java 类引用。"""
-        self.Sikuli: JavaPackage = self.jvm.org.sikuli  # type: ignore
-        self.Screen: JavaClass = self.Sikuli.script.Screen  # type: ignore
-        self.Region: JavaClass = self.Sikuli.script.Region  # type: ignore
-        self.App: JavaClass = self.Sikuli.script.App  # type: ignore
-        self.Pattern: JavaClass = self.Sikuli.script.Pattern  # type: ignore
-        self.Match: JavaClass = self.Sikuli.script.Match  # type: ignore
-        self.Location: JavaClass = self.Sikuli.script.Location  # type: ignore
-        self.Key: JavaClass = self.Sikuli.script.Key  # type: ignore
-        self.Button: JavaClass = self.Sikuli.script.Button  # type: ignore
-        self.Options: JavaClass = self.Sikuli.script.Options  # type: ignore
-        self.Settings: JavaClass = self.Sikuli.basics.Settings  # type: ignore
+    # 以下 Java 类引用按需解析并缓存在实例上，每个类名解析都需要一次网关往返，
+    # 只用到 Key、Region 的脚本不必为其余类付出启动开销。并发首次访问最多重复解析一次，结果相同。
+    @functools.cached_property
+    def Screen(self) -> JavaClass:
+        return self.Sikuli.script.Screen  # type: ignore
+
+    @functools.cached_property
+    def Region(self) -> JavaClass:
+        return self.Sikuli.script.Region  # type: ignore
+
+    @functools.cached_property
+    def App(self) -> JavaClass:
+        return self.Sikuli.script.App  # type: ignore
+
+    @functools.cached_property
+    def Pattern(self) -> JavaClass:
+        return self.Sikuli.script.Pattern  # type: ignore
+
+    @functools.cached_property
+    def Match(self) -> JavaClass:
+        return self.Sikuli.script.Match  # type: ignore
+
+    @functools.cached_property
+    def Location(self) -> JavaClass:
+        return self.Sikuli.script.Location  # type: ignore
+
+    @functools.cached_property
+    def Key(self) -> JavaClass:
+        return self.Sikuli.script.Key  # type: ignore
+
+    @functools.cached_property
+    def KeyModifier(self) -> JavaClass:
+        return self.Sikuli.script.KeyModifier  # type: ignore
+
+    @functools.cached_property
+    def Button(self) -> JavaClass:
+        return self.Sikuli.script.Button  # type: ignore
+
+    @functools.cached_property
+    def Options(self) -> JavaClass:
+        return self.Sikuli.script.Options  # type: ignore
+
+    @functools.cached_property
+    def Settings(self) -> JavaClass:
+        return self.Sikuli.basics.Settings  # type: ignore
 
     def list2java_array(self, args: list[Any]) -> JavaObject:
-        java_args: JavaObject = _G_SKL_CLI.jvm.java.util.ArrayList()  # type: ignore
+        """
+        将 Python 列表转换为 Java ArrayList，封装对象（Region、Pattern 等）自动取出原始 Java 对象。
+
+        py4j 的 ListConverter 同样逐个 add，每个元素一次网关往返无法避免；这里预先绑定 add 方法，
+        省去 auto_field 下首次访问的字段探测。
+
+        Args:
+            args: Python 列表
+
+        Returns:
+            Java ArrayList 对象
+        """
+        java_args: JavaObject = self.jvm.java.util.ArrayList()  # type: ignore
+        add = get_method(java_args, 'add')
         for arg in args:
-            # try:
-            java_args.append(arg)  # type: ignore
-            # except Exception:
-            #     java_args.append(arg._raw)  # type: ignore
+            add(arg._raw if isinstance(arg, _RawBacked) else arg)
         return java_args
 
 
 # 全局单例客户端，需要延迟启动否则 gateway 引入时会直接启动Client连接网关报错
 _G_SKL_CLI: SikuliXClient | None = None
+_G_SKL_CLI_LOCK = threading.Lock()
 
 
 def get_cli() -> SikuliXClient:
-    """获取全局单例 SikuliX 客户端。"""
+    """获取全局单例 SikuliX 客户端，多线程首次调用时只会创建一个连接。"""
     global _G_SKL_CLI
-    if _G_SKL_CLI is None:
-        _G_SKL_CLI = SikuliXClient()
-    return _G_SKL_CLI
+    cli = _G_SKL_CLI
+    if cli is None:
+        # 双重检查加锁，已创建后的调用不再获取锁
+        with _G_SKL_CLI_LOCK:
+            if _G_SKL_CLI is None:
+                _G_SKL_CLI = SikuliXClient()
+            cli = _G_SKL_CLI
+    return cli
+
+
+def abs_path_str(path: str) -> str:
+    """
+    将路径转换为绝对路径字符串，相对路径以调用时的工作目录为准。
+
+    结果按 (工作目录, 输入) 缓存，重复使用同一图像路径时不再创建 Path 对象；切换工作目录后不会返回旧目录下的路径。
+
+    Args:
+        path: 文件路径
+
+    Returns:
+        绝对路径字符串
+    """
+    return _abs_path_str(os.getcwd(), path)
+
+
+@functools.lru_cache(maxsize=1024)
+def _abs_path_str(cwd: str, path: str) -> str:
+    return str(pathlib.Path(cwd, path))
+
+
+@contextlib.contextmanager
+def log_errors(name: str = 'SikuliX') -> Iterator[None]:
+    """
+    捕获代码块内的异常并记录错误日志，不再向外抛出。
+
+    鼠标、键盘方法默认直接抛出异常，需要出错后继续执行时按需使用：
+
+        with log_errors('click'):
+            region.click('button.png')
+
+    Args:
+        name: 日志中显示的操作名称
+    """
+    try:
+        yield
+    except Exception as e:
+        logger.error(f'{name} 操作失败: {e}')
+
+
+_EXIT_HOTKEYS: set[str] = set()
+_EXIT_HOTKEYS_LOCK = threading.Lock()
 
 
 def reg_exit_listener(hotkey: str = '<shift>+<alt>+c'):
-    """注册按键退出监听器。
+    """注册按键退出监听器，同一快捷键重复注册时不会再启动监听线程。
 
     Args:
         hotkey: 要监听的退出程序快捷键
     """
+    from pynput import keyboard
+
+    with _EXIT_HOTKEYS_LOCK:
+        if hotkey in _EXIT_HOTKEYS:
+            return
+        _EXIT_HOTKEYS.add(hotkey)
 
     def on_activate():
         logger.info(f'按下 {hotkey} 退出按键，正在强制退出...')
+        # 先断开网关连接，再强制退出
+        if _G_SKL_CLI is not None:
+            with contextlib.suppress(Exception):
+                _G_SKL_CLI.gateway.close()
         os._exit(0)
 
     def run_listener():
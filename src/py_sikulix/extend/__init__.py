@@ -1,4 +1,5 @@
 from py_sikulix.extend.finder import CrossPlatformFinder
+from py_sikulix.extend.points import LocationArray
 
 # 公共 API
-__all__ = ['CrossPlatformFinder']
+__all__ = ['CrossPlatformFinder', 'LocationArray']
@@ -1,37 +1,162 @@
-import time
-from collections.abc import Sequence
+import functools
+import os
+from collections.abc import Callable, Sequence
+from typing import Any
 
 try:
     import cv2
     import mss
     import numpy as np
-    from numba import njit
 except ImportError:
     raise ImportError(
         'please install dependencies using the commands "pip install opencv-python mss numpy numba" before loading this script.'
     )
 
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    # 未安装 numba 时使用 NumPy 向量化实现 _numpy_kernel
+    HAS_NUMBA = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[[Any], Any]:  # type: ignore[no-redef]
+        return lambda func: func
+
+    prange = range  # type: ignore[misc]
+
 
 # =============================================================
 # 多点找色核心算法：跨平台机器码加速
 # =============================================================
-@njit(fastmath=True, nogil=True)
+# 颜色偏差归一化系数，765 = FF * 3，用乘法代替逐点除法；numba 将全局变量作为编译期常量
+_INV_765 = 1.0 / 765.0
+
+
+def _offset_bounds(offsets: np.ndarray) -> np.ndarray:
+    """
+    计算偏移点坐标边界，主点 (0, 0) 计入边界，随颜色配置缓存后不必在每次匹配时重复计算
+
+    Args:
+        offsets: (N, 2) int16 偏移点坐标数组
+
+    Returns:
+        [最小偏移X, 最小偏移Y, 最大偏移X, 最大偏移Y] int64 数组
+    """
+    return np.concatenate((np.minimum(offsets.min(axis=0), 0), np.maximum(offsets.max(axis=0), 0))).astype(np.int64)
+
+
+@njit(fastmath=True, nogil=True, boundscheck=False, cache=True, inline='always')
+def _match_score(
+    image: np.ndarray,
+    main_y: int,
+    main_x: int,
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    biases: np.ndarray,
+    min_similarity_score: float,
+) -> float:
+    """
+    计算单个主点的相似度（基于匹配比例）。
+
+    Args:
+        image: 原始图像 (H, W, 4) BGRA格式
+        main_y: 主点y坐标
+        main_x: 主点x坐标
+        offsets: (N, 2) int16 偏移点坐标，同 _numba_kernel
+        targets: (N, 3) uint8 偏移点目标BGR，同 _numba_kernel
+        biases: (N, 3) uint8 偏移点偏色BGR，同 _numba_kernel
+        min_similarity_score: 达标所需的最低匹配分数，用于提前退出
+
+    Returns:
+        相似度 (0.0-1.0)，提前退出时为未达标的部分分数
+    """
+    h, w = image.shape[:2]
+    len_sub_colors = len(offsets)
+    match_score_sum = 1.0  # 主点总是记为100%匹配（通过初筛），缺点是主点不会考虑色彩偏离
+    for sub_i in range(len_sub_colors):
+        sub_x, sub_y = main_x + offsets[sub_i, 0], main_y + offsets[sub_i, 1]
+
+        # 边界检查，像素点超出边界直接放弃匹配
+        if 0 <= sub_x < w and 0 <= sub_y < h:
+            # uint8 相减会按无符号回绕，先提升为 int16 再求差
+            scol_b, scol_g, scol_r = np.int16(targets[sub_i, 0]), np.int16(targets[sub_i, 1]), np.int16(targets[sub_i, 2])
+            bias_b, bias_g, bias_r = np.int16(biases[sub_i, 0]), np.int16(biases[sub_i, 1]), np.int16(biases[sub_i, 2])
+            image_b = np.int16(image[sub_y, sub_x, 0])  # B
+            image_g = np.int16(image[sub_y, sub_x, 1])  # G
+            image_r = np.int16(image[sub_y, sub_x, 2])  # R
+
+            # 检查是否匹配
+            abs_b = abs(image_b - scol_b)
+            abs_g = abs(image_g - scol_g)
+            abs_r = abs(image_r - scol_r)
+            if abs_b <= bias_b and abs_g <= bias_g and abs_r <= bias_r:
+                match_score_sum += 1.0 - (abs_b + abs_g + abs_r) * _INV_765
+        # 匹配值不达标的情况提前退出内层循环，相似度要求越低匹配循环次数越多
+        if match_score_sum + (len_sub_colors - sub_i - 1) < min_similarity_score:
+            break
+    return match_score_sum / (len_sub_colors + 1)
+
+
+@njit(parallel=True, fastmath=True, nogil=True, boundscheck=False, cache=True)
+def _score_block(
+    y_cands: np.ndarray,
+    x_cands: np.ndarray,
+    image: np.ndarray,
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    biases: np.ndarray,
+    min_similarity_score: float,
+    block_start: int,
+    similarities: np.ndarray,
+) -> None:
+    """
+    多线程并行计算一块候选点的相似度，结果写入 similarities[:块长度]。
+
+    Args:
+        y_cands: 候选点y坐标数组
+        x_cands: 候选点x坐标数组
+        image: 原始图像 (H, W, 4) BGRA格式
+        offsets, targets, biases: 偏移点配置，同 _numba_kernel
+        min_similarity_score: 达标所需的最低匹配分数，用于提前退出
+        block_start: 本块第一个候选点的下标
+        similarities: 输出数组，长度即本块候选点数量
+    """
+    for block_i in prange(len(similarities)):
+        main_i = block_start + block_i
+        similarities[block_i] = _match_score(
+            image, y_cands[main_i], x_cands[main_i], offsets, targets, biases, min_similarity_score
+        )
+
+
+@njit(fastmath=True, nogil=True, cache=True)
 def _numba_kernel(
     y_cands: np.ndarray,
     x_cands: np.ndarray,
     image: np.ndarray,
-    sub_colors: np.ndarray,
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    biases: np.ndarray,
     similarity_threshold: float,
+    offset_bounds: np.ndarray,
+    block_size: int = 4096,
 ) -> tuple[int, int, int, int, float, int, int, int] | None:
     """
     Numba优化的核心匹配算法（基于匹配比例），首次加载大约需要1s随后即可正常加速搜索
 
+    候选点按块交给 _score_block 多线程并行计算相似度，每块计算完成后按候选点顺序取第一个达标点，
+    结果与逐点串行匹配一致，找到目标后不再计算后续块。
+
     Args:
         y_cands: 候选点y坐标数组
         x_cands: 候选点x坐标数组
         image: 原始图像 (H, W, 4) BGRA格式
-        sub_colors: (N, 8) int32 数组，包含偏移和颜色信息 [偏移X, 偏移Y, 目标B, 目标G, 目标R, 偏离B, 偏离G, 偏离R]
+        offsets: (N, 2) int16 偏移点坐标 [偏移X, 偏移Y]
+        targets: (N, 3) uint8 偏移点目标颜色 [目标B, 目标G, 目标R]
+        biases: (N, 3) uint8 偏移点偏色范围 [偏离B, 偏离G, 偏离R]
         similarity_threshold: 相似度阈值 (0.0-1.0)
+        offset_bounds: 偏移点坐标边界 [最小偏移X, 最小偏移Y, 最大偏移X, 最大偏移Y]，见 _offset_bounds
+        block_size: 每块并行计算的候选点数量
 
     Returns:
         匹配结果数组 [x, y, similarity, r, g, b] 或 None
@@ -39,77 +164,313 @@ def _numba_kernel(
         similarity: 匹配比例 (0.0-1.0)
         r, g, b: 匹配点的RGB颜色值 (BGR格式)
     """
-    h, w = image.shape[:2]
     num_cands = len(y_cands)
 
-    len_sub_colors = len(sub_colors)
-    total_points = len_sub_colors + 1
-    min_similarity_score = total_points * similarity_threshold
-    max_offset_x = 0
-    min_offset_x = 0
-    max_offset_y = 0
-    min_offset_y = 0
-    for main_i in range(num_cands):
-        main_y, main_x = y_cands[main_i], x_cands[main_i]
-        match_score_sum = 1.0  # 主点总是记为100%匹配（通过初筛），缺点是主点不会考虑色彩偏离
-        for sub_i in range(len_sub_colors):
-            offset_x, offset_y = sub_colors[sub_i, 0], sub_colors[sub_i, 1]
-            sub_x, sub_y = main_x + offset_x, main_y + offset_y
-            # 更新坐标边界值
-            max_offset_x = max(max_offset_x, offset_x)
-            min_offset_x = min(min_offset_x, offset_x)
-            max_offset_y = max(max_offset_y, offset_y)
-            min_offset_y = min(min_offset_y, offset_y)
-
-            # 边界检查，像素点超出边界直接放弃匹配
-            if 0 <= sub_x < w and 0 <= sub_y < h:
-                scol_b, scol_g, scol_r = sub_colors[sub_i, 2], sub_colors[sub_i, 3], sub_colors[sub_i, 4]
-                bias_b, bias_g, bias_r = sub_colors[sub_i, 5], sub_colors[sub_i, 6], sub_colors[sub_i, 7]
-                image_b = image[sub_y, sub_x, 0]  # B
-                image_g = image[sub_y, sub_x, 1]  # G
-                image_r = image[sub_y, sub_x, 2]  # R
-
-                # 检查是否匹配
-                abs_b = abs(image_b - scol_b)
-                abs_g = abs(image_g - scol_g)
-                abs_r = abs(image_r - scol_r)
-                if abs_b <= bias_b and abs_g <= bias_g and abs_r <= bias_r:
-                    match_score_sum += 1.0 - (abs_b + abs_g + abs_r) / 765  # 765 = FF * 3
-            # 匹配值不达标的情况提前退出内层循环，相似度要求越低匹配循环次数越多
-            if match_score_sum + (len_sub_colors - sub_i - 1) < min_similarity_score:
+    min_similarity_score = (len(offsets) + 1) * similarity_threshold
+    min_offset_x, min_offset_y, max_offset_x, max_offset_y = offset_bounds[0], offset_bounds[1], offset_bounds[2], offset_bounds[3]
+
+    similarities = np.empty(min(block_size, num_cands), np.float64)
+    for block_start in range(0, num_cands, block_size):
+        block_len = min(block_size, num_cands - block_start)
+        _score_block(
+            y_cands, x_cands, image, offsets, targets, biases, min_similarity_score, block_start, similarities[:block_len]
+        )
+
+        # 按候选点顺序取本块第一个达标点
+        for block_i in range(block_len):
+            similarity = similarities[block_i]
+            if similarity < similarity_threshold:
+                continue
+            main_i = block_start + block_i
+            main_y, main_x = y_cands[main_i], x_cands[main_i]
+            # 基于匹配比例计算相似度
+            # 返回主点x, 主点y, 匹配目标宽度, 匹配目标高度, 相似度, RGB颜色10进制值(BGR转RGB)
+            return (
+                main_x + min_offset_x,  # 主点x
+                main_y + min_offset_y,  # 主点y
+                max_offset_x - min_offset_x,  # 匹配目标宽度
+                max_offset_y - min_offset_y,  # 匹配目标高度
+                similarity,  # 相似度
+                image[main_y, main_x, 2],  # 十进制R
+                image[main_y, main_x, 1],  # 十进制G
+                image[main_y, main_x, 0],  # 十进制B
+            )
+
+    return None
+
+
+@njit(parallel=True, fastmath=True, nogil=True, boundscheck=False, cache=True)
+def _scan_rows(
+    image: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    biases: np.ndarray,
+    similarity_threshold: float,
+    row_start: int,
+    row_x: np.ndarray,
+    row_similarity: np.ndarray,
+) -> None:
+    """
+    多线程并行扫描若干行，每行内主色初筛与偏移点匹配一次完成，记录每行第一个达标点。
+
+    Args:
+        image: 原始图像 (H, W, 4) BGRA格式
+        lower: 主色下限BGRA，只使用前三个分量
+        upper: 主色上限BGRA，只使用前三个分量
+        offsets, targets, biases: 偏移点配置，同 _numba_kernel
+        similarity_threshold: 相似度阈值 (0.0-1.0)
+        row_start: 本块第一行的y坐标
+        row_x: 输出数组，每行第一个达标点的x坐标，未找到为 -1，长度即本块行数
+        row_similarity: 输出数组，每行第一个达标点的相似度
+    """
+    w = image.shape[1]
+    min_similarity_score = (len(offsets) + 1) * similarity_threshold
+    lower_b, lower_g, lower_r = lower[0], lower[1], lower[2]
+    upper_b, upper_g, upper_r = upper[0], upper[1], upper[2]
+    for row_i in prange(len(row_x)):
+        main_y = row_start + row_i
+        row_x[row_i] = -1
+        for main_x in range(w):
+            # 主色初筛，等同 cv2.inRange
+            b, g, r = image[main_y, main_x, 0], image[main_y, main_x, 1], image[main_y, main_x, 2]
+            if b < lower_b or b > upper_b or g < lower_g or g > upper_g or r < lower_r or r > upper_r:
+                continue
+            similarity = _match_score(image, main_y, main_x, offsets, targets, biases, min_similarity_score)
+            if similarity >= similarity_threshold:
+                row_x[row_i] = main_x
+                row_similarity[row_i] = similarity
                 break
-        similarity = match_score_sum / total_points
-        if similarity < similarity_threshold:
+
+
+@njit(fastmath=True, nogil=True, cache=True)
+def _fused_kernel(
+    image: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    biases: np.ndarray,
+    similarity_threshold: float,
+    offset_bounds: np.ndarray,
+    block_rows: int = 64,
+) -> tuple[int, int, int, int, float, int, int, int] | None:
+    """
+    主色初筛与偏移点匹配融合的核心匹配算法，整帧只读取一遍，不生成掩码与候选点数组。
+
+    按行分块交给 _scan_rows 并行扫描，取最靠上一行的第一个达标点，结果与 _numba_kernel 一致。
+
+    Args:
+        image: 原始图像 (H, W, 4) BGRA格式
+        lower: 主色下限BGRA，只使用前三个分量
+        upper: 主色上限BGRA，只使用前三个分量
+        offsets, targets, biases: 偏移点配置，同 _numba_kernel
+        similarity_threshold: 相似度阈值 (0.0-1.0)
+        offset_bounds: 偏移点坐标边界，见 _offset_bounds
+        block_rows: 每块并行扫描的行数
+
+    Returns:
+        同 _numba_kernel
+    """
+    h = image.shape[0]
+    min_offset_x, min_offset_y, max_offset_x, max_offset_y = offset_bounds[0], offset_bounds[1], offset_bounds[2], offset_bounds[3]
+
+    row_x = np.empty(min(block_rows, h), np.int64)
+    row_similarity = np.empty(min(block_rows, h), np.float64)
+    for row_start in range(0, h, block_rows):
+        rows = min(block_rows, h - row_start)
+        _scan_rows(
+            image, lower, upper, offsets, targets, biases, similarity_threshold, row_start, row_x[:rows], row_similarity[:rows]
+        )
+        for row_i in range(rows):
+            main_x = row_x[row_i]
+            if main_x < 0:
+                continue
+            main_y = row_start + row_i
+            return (
+                main_x + min_offset_x,  # 主点x
+                main_y + min_offset_y,  # 主点y
+                max_offset_x - min_offset_x,  # 匹配目标宽度
+                max_offset_y - min_offset_y,  # 匹配目标高度
+                row_similarity[row_i],  # 相似度
+                image[main_y, main_x, 2],  # 十进制R
+                image[main_y, main_x, 1],  # 十进制G
+                image[main_y, main_x, 0],  # 十进制B
+            )
+
+    return None
+
+
+def _numpy_kernel(
+    y_cands: np.ndarray,
+    x_cands: np.ndarray,
+    image: np.ndarray,
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    biases: np.ndarray,
+    similarity_threshold: float,
+    offset_bounds: np.ndarray,
+    chunk_size: int = 65536,
+) -> tuple[int, int, int, int, float, int, int, int] | None:
+    """
+    NumPy 向量化的核心匹配算法，未安装 numba 时使用，参数与返回值同 _numba_kernel。
+
+    候选点分块批量取色比较，(块大小, 偏移点数, 3) 的临时数组限制在数十 MB 以内。
+    """
+    h, w = image.shape[:2]
+    offset_x = offsets[:, 0]
+    offset_y = offsets[:, 1]
+    target = targets.astype(np.int16)
+    bias = biases.astype(np.int16)
+    total_points = len(offsets) + 1
+    min_offset_x, min_offset_y, max_offset_x, max_offset_y = (int(v) for v in offset_bounds)
+
+    for start in range(0, len(y_cands), chunk_size):
+        main_y = y_cands[start : start + chunk_size]
+        main_x = x_cands[start : start + chunk_size]
+        sub_y = main_y[:, None] + offset_y[None, :]
+        sub_x = main_x[:, None] + offset_x[None, :]
+        # 边界外的偏移点按不匹配处理，取色前先截断到图像范围内
+        valid = (sub_x >= 0) & (sub_x < w) & (sub_y >= 0) & (sub_y < h)
+        pixels = image[np.clip(sub_y, 0, h - 1), np.clip(sub_x, 0, w - 1), :3].astype(np.int16)
+        abs_diff = np.abs(pixels - target[None, :, :])
+        hit = valid & np.all(abs_diff <= bias[None, :, :], axis=-1)
+        scores = 1.0 + np.where(hit, 1.0 - abs_diff.sum(axis=-1) * _INV_765, 0.0).sum(axis=1)
+        passed = np.flatnonzero(scores / total_points >= similarity_threshold)
+        if len(passed) == 0:
             continue
-        # 基于匹配比例计算相似度
-        # 返回主点x, 主点y, 匹配目标宽度, 匹配目标高度, 相似度, RGB颜色10进制值(BGR转RGB)
+        i = passed[0]
+        mx, my = int(main_x[i]), int(main_y[i])
         return (
-            main_x + min_offset_x,  # 主点x
-            main_y + min_offset_y,  # 主点y
-            max_offset_x - min_offset_x,  # 匹配目标宽度
-            max_offset_y - min_offset_y,  # 匹配目标高度
-            similarity,  # 相似度
-            image[main_y, main_x, 2],  # 十进制R
-            image[main_y, main_x, 1],  # 十进制G
-            image[main_y, main_x, 0],  # 十进制B
+            mx + min_offset_x,
+            my + min_offset_y,
+            max_offset_x - min_offset_x,
+            max_offset_y - min_offset_y,
+            float(scores[i] / total_points),
+            int(image[my, mx, 2]),
+            int(image[my, mx, 1]),
+            int(image[my, mx, 0]),
         )
 
     return None
 
 
+def _selectivity_order(image: np.ndarray, targets: np.ndarray, biases: np.ndarray, step: int = 16) -> np.ndarray:
+    """
+    按偏移点颜色在图像中的命中率从低到高排序，最难命中的偏移点先比较，非目标候选点能更早提前退出。
+
+    只在间隔 step 的采样像素上统计，顺序只影响匹配速度，不影响匹配结果。
+
+    Args:
+        image: 原始图像 (H, W, 4) BGRA格式
+        targets: (N, 3) uint8 偏移点目标BGR
+        biases: (N, 3) uint8 偏移点偏色BGR
+        step: 采样间隔像素数
+
+    Returns:
+        偏移点下标数组，按命中率升序
+    """
+    pixels = image[::step, ::step, :3].reshape(-1, 1, 3).astype(np.int16)
+    hit = np.all(np.abs(pixels - targets.astype(np.int16)) <= biases, axis=-1)
+    return np.argsort(np.count_nonzero(hit, axis=0), kind='stable')
+
+
+@functools.lru_cache(maxsize=64)
+def _load_template(path: str, mtime_ns: int) -> np.ndarray:
+    """
+    读取模板图像为 BGR 数组，按路径和修改时间缓存，轮询同一模板时不再重复解码，文件被改写后自动重新读取。
+
+    Args:
+        path: 图像文件的绝对路径
+        mtime_ns: 文件修改时间，只作为缓存键
+
+    Returns:
+        只读的 BGR 图像数组
+    """
+    template = cv2.imread(path, cv2.IMREAD_COLOR)
+    if template is None:
+        raise FileNotFoundError(f'cannot read template image: {path}')
+    template.flags.writeable = False
+    return template
+
+
+def _as_template(template: str | os.PathLike | np.ndarray) -> np.ndarray:
+    """
+    将模板统一为 BGR 图像数组：路径按缓存读取，BGRA 数组去掉透明通道。
+
+    Args:
+        template: 模板图像路径或 BGR/BGRA 图像数组
+
+    Returns:
+        BGR 图像数组
+    """
+    if not isinstance(template, np.ndarray):
+        path = os.path.abspath(template)
+        return _load_template(path, os.stat(path).st_mtime_ns)
+    if template.ndim == 3 and template.shape[2] == 4:
+        return cv2.cvtColor(template, cv2.COLOR_BGRA2BGR)
+    return template
+
+
+def _score_peaks(scores: np.ndarray, w: int, h: int, similarity: float, max_count: int) -> list[tuple[int, int, float]]:
+    """
+    从模板匹配得分图中按相似度从高到低取出互不重叠的匹配位置，会修改 scores。
+
+    每取出一个峰值，就把其周围半个模板大小的得分清除，避免同一目标附近的相邻像素被重复计为匹配。
+
+    Args:
+        scores: matchTemplate 输出的得分图
+        w: 模板宽度
+        h: 模板高度
+        similarity: 相似度阈值
+        max_count: 最多返回的匹配数
+
+    Returns:
+        [(左上角x, 左上角y, 相似度), ...]
+    """
+    peaks: list[tuple[int, int, float]] = []
+    while len(peaks) < max_count:
+        _, score, _, (x, y) = cv2.minMaxLoc(scores)
+        if score < similarity:
+            break
+        peaks.append((x, y, float(score)))
+        scores[max(0, y - h // 2) : y + h // 2 + 1, max(0, x - w // 2) : x + w // 2 + 1] = -1.0
+    return peaks
+
+
 class CrossPlatformFinder:
-    def __init__(self, screen_id: int = 0):
+    def __init__(self, screen_id: int = 0, use_cuda: bool = False):
         """
         初始化跨平台找色器，2560*1440分辨率下单次400个点约100ms
 
         Args:
             screen_id: 显示器编号，0为使用默认显示器，1为使用第1个显示器，2为使用第2个显示器，以此类推
+            use_cuda: 是否使用 CUDA 计算主色掩码与模板匹配得分，需要带 CUDA 支持的 OpenCV 且存在可用显卡，否则自动使用 CPU。
+                截图需要先上传到显存，只有高分辨率截图且 CPU 较弱时才值得开启
         """
         self.screen = mss.mss()
-        self.width = self.screen.monitors[screen_id]['width']
-        self.height = self.screen.monitors[screen_id]['height']
-
-    def _rgb_to_bgr(self, hex_str: str) -> list[int]:
+        # 显示器在虚拟桌面中的范围，多显示器时左上角可能不在 (0, 0)，位于主显示器左侧或上方时为负数
+        monitor = self.screen.monitors[screen_id]
+        self.left, self.top = monitor['left'], monitor['top']
+        self.width, self.height = monitor['width'], monitor['height']
+        # 复用的显存缓冲区，尺寸不变时 upload 不会重新分配
+        self._gpu_frame = cv2.cuda_GpuMat() if use_cuda and self._has_cuda() else None  # type: ignore
+        # CUDA 模板匹配器，首次使用时创建
+        self._gpu_matcher: Any | None = None
+        # 颜色字符串 -> 按命中率重排后的 (偏移点坐标, 目标BGR, 偏色BGR)，首次匹配时按当时的截图统计
+        self._ordered_colors: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    @staticmethod
+    def _has_cuda() -> bool:
+        """OpenCV 是否带 CUDA 支持且存在可用显卡。"""
+        try:
+            return cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except (AttributeError, cv2.error):
+            return False
+
+    @staticmethod
+    def _rgb_to_bgr(hex_str: str) -> list[int]:
         """
         将十六进制RGB颜色转换为BGR顺序 (MSS默认格式)
 
@@ -119,9 +480,12 @@ class CrossPlatformFinder:
         Returns:
             BGR颜色值 [B, G, R]
         """
-        return [int(hex_str[4:6], 16), int(hex_str[2:4], 16), int(hex_str[0:2], 16)]
+        # 整体解析一次再移位取各分量，比逐段切片解析少两次 int 调用
+        value = int(hex_str, 16)
+        return [value & 0xFF, (value >> 8) & 0xFF, (value >> 16) & 0xFF]
 
-    def _parse_config(self, color_str: str) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    @staticmethod
+    def _parse_config(color_str: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
         """
         解析颜色字符串，生成匹配配置
 
@@ -131,7 +495,7 @@ class CrossPlatformFinder:
             例如: "fafbfb|080808,-3|21|f9fafa|080808,-3|21|f9fafa, ..."
 
         Returns:
-            (主色BGR, 主色偏色BGR, 偏移点配置数组)
+            (主色BGR, 主色偏色BGR, 偏移点坐标 int16 (N, 2), 偏移点目标BGR uint8 (N, 3), 偏移点偏色BGR uint8 (N, 3))
         """
         colors_list = color_str.split(',')
         if not colors_list:
@@ -139,11 +503,11 @@ class CrossPlatformFinder:
 
         # 解析首点 (主点)
         main_part = colors_list[0].split('|')
-        main_bgr = self._rgb_to_bgr(main_part[0])
-        main_bias = self._rgb_to_bgr(main_part[1]) if len(main_part) > 1 else [0, 0, 0]
+        main_bgr = CrossPlatformFinder._rgb_to_bgr(main_part[0])
+        main_bias = CrossPlatformFinder._rgb_to_bgr(main_part[1]) if len(main_part) > 1 else [0, 0, 0]
 
         # 解析偏移点
-        sub_colors = []
+        offsets, targets, biases = [], [], []
         for sub_color_str in colors_list[1:]:
             sub_color_parts = sub_color_str.split('|')
             if len(sub_color_parts) < 2:
@@ -160,18 +524,208 @@ class CrossPlatformFinder:
             color_val = sub_color_parts[2]
             if len(color_val) != 6:
                 continue
-            sub_bgr = self._rgb_to_bgr(color_val)
+            sub_bgr = CrossPlatformFinder._rgb_to_bgr(color_val)
 
             # 处理偏色范围
             sub_bias = [0, 0, 0]
             if len(sub_color_parts) >= 4:
                 bias_val = sub_color_parts[3]
                 if len(bias_val) == 6:
-                    sub_bias = self._rgb_to_bgr(bias_val)
+                    sub_bias = CrossPlatformFinder._rgb_to_bgr(bias_val)
+
+            offsets.append([offset_x, offset_y])
+            targets.append(sub_bgr)
+            biases.append(sub_bias)
+
+        # 按字段拆分并使用最小的数据类型，减少内核读取的字节数
+        return (
+            np.array(main_bgr),
+            np.array(main_bias),
+            np.array(offsets, dtype=np.int16).reshape(-1, 2),
+            np.array(targets, dtype=np.uint8).reshape(-1, 3),
+            np.array(biases, dtype=np.uint8).reshape(-1, 3),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_config(color_str: str) -> tuple[np.ndarray, ...] | None:
+        """
+        解析颜色字符串并预先算好主色上下限，结果按颜色字符串缓存，重复找同一目标时不再重复解析
 
-            sub_colors.append([offset_x, offset_y, *sub_bgr, *sub_bias])
+        Args:
+            color_str: 颜色字符串，格式同 _parse_config
+
+        Returns:
+            (主色下限BGRA, 主色上限BGRA, 偏移点坐标, 偏移点目标BGR, 偏移点偏色BGR, 偏移点坐标边界)，
+            数组只读，偏移点为空时返回 None
+        """
+        colors = CrossPlatformFinder._parse_config(color_str)
+        if not colors or len(colors[2]) == 0:
+            return None
+        main_bgr, main_bias, offsets, targets, biases = colors
+        # 补上不参与比较的 Alpha 通道 (0-255)，inRange 可直接处理连续的整帧 BGRA 数据
+        lower = np.append(np.clip(main_bgr - main_bias, 0, 255), 0).astype(np.uint8)
+        upper = np.append(np.clip(main_bgr + main_bias, 0, 255), 255).astype(np.uint8)
+        offset_bounds = _offset_bounds(offsets)
+        for arr in (lower, upper, offsets, targets, biases, offset_bounds):
+            arr.flags.writeable = False
+        return lower, upper, offsets, targets, biases, offset_bounds
+
+    def _clip_region(self, region: Sequence[int] | None) -> tuple[int, int, int, int]:
+        """
+        将搜索区域截取到显示器范围 [left, left + width) × [top, top + height) 内，坐标为虚拟桌面坐标。
+
+        Args:
+            region: (左上角横坐标, 左上角纵坐标, 宽度, 高度)，只给出左上角时延伸到显示器右下角，None 为整个显示器
+
+        Returns:
+            (左上角横坐标, 左上角纵坐标, 宽度, 高度)
+        """
+        right, bottom = self.left + self.width, self.top + self.height
+        if not region:
+            left, top, width, height = (self.left, self.top, self.width, self.height)
+        elif len(region) >= 4:
+            left, top, width, height = region[:4]
+        elif len(region) >= 2:
+            left, top = region[:2]
+            width = right - left
+            height = bottom - top
+        else:
+            raise ValueError(f'invalid region, must contain more than two values. current region: {region}')
+        # 超出显示器的部分截掉，只截取真正需要搜索的像素，截图与扫描开销都与区域面积成正比
+        # 左上角在显示器外时移到显示器边缘，宽高扣除显示器外的部分
+        if left < self.left:
+            left, width = self.left, width - (self.left - left)
+        if top < self.top:
+            top, height = self.top, height - (self.top - top)
+        width = min(width, right - left)
+        height = min(height, bottom - top)
+        if width <= 0 or height <= 0:
+            raise ValueError(f'invalid region, outside the screen or empty. current region: {region}')
+        return left, top, width, height
+
+    def _grab(self, left: int, top: int, width: int, height: int) -> np.ndarray:
+        """
+        截取屏幕区域，直接包装 mss 的原始缓冲区，不复制整帧。
 
-        return np.array(main_bgr), np.array(main_bias), np.array(sub_colors, dtype=np.int32)
+        Returns:
+            只读的 BGRA 图像数组，形状 (H, W, 4)
+        """
+        scr_img = self.screen.grab({'left': left, 'top': top, 'width': width, 'height': height})
+        frame = np.frombuffer(scr_img.raw, dtype=np.uint8).reshape(scr_img.height, scr_img.width, 4)
+        frame.flags.writeable = False
+        return frame
+
+    def grab(self, region: Sequence[int] | None = None) -> np.ndarray:
+        """
+        截取屏幕区域，超出屏幕的部分会被截掉。
+
+        Args:
+            region: 截图区域，格式为(左上角横坐标, 左上角纵坐标, 宽度, 高度)，None 为全屏
+
+        Returns:
+            只读的 BGRA 图像数组，形状 (H, W, 4)
+        """
+        return self._grab(*self._clip_region(region))
+
+    @staticmethod
+    def match_templates(
+        frame: np.ndarray,
+        templates: Sequence[str | os.PathLike | np.ndarray],
+        similarity: float = 0.7,
+        max_count: int = 100,
+    ) -> list[list[tuple[tuple[int, int, int, int], float]]]:
+        """
+        在已有的截图中查找多个模板图像，不重新截图。
+
+        可配合 Screen.capture_array() 对同一张截图多次查找，坐标相对于截图左上角。
+
+        Args:
+            frame: BGRA 或 BGR 截图
+            templates: 模板图像路径或 BGR/BGRA 图像数组列表
+            similarity: 相似度阈值 (0.0-1.0)
+            max_count: 每个模板最多返回的匹配数
+
+        Returns:
+            与 templates 一一对应的列表，每项为按相似度从高到低排列的 [((x, y, w, h), 相似度), ...]
+        """
+        if frame.ndim == 3 and frame.shape[2] == 4:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+
+        results: list[list[tuple[tuple[int, int, int, int], float]]] = []
+        for template in templates:
+            template = _as_template(template)
+            h, w = template.shape[:2]
+            if h > frame.shape[0] or w > frame.shape[1]:
+                results.append([])
+                continue
+            scores = cv2.matchTemplate(frame, template, cv2.TM_CCOEFF_NORMED)
+            results.append([((x, y, w, h), score) for x, y, score in _score_peaks(scores, w, h, similarity, max_count)])
+        return results
+
+    def _match_templates_cuda(
+        self,
+        frame: np.ndarray,
+        templates: Sequence[str | os.PathLike | np.ndarray],
+        similarity: float,
+        max_count: int,
+    ) -> list[list[tuple[tuple[int, int, int, int], float]]]:
+        """
+        在显卡上计算模板匹配得分图，截图只上传一次，取峰值仍在 CPU 上完成。
+
+        截图转换为 BGR 后上传，截图的透明通道并不总是常量，不能参与计算。
+        """
+        # 只在 use_cuda 生效时由 find_templates 调用，此时显存缓冲区已创建
+        gpu_frame, matcher = self._gpu_frame, self._gpu_matcher
+        assert gpu_frame is not None
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        gpu_frame.upload(frame)
+        if matcher is None:
+            matcher = cv2.cuda.createTemplateMatching(cv2.CV_8UC3, cv2.TM_CCOEFF_NORMED)  # type: ignore
+            self._gpu_matcher = matcher
+        gpu_template = cv2.cuda_GpuMat()  # type: ignore
+
+        results: list[list[tuple[tuple[int, int, int, int], float]]] = []
+        for template in templates:
+            template = _as_template(template)
+            h, w = template.shape[:2]
+            if h > frame.shape[0] or w > frame.shape[1]:
+                results.append([])
+                continue
+            gpu_template.upload(template)
+            scores = matcher.match(gpu_frame, gpu_template).download()
+            results.append([((x, y, w, h), score) for x, y, score in _score_peaks(scores, w, h, similarity, max_count)])
+        return results
+
+    def find_templates(
+        self,
+        templates: Sequence[str | os.PathLike | np.ndarray],
+        similarity: float = 0.7,
+        region: Sequence[int] | None = None,
+        max_count: int = 100,
+    ) -> list[list[tuple[tuple[int, int, int, int], float]]]:
+        """
+        在指定区域内查找多个模板图像，所有模板共用一次截图。
+
+        使用 OpenCV 归一化相关系数匹配（TM_CCOEFF_NORMED），与 SikuliX 的查找方式相同；
+        逐个模板调用 SikuliX 查找时每次都要重新截图，这里截图和颜色转换只做一次。
+
+        Args:
+            templates: 模板图像路径或 BGR/BGRA 图像数组列表
+            similarity: 相似度阈值 (0.0-1.0)
+            region: 搜索区域，格式为(左上角横坐标, 左上角纵坐标, 宽度, 高度)
+            max_count: 每个模板最多返回的匹配数
+
+        Returns:
+            与 templates 一一对应的列表，每项为按相似度从高到低排列的 [((x, y, w, h), 相似度), ...]
+        """
+        left, top, width, height = self._clip_region(region)
+        frame = self._grab(left, top, width, height)
+        if self._gpu_frame is None:
+            results = self.match_templates(frame, templates, similarity, max_count)
+        else:
+            results = self._match_templates_cuda(frame, templates, similarity, max_count)
+        return [[((x + left, y + top, w, h), score) for (x, y, w, h), score in matches] for matches in results]
 
     def find_multi_color(
         self,
@@ -193,76 +747,50 @@ class CrossPlatformFinder:
             匹配结果 (最左上角x, 最左上角y, 相似度值) 或 None
         """
         # 1. 解析配置
-        colors = self._parse_config(color_str)
-        if not colors or len(colors[2]) == 0:
+        colors = self._compile_config(color_str)
+        if not colors:
             raise ValueError(
                 f'invalid color string or fewer than 2 colors. current color string: {color_str if len(color_str) < 30 else color_str[:30] + "..."}'
             )
-        main_bgr, main_bias, sub_colors = colors
-        if not region:
-            left, top, width, height = (0, 0, self.width, self.height)
-        elif len(region) >= 4:
-            left, top, width, height = region[:4]
-        elif len(region) >= 2:
-            left, top = region[:2]
-            width = self.width - left
-            height = self.height - top
-        else:
-            raise ValueError(f'invalid region, must contain more than two values. current region: {region}')
+        lower, upper, offsets, targets, biases, offset_bounds = colors
+        left, top, width, height = self._clip_region(region)
 
         # 2. 跨平台截图
-        scr_img = self.screen.grab({'left': left, 'top': top, 'width': width, 'height': height})
-        frame = np.array(scr_img)  # 形状 (H, W, 4), 顺序 BGRA
-
-        # 关键优化：使用OpenCV的inRange替代NumPy向量化操作
-        lower = np.clip(main_bgr - main_bias, 0, 255).astype(np.uint8)
-        upper = np.clip(main_bgr + main_bias, 0, 255).astype(np.uint8)
-        mask = cv2.inRange(frame[:, :, :3], lower, upper)
-        mask = mask > 0  # 转换为布尔数组
-        y_cands, x_cands = np.where(mask)
-
-        if len(y_cands) == 0:
-            return None
-
-        # 4. Numba核心匹配
-        ret = _numba_kernel(y_cands, x_cands, frame, sub_colors, similarity)
+        frame = self._grab(left, top, width, height)
+
+        ordered = self._ordered_colors.get(color_str)
+        if ordered is None:
+            order = _selectivity_order(frame, targets, biases)
+            ordered = (offsets[order], targets[order], biases[order])
+            if len(self._ordered_colors) >= 256:
+                self._ordered_colors.clear()
+            self._ordered_colors[color_str] = ordered
+        offsets, targets, biases = ordered
+
+        if HAS_NUMBA and self._gpu_frame is None:
+            # 3. 主色初筛与偏移点匹配融合为一次整帧扫描
+            ret = _fused_kernel(frame, lower, upper, offsets, targets, biases, similarity, offset_bounds)
+        else:
+            # 3. 使用OpenCV的inRange初筛，再匹配候选点
+            if self._gpu_frame is not None:
+                # 主色掩码在显卡上计算，只取回单通道掩码
+                self._gpu_frame.upload(frame)
+                mask = cv2.cuda.inRange(  # type: ignore
+                    self._gpu_frame, tuple(lower.tolist()), tuple(upper.tolist())
+                ).download()
+            else:
+                # 整帧连续传入，避免 [:, :, :3] 非连续视图走慢速路径
+                mask = cv2.inRange(frame, lower, upper)
+            # findNonZero 单次扫描直接返回 int32 的 (x, y)，按行优先顺序，与 np.where 一致
+            # OpenCV 4 返回形状 (N, 1, 2)，OpenCV 5 返回 (N, 2)，统一展开为 (N, 2)
+            pts = cv2.findNonZero(mask)
+            if pts is None:
+                return None
+            pts = pts.reshape(-1, 2)
+            kernel = _numba_kernel if HAS_NUMBA else _numpy_kernel
+            ret = kernel(pts[:, 1], pts[:, 0], frame, offsets, targets, biases, similarity, offset_bounds)
         if not ret:
             return None
         return (ret[0] + left, ret[1] + top, ret[2], ret[3]), ret[4]
 
 
-# =============================================================
-# 测试运行 (以 PowerToys 界面为例)
-# =============================================================
-if __name__ == '__main__':
-    finder = CrossPlatformFinder()
-
-    # 样例：寻找 PowerToys 主页的蓝色颜色选取器等
-    test_config = [
-        'fafbfb|030303,3|10|f8f9fb|030303,-11|12|6fb2db|030303,-10|8|fafbfb|030303,-4|15|b4cce0|030303,-1|1|f3f8fa|030303',
-        'f9fafb|030303,-9|10|7885e2|030303,-3|25|5e41c9|030303,-4|11|5950d9|030303,-1|10|5750d9|030303,-11|31|e4ddf6|030303,9|14|38cfdb|030303',
-    ]
-
-    print('跨平台找色引擎已启动 (mss + numba + OpenCV) - 修正版')
-    print('相似度计算: 基于匹配比例 (与原始方法一致)')
-    import random
-
-    # 预热编译
-    finder.find_multi_color(test_config[0], 0.7)
-
-    times = []
-    for _ in range(50):
-        t_index = random.randint(0, len(test_config) - 1)
-        start_t = time.time()
-        result = finder.find_multi_color(test_config[t_index], 0.7)
-        end_t = time.time()
-
-        if result:
-            print(
-                f'找到第{t_index}个目标！坐标:{result[0][0]},{result[0][1]} 宽度:{result[0][2]} 高度:{result[0][3]} 相似度:{result[1]:.2f} 耗时:{(end_t - start_t) * 1000:.2f}ms'
-            )
-        else:
-            print(f'未找到，耗时:{(end_t - start_t) * 1000:.2f}ms')
-        times.append((end_t - start_t) * 1000)
-
-    print(f'平均耗时: {sum(times) / len(times):.2f}ms')
@@ -0,0 +1,182 @@
+"""LocationArray 类 - 批量坐标点运算。"""
+
+import operator
+from collections.abc import Iterable, Iterator
+from typing import Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError('please install dependencies using the commands "pip install numpy" before loading this script.')
+
+from py_sikulix.client import get_cli
+from py_sikulix.location import Location
+
+
+class LocationArray:
+    """
+    批量坐标点，坐标保存在 (N, 2) int32 数组中。
+
+    偏移等运算在 Python 端向量化完成，不经过网关；只有取出单个 Location 时才创建 Java 对象。
+    适合网格、滑动轨迹等需要批量变换坐标的场景。
+    """
+
+    __slots__ = ('_xy',)
+
+    def __init__(self, points: Union[np.ndarray, Iterable[tuple[int, int]]]):
+        """
+        创建 LocationArray 对象。
+
+        Args:
+            points: (N, 2) 坐标数组或 (x, y) 序列
+        """
+        xy = np.array(points, dtype=np.int32).reshape(-1, 2)
+        xy.flags.writeable = False
+        self._xy = xy
+
+    @classmethod
+    def from_locations(cls, locations: Iterable[Location]) -> 'LocationArray':
+        """
+        由 Location 对象创建，坐标已缓存的 Location 不再访问 Java。
+
+        Args:
+            locations: Location 对象序列
+
+        Returns:
+            新的 LocationArray 对象
+        """
+        return cls([(loc.x, loc.y) for loc in locations])
+
+    @classmethod
+    def grid(cls, x: int, y: int, cols: int, rows: int, dx: int, dy: int) -> 'LocationArray':
+        """
+        生成按行排列的网格坐标点。
+
+        Args:
+            x: 左上角第一个点的 X 坐标
+            y: 左上角第一个点的 Y 坐标
+            cols: 列数
+            rows: 行数
+            dx: 列间距
+            dy: 行间距
+
+        Returns:
+            新的 LocationArray 对象，共 cols * rows 个点
+        """
+        gx, gy = np.meshgrid(np.arange(cols, dtype=np.int32) * dx + x, np.arange(rows, dtype=np.int32) * dy + y)
+        return cls(np.stack((gx.ravel(), gy.ravel()), axis=1))
+
+    @property
+    def xy(self) -> np.ndarray:
+        """
+        获取只读的 (N, 2) 坐标数组。
+
+        Returns:
+            坐标数组
+        """
+        return self._xy
+
+    def offset(self, dx: int, dy: int) -> 'LocationArray':
+        """
+        获取全部点偏移后的新坐标。
+
+        Args:
+            dx: X 轴偏移量
+            dy: Y 轴偏移量
+
+        Returns:
+            新的 LocationArray 对象
+        """
+        return LocationArray(self._xy + np.array((dx, dy), dtype=np.int32))
+
+    def above(self, d: int) -> 'LocationArray':
+        """
+        获取全部点上方指定距离的坐标。
+
+        Args:
+            d: 距离
+
+        Returns:
+            新的 LocationArray 对象
+        """
+        return self.offset(0, -d)
+
+    def below(self, d: int) -> 'LocationArray':
+        """
+        获取全部点下方指定距离的坐标。
+
+        Args:
+            d: 距离
+
+        Returns:
+            新的 LocationArray 对象
+        """
+        return self.offset(0, d)
+
+    def left(self, d: int) -> 'LocationArray':
+        """
+        获取全部点左侧指定距离的坐标。
+
+        Args:
+            d: 距离
+
+        Returns:
+            新的 LocationArray 对象
+        """
+        return self.offset(-d, 0)
+
+    def right(self, d: int) -> 'LocationArray':
+        """
+        获取全部点右侧指定距离的坐标。
+
+        Args:
+            d: 距离
+
+        Returns:
+            新的 LocationArray 对象
+        """
+        return self.offset(d, 0)
+
+    def to_locations(self) -> list[Location]:
+        """
+        转换为 Location 对象列表，每个点创建一个 Java 对象。
+
+        Returns:
+            Location 对象列表
+        """
+        # 循环外绑定一次 Java 构造函数，逐点直接包装，跳过 Location.__init__ 的类型检查
+        new_location = get_cli().Location
+        return [Location._from_raw(new_location(x, y), (x, y)) for x, y in self._xy.tolist()]
+
+    def __len__(self) -> int:
+        return len(self._xy)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Location, 'LocationArray']:
+        """
+        按下标获取单个点，或按切片获取部分点。
+
+        Args:
+            index: 整数下标或切片
+
+        Returns:
+            整数下标返回 Location 对象，切片返回新的 LocationArray 对象
+        """
+        if isinstance(index, slice):
+            return LocationArray(self._xy[index])
+        # 只接受整数下标，列表、数组等会取出多行的下标在这里抛出 TypeError
+        x, y = self._xy[operator.index(index)].tolist()
+        return Location(x, y)
+
+    def __iter__(self) -> Iterator[Location]:
+        new_location = get_cli().Location
+        for x, y in self._xy.tolist():
+            yield Location._from_raw(new_location(x, y), (x, y))
+
+    def __repr__(self) -> str:
+        """
+        返回对象的字符串表示。
+
+        Returns:
+            对象的字符串表示
+        """
+        return f'<class {self.__class__.__name__} at {hex(id(self))}, {len(self)} points>'
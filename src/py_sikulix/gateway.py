@@ -13,23 +13,97 @@ SikuliX 网关启动脚本
 环境变量：设置 JAVA_HOME 指向 JDK 安装目录
 """
 
+import collections
+import json
 import logging
 import os
 import pathlib
 import re
+import select
+import socket
 import subprocess
 import sys
 import time
 from typing import Optional, Union
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# 调用方已配置日志时不再覆盖
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+# 查找 JAR 时跳过的目录，通常体积大且不会包含 SikuliX
+_SKIP_DIRS = frozenset({'node_modules', '.git', '.hg', '.svn', 'target', '__pycache__', '.venv', 'venv'})
+_JAR_CACHE_FILE = pathlib.Path('~/.cache/py-sikulix/jar_path').expanduser()
+
+
+def _scan_jar(root: str, pattern: re.Pattern, max_depth: int = 6) -> Optional[pathlib.Path]:
+    """
+    广度优先查找路径匹配 pattern 的 JAR 文件，找到第一个即返回。
+
+    Args:
+        root: 起始目录
+        pattern: 匹配完整路径的正则
+        max_depth: 最大目录深度，起始目录为 0
+
+    Returns:
+        找到的 JAR 文件路径，未找到返回 None
+    """
+    queue = collections.deque([(root, 0)])
+    while queue:
+        directory, depth = queue.popleft()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                # 不跟随符号链接，避免目录循环
+                if entry.is_dir(follow_symlinks=False):
+                    if depth < max_depth and entry.name not in _SKIP_DIRS:
+                        queue.append((entry.path, depth + 1))
+                elif entry.name.endswith('.jar') and pattern.search(entry.path):
+                    return pathlib.Path(entry.path)
+            except OSError:
+                continue
+    return None
+
+
+def _load_jar_cache(filename: str) -> Optional[pathlib.Path]:
+    """读取 find_jar 的缓存，文件不存在或修改时间变化时视为失效。"""
+    try:
+        path, mtime = json.loads(_JAR_CACHE_FILE.read_text(encoding='utf-8'))[filename]
+        jar_path = pathlib.Path(path)
+        if jar_path.stat().st_mtime == mtime:
+            return jar_path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_jar_cache(filename: str, jar_path: pathlib.Path) -> None:
+    """记录 find_jar 的查找结果，写入失败不影响使用。"""
+    try:
+        try:
+            cache = json.loads(_JAR_CACHE_FILE.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        cache[filename] = [str(jar_path.absolute()), jar_path.stat().st_mtime]
+        _JAR_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _JAR_CACHE_FILE.write_text(json.dumps(cache), encoding='utf-8')
+    except OSError as e:
+        logger.debug(f'写入 JAR 路径缓存失败: {e}')
+
+
 def find_jar(filename: str) -> Optional[pathlib.Path]:
     """
     查找指定名称的 JAR 文件。
 
+    找到后路径缓存在 ~/.cache/py-sikulix/jar_path，JAR 文件被删除或替换（修改时间变化）后重新查找。
+
     Args:
         filename: JAR 文件名关键词
 
@@ -42,6 +116,10 @@ def find_jar(filename: str) -> Optional[pathlib.Path]:
         if jar_path.exists():
             return jar_path
 
+    jar_path = _load_jar_cache(filename)
+    if jar_path:
+        return jar_path
+
     possible_dirs = [
         '.',
         os.path.expanduser('.'),
@@ -49,20 +127,59 @@ def find_jar(filename: str) -> Optional[pathlib.Path]:
         '/usr/local/',
     ]
 
-    for directory in possible_dirs:
-        p_dir = pathlib.Path(directory)
-        if not p_dir.exists():
+    pattern = re.compile(filename)
+    # 去掉指向同一位置的重复目录，未找到时不必重复扫描
+    for directory in dict.fromkeys(os.path.abspath(d) for d in possible_dirs):
+        if not os.path.isdir(directory):
             continue
-        for path in p_dir.glob('**/*.jar'):
-            if re.search(filename, str(path)):
-                return path
+        jar_path = _scan_jar(directory, pattern)
+        if jar_path:
+            _save_jar_cache(filename, jar_path)
+            return jar_path
 
     return None
 
 
+def _wait_exit(process: subprocess.Popen, timeout: float) -> bool:
+    """
+    等待进程退出。
+
+    Linux 下通过 pidfd 由内核在进程退出时立即唤醒；Popen.wait(timeout) 是最长 50ms 间隔的轮询，
+    不支持 pidfd 的平台回退到该方式。
+
+    Args:
+        process: 要等待的进程
+        timeout: 最长等待秒数
+
+    Returns:
+        进程在超时前退出返回 True
+    """
+    try:
+        fd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        # 非 Linux、内核低于 5.3 或进程已被回收
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        if not poller.poll(timeout * 1000):
+            return False
+    finally:
+        os.close(fd)
+    # 进程已退出，回收并更新 returncode
+    process.wait()
+    return True
+
+
 class SikuliXGateway:
     """SikuliX 网关启动器。"""
 
+    __slots__ = ('port', 'gateway_process', 'sikulix_path')
+
     def __init__(self, port: int = 25333, sikulix_path: Optional[Union[str, pathlib.Path]] = None):
         self.port = port
         self.gateway_process = None
@@ -114,31 +231,50 @@ class SikuliXGateway:
             ['java', '-cp', str(self.sikulix_path), 'py4j.GatewayServer', str(self.port)],
             stdout=subprocess.DEVNULL,  # 防止没有处理stdout、stderr导致的缓冲区满进程挂起的情况
             stderr=subprocess.DEVNULL,
-            text=True,
+            start_new_session=True,  # 独立进程组，终端 Ctrl+C 不会直接打断 JVM，由 stop 负责停止
         )
 
-        time.sleep(1)
-
-        if self.gateway_process.poll() is None:
+        if self.wait_port():
             logger.info(f'网关启动成功，运行端口：{self.port}')
+        elif self.gateway_process.poll() is not None:
+            # 输出已重定向到 DEVNULL，只能给出退出码
+            logger.warning(f'网关启动失败，进程退出码: {self.gateway_process.returncode}')
+            return False
         else:
-            _, stderr = self.gateway_process.communicate()
-            logger.warning(f'网关启动失败: {stderr}')
+            logger.warning(f'网关端口 {self.port} 未在限定时间内开始监听')
             return False
 
         return self.test_connection()
 
+    def wait_port(self, timeout: float = 5.0, interval: float = 0.01) -> bool:
+        """
+        轮询等待网关端口开始监听，代替固定等待，JVM 启动多快就返回多快。
+
+        Args:
+            timeout: 最长等待秒数
+            interval: 轮询间隔秒数
+
+        Returns:
+            端口可连接返回 True；超时或网关进程已退出返回 False
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                if sock.connect_ex(('127.0.0.1', self.port)) == 0:
+                    return True
+            if self.gateway_process and self.gateway_process.poll() is not None:
+                return False
+            time.sleep(interval)
+        return False
+
     def stop(self, timeout: float = 8):
         """停止网关"""
         if not self.gateway_process:
             return
         self.gateway_process.terminate()  # type: ignore
-        try:
-            self.gateway_process.wait(timeout=timeout)  # type: ignore
-            logger.info('已停止 SikuliX 网关')
-        except subprocess.TimeoutExpired:
+        if not _wait_exit(self.gateway_process, timeout):
             self.gateway_process.kill()  # type: ignore
-            logger.info('已停止 SikuliX 网关')
+        logger.info('已停止 SikuliX 网关')
 
     def test_status(self, is_output: bool = True) -> bool:
         """显示网关状态。"""
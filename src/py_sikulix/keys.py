@@ -4,138 +4,172 @@
 
 Keyboard and mouse button constant modules.
 
-首次访问时从 JVM 获取常量值。
+首次访问时从 JVM 获取常量值并缓存。
 
 参考: https://raiman.github.io/SikuliX1/javadocs/org/sikuli/script/Key.html
 """
 
+import sys
+
 from py_sikulix.client import get_cli
 
 
-class LazyProperty:
-    def __init__(self, func):
-        self.func = func
+def _intern(value: str | int) -> str | int:
+    """驻留字符串常量，与同一按键的比较可直接命中指针相等的快速路径。"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _JavaConstMeta(type):
+    """
+    常量类元类：首次访问类注解中声明的常量时从 JVM 获取，并写回类字典。
+
+    之后的访问就是普通的类属性查找，不再经过 __getattr__ 和网关。
+    """
+
+    _java_class: str
+
+    def __getattr__(cls, name: str) -> str | int:
+        # 只在类字典中找不到属性时才会进入这里；未在注解中声明的名称按普通属性缺失处理
+        if name.startswith('_') or name not in cls.__annotations__:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        value = _intern(getattr(getattr(get_cli(), cls._java_class), name))
+        setattr(cls, name, value)
+        return value
+
+    def preload(cls) -> None:
+        """
+        一次性取回类中声明的全部常量，适合在对延迟敏感的循环开始前调用。
 
-    def __get__(self, instance, owner) -> str | int:
-        # 访问时触发这里
-        return self.func(owner)
+        Java 类引用只解析一次，已取回的常量跳过。
+        """
+        java_class = getattr(get_cli(), cls._java_class)
+        for name in cls.__annotations__:
+            if not name.startswith('_') and name not in cls.__dict__:
+                setattr(cls, name, _intern(getattr(java_class, name)))
 
 
 # 便捷类 - 用于类型提示和 IDE 补全
-class Key:
+class Key(metaclass=_JavaConstMeta):
     """
-    键盘按键常量类。必须要创建实例后才能调用，为了兼容延迟加载只能折中采用实例化方案
+    键盘按键常量类。直接通过类访问（如 Key.ENTER），不需要创建实例，常量在首次访问时从 JVM 获取
 
     Keyboard key constant class.
 
     定义了键盘操作的按键常量，包括方向键、功能键、控制键和小键盘按键。
     """
 
+    _java_class = 'Key'
+
     # 方向键
-    UP: str = LazyProperty(lambda _: get_cli().Key.UP)  # type: ignore
-    DOWN: str = LazyProperty(lambda _: get_cli().Key.DOWN)  # type: ignore
-    LEFT: str = LazyProperty(lambda _: get_cli().Key.LEFT)  # type: ignore
-    RIGHT: str = LazyProperty(lambda _: get_cli().Key.RIGHT)  # type: ignore
+    UP: str
+    DOWN: str
+    LEFT: str
+    RIGHT: str
 
     # 功能键
-    F1: str = LazyProperty(lambda _: get_cli().Key.F1)  # type: ignore
-    F2: str = LazyProperty(lambda _: get_cli().Key.F2)  # type: ignore
-    F3: str = LazyProperty(lambda _: get_cli().Key.F3)  # type: ignore
-    F4: str = LazyProperty(lambda _: get_cli().Key.F4)  # type: ignore
-    F5: str = LazyProperty(lambda _: get_cli().Key.F5)  # type: ignore
-    F6: str = LazyProperty(lambda _: get_cli().Key.F6)  # type: ignore
-    F7: str = LazyProperty(lambda _: get_cli().Key.F7)  # type: ignore
-    F8: str = LazyProperty(lambda _: get_cli().Key.F8)  # type: ignore
-    F9: str = LazyProperty(lambda _: get_cli().Key.F9)  # type: ignore
-    F10: str = LazyProperty(lambda _: get_cli().Key.F10)  # type: ignore
-    F11: str = LazyProperty(lambda _: get_cli().Key.F11)  # type: ignore
-    F12: str = LazyProperty(lambda _: get_cli().Key.F12)  # type: ignore
-    F13: str = LazyProperty(lambda _: get_cli().Key.F13)  # type: ignore
-    F14: str = LazyProperty(lambda _: get_cli().Key.F14)  # type: ignore
-    F15: str = LazyProperty(lambda _: get_cli().Key.F15)  # type: ignore
+    F1: str
+    F2: str
+    F3: str
+    F4: str
+    F5: str
+    F6: str
+    F7: str
+    F8: str
+    F9: str
+    F10: str
+    F11: str
+    F12: str
+    F13: str
+    F14: str
+    F15: str
 
     # 控制键
-    ALT: str = LazyProperty(lambda _: get_cli().Key.ALT)  # type: ignore
-    BACKSPACE: str = LazyProperty(lambda _: get_cli().Key.BACKSPACE)  # type: ignore
-    DELETE: str = LazyProperty(lambda _: get_cli().Key.DELETE)  # type: ignore
-    END: str = LazyProperty(lambda _: get_cli().Key.END)  # type: ignore
-    ENTER: str = LazyProperty(lambda _: get_cli().Key.ENTER)  # type: ignore
-    ESC: str = LazyProperty(lambda _: get_cli().Key.ESC)  # type: ignore
-    HOME: str = LazyProperty(lambda _: get_cli().Key.HOME)  # type: ignore
-    INSERT: str = LazyProperty(lambda _: get_cli().Key.INSERT)  # type: ignore
-    CAPS_LOCK: str = LazyProperty(lambda _: get_cli().Key.CAPS_LOCK)  # type: ignore
-    CMD: str = LazyProperty(lambda _: get_cli().Key.CMD)  # type: ignore
-    CTRL: str = LazyProperty(lambda _: get_cli().Key.CTRL)  # type: ignore
-    PAGE_DOWN: str = LazyProperty(lambda _: get_cli().Key.PAGE_DOWN)  # type: ignore
-    PAGE_UP: str = LazyProperty(lambda _: get_cli().Key.PAGE_UP)  # type: ignore
-    PAUSE: str = LazyProperty(lambda _: get_cli().Key.PAUSE)  # type: ignore
-    PRINTSCREEN: str = LazyProperty(lambda _: get_cli().Key.PRINTSCREEN)  # type: ignore
-    SCROLL_LOCK: str = LazyProperty(lambda _: get_cli().Key.SCROLL_LOCK)  # type: ignore
-    SEPARATOR: str = LazyProperty(lambda _: get_cli().Key.SEPARATOR)  # type: ignore
-    SHIFT: str = LazyProperty(lambda _: get_cli().Key.SHIFT)  # type: ignore
-    SPACE: str = LazyProperty(lambda _: get_cli().Key.SPACE)  # type: ignore
-    TAB: str = LazyProperty(lambda _: get_cli().Key.TAB)  # type: ignore
-    WIN: str = LazyProperty(lambda _: get_cli().Key.WIN)  # type: ignore
+    ALT: str
+    BACKSPACE: str
+    DELETE: str
+    END: str
+    ENTER: str
+    ESC: str
+    HOME: str
+    INSERT: str
+    CAPS_LOCK: str
+    CMD: str
+    CTRL: str
+    PAGE_DOWN: str
+    PAGE_UP: str
+    PAUSE: str
+    PRINTSCREEN: str
+    SCROLL_LOCK: str
+    SEPARATOR: str
+    SHIFT: str
+    SPACE: str
+    TAB: str
+    WIN: str
 
     # 小键盘
-    NUM_LOCK: str = LazyProperty(lambda _: get_cli().Key.NUM_LOCK)  # type: ignore
-    ADD: str = LazyProperty(lambda _: get_cli().Key.ADD)  # type: ignore # 小键盘加号
-    MINUS: str = LazyProperty(lambda _: get_cli().Key.MINUS)  # type: ignore # 小键盘减号
-    DIVIDE: str = LazyProperty(lambda _: get_cli().Key.DIVIDE)  # type: ignore # 小键盘除号
-    MULTIPLY: str = LazyProperty(lambda _: get_cli().Key.MULTIPLY)  # type: ignore # 小键盘乘号
-    DECIMAL: str = LazyProperty(lambda _: get_cli().Key.DECIMAL)  # type: ignore # 小键盘小数点
-    NUM0: str = LazyProperty(lambda _: get_cli().Key.NUM0)  # type: ignore
-    NUM1: str = LazyProperty(lambda _: get_cli().Key.NUM1)  # type: ignore
-    NUM2: str = LazyProperty(lambda _: get_cli().Key.NUM2)  # type: ignore
-    NUM3: str = LazyProperty(lambda _: get_cli().Key.NUM3)  # type: ignore
-    NUM4: str = LazyProperty(lambda _: get_cli().Key.NUM4)  # type: ignore
-    NUM5: str = LazyProperty(lambda _: get_cli().Key.NUM5)  # type: ignore
-    NUM6: str = LazyProperty(lambda _: get_cli().Key.NUM6)  # type: ignore
-    NUM7: str = LazyProperty(lambda _: get_cli().Key.NUM7)  # type: ignore
-    NUM8: str = LazyProperty(lambda _: get_cli().Key.NUM8)  # type: ignore
-    NUM9: str = LazyProperty(lambda _: get_cli().Key.NUM9)  # type: ignore
-
-
-class Btn:
+    NUM_LOCK: str
+    ADD: str  # 小键盘加号
+    MINUS: str  # 小键盘减号
+    DIVIDE: str  # 小键盘除号
+    MULTIPLY: str  # 小键盘乘号
+    DECIMAL: str  # 小键盘小数点
+    NUM0: str
+    NUM1: str
+    NUM2: str
+    NUM3: str
+    NUM4: str
+    NUM5: str
+    NUM6: str
+    NUM7: str
+    NUM8: str
+    NUM9: str
+
+
+class KeyModifier(metaclass=_JavaConstMeta):
+    """
+    修饰键掩码常量类。
+
+    Modifier key mask constant class.
+
+    用于 type(text, modifiers) 等接口，多个修饰键按位或组合。
+    """
+
+    _java_class = 'KeyModifier'
+
+    CTRL: int
+    SHIFT: int
+    ALT: int
+    CMD: int
+    WIN: int
+
+
+class Btn(metaclass=_JavaConstMeta):
     """
-    鼠标按键常量类。必须要创建实例后才能调用，为了兼容延迟加载只能折中采用实例化方案
+    鼠标按键常量类。直接通过类访问（如 Btn.LEFT），不需要创建实例，常量在首次访问时从 JVM 获取
 
     Mouse button constant class.
 
     定义了鼠标操作的按键常量，包括左键、右键、中键和滚轮方向。
-    这些是固定的整数值，不需要从 JVM 获取。
     """
 
-    LEFT: int = LazyProperty(lambda _: get_cli().Button.LEFT)  # type: ignore
-    MIDDLE: int = LazyProperty(lambda _: get_cli().Button.MIDDLE)  # type: ignore
-    RIGHT: int = LazyProperty(lambda _: get_cli().Button.RIGHT)  # type: ignore
-    WHEEL_DOWN: int = LazyProperty(lambda _: get_cli().Button.WHEEL_DOWN)  # type: ignore
-    WHEEL_UP: int = LazyProperty(lambda _: get_cli().Button.WHEEL_UP)  # type: ignore
-
-
-if __name__ == '__main__':
-    print('方向键:')
-    print(f'UP: {Key.UP}')
-    print(f'DOWN: {Key.DOWN}')
-    print(f'LEFT: {Key.LEFT}')
-    print(f'RIGHT: {Key.RIGHT}')
-
-    print('\n功能键:')
-    print(f'F1: {Key.F1}')
-    print(f'F2: {Key.F2}')
-
-    print('\n控制键:')
-    print(f'ENTER: {Key.ENTER}')
-    print(f'TAB: {Key.TAB}')
-    print(f'ESC: {Key.ESC}')
-
-    print('\n小键盘:')
-    print(f'ADD: {Key.ADD}')
-    print(f'MINUS: {Key.MINUS}')
-
-    print('\n鼠标键:')
-    print(f'LEFT: {Btn.LEFT}')
-    print(f'RIGHT: {Btn.RIGHT}')
-    print(f'MIDDLE: {Btn.MIDDLE}')
-    print(f'WHEEL_UP: {Btn.WHEEL_UP}')
-    print(f'WHEEL_DOWN: {Btn.WHEEL_DOWN}')
+    _java_class = 'Button'
+
+    LEFT: int
+    MIDDLE: int
+    RIGHT: int
+    WHEEL_DOWN: int
+    WHEEL_UP: int
+
+
+def __getattr__(name: str) -> str:
+    """
+    模块级按键常量：`from py_sikulix.keys import ENTER` 等价于 `Key.ENTER`。
+
+    首次访问时经 Key 取值并写入模块字典，之后按普通全局变量查找，不再进入本函数。
+    只导出 Key 的常量，KeyModifier、Btn 与其存在同名常量（CTRL、LEFT 等），仍通过类访问。
+    """
+    if name.startswith('_') or name not in Key.__annotations__:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(Key, name)
+    globals()[name] = value
+    return value
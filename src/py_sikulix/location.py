@@ -3,16 +3,22 @@
 #
 """Location 类 - 屏幕坐标点。"""
 
+import re
 from typing import Optional, Union
 
-from py4j.java_gateway import JavaObject
+from py4j.java_gateway import JavaObject, get_method
 
-from py_sikulix.client import get_cli
+from py_sikulix.client import _RawBacked, get_cli
 
+# 匹配 Location.toString() 中的坐标，格式：L[100,200]@S(0)，前两个整数为 x、y
+_LOC_INT_RE = re.compile(r'-?\d+')
 
-class Location:
+
+class Location(_RawBacked):
     """Location 类表示屏幕上的一个点坐标 (x, y)。"""
 
+    __slots__ = ('_raw', '_xy')
+
     def __init__(self, x_or_java_obj: Union[JavaObject, int], y: Optional[int] = None):
         """
         创建一个 Location 对象。
@@ -21,13 +27,69 @@ class Location:
             x_or_java_obj: X 轴坐标或Java 对象，用于创建 Location 对象。
             y: Y 轴坐标
         """
-        if isinstance(x_or_java_obj, int) and isinstance(y, int):
-            x_or_java_obj = get_cli().Location(x_or_java_obj, y)  # type: ignore
-        if not isinstance(x_or_java_obj, JavaObject):
+        x_type = type(x_or_java_obj)
+        if x_type is int and type(y) is int:
+            # 新建的 Java 对象类型确定，不再重复检查
+            self._xy: Optional[tuple[int, int]] = (x_or_java_obj, y)  # type: ignore
+            self._raw: JavaObject = get_cli().Location(x_or_java_obj, y)  # type: ignore
+        elif x_type is JavaObject or isinstance(x_or_java_obj, JavaObject):
+            # 包装 Java 对象时类型通常恰好是 JavaObject，先比较类型，子类再走 isinstance
+            self._xy = None
+            self._raw = x_or_java_obj  # type: ignore
+        elif isinstance(x_or_java_obj, int) and isinstance(y, int):
+            # int 子类（如 bool、IntEnum）
+            self._xy = (int(x_or_java_obj), int(y))
+            self._raw = get_cli().Location(*self._xy)  # type: ignore
+        else:
             raise ValueError(
                 'please pass in the correct types of x, y parameters. do not directly pass in JavaObject to create the Class.'
             )
-        self._raw: JavaObject = x_or_java_obj  # type: ignore
+
+    @classmethod
+    def _from_raw(cls, raw: JavaObject, xy: Optional[tuple[int, int]] = None) -> 'Location':
+        """
+        直接包装 Java 返回的 Location，跳过 __init__ 的参数检查。
+
+        Args:
+            raw: Java Location 对象
+            xy: 已知的坐标，传入后不必再向 Java 查询
+
+        Returns:
+            新的 Location 对象
+        """
+        obj = cls.__new__(cls)
+        obj._xy = xy
+        obj._raw = raw
+        return obj
+
+    def _shifted(self, method: str, *args: int, dx: int, dy: int) -> 'Location':
+        """
+        调用 Java 端的偏移方法得到新位置，当前坐标已缓存时顺带算出新坐标，之后读取 x、y 不再访问 Java。
+
+        Args:
+            method: Java Location 的方法名
+            args: 方法参数
+            dx: 新位置相对当前位置的 X 偏移
+            dy: 新位置相对当前位置的 Y 偏移
+
+        Returns:
+            新的 Location 对象
+        """
+        xy = self._xy
+        raw = get_method(self._raw, method)(*args)
+        return Location._from_raw(raw, None if xy is None else (xy[0] + dx, xy[1] + dy))
+
+    def _get_xy(self) -> tuple[int, int]:
+        """
+        获取并缓存坐标，Java 对象包装而来时通过 toString() 一次取回 x、y。
+
+        Returns:
+            (x坐标, y坐标)
+        """
+        if self._xy is None:
+            x, y = map(int, _LOC_INT_RE.findall(get_method(self._raw, 'toString')())[:2])
+            self._xy = (x, y)
+        return self._xy
 
     @property
     def x(self) -> int:
@@ -37,7 +99,7 @@ class Location:
         Returns:
             X 坐标值
         """
-        return self._raw.getX()  # type: ignore
+        return self._get_xy()[0]
 
     @property
     def y(self) -> int:
@@ -47,7 +109,7 @@ class Location:
         Returns:
             Y 坐标值
         """
-        return self._raw.getY()  # type: ignore
+        return self._get_xy()[1]
 
     def get_x(self) -> int:
         """
@@ -56,7 +118,7 @@ class Location:
         Returns:
             X 坐标值
         """
-        return self._raw.getX()  # type: ignore
+        return self._get_xy()[0]
 
     def get_y(self) -> int:
         """
@@ -65,7 +127,7 @@ class Location:
         Returns:
             Y 坐标值
         """
-        return self._raw.getY()  # type: ignore
+        return self._get_xy()[1]
 
     def offset(self, dx: int, dy: int) -> 'Location':
         """
@@ -78,7 +140,7 @@ class Location:
         Returns:
             新的 Location 对象
         """
-        return Location(self._raw.offset(dx, dy))  # type: ignore
+        return self._shifted('offset', dx, dy, dx=dx, dy=dy)
 
     def above(self, d: int) -> 'Location':
         """
@@ -90,7 +152,7 @@ class Location:
         Returns:
             上方的新位置
         """
-        return Location(self._raw.above(d))  # type: ignore
+        return self._shifted('above', d, dx=0, dy=-d)
 
     def below(self, d: int) -> 'Location':
         """
@@ -102,7 +164,7 @@ class Location:
         Returns:
             下方的新位置
         """
-        return Location(self._raw.below(d))  # type: ignore
+        return self._shifted('below', d, dx=0, dy=d)
 
     def left(self, d: int) -> 'Location':
         """
@@ -114,7 +176,7 @@ class Location:
         Returns:
             左侧的新位置
         """
-        return Location(self._raw.left(d))  # type: ignore
+        return self._shifted('left', d, dx=-d, dy=0)
 
     def right(self, d: int) -> 'Location':
         """
@@ -126,7 +188,7 @@ class Location:
         Returns:
             右侧的新位置
         """
-        return Location(self._raw.right(d))  # type: ignore
+        return self._shifted('right', d, dx=d, dy=0)
 
     def __repr__(self) -> str:
         """
@@ -135,26 +197,5 @@ class Location:
         Returns:
             对象的字符串表示
         """
-        return f'<class {self.__class__.__name__} at {hex(id(self))}, [{self.x},{self.y}]>'
-
-
-if __name__ == '__main__':
-    loc = Location(100, 200)
-    print(f'初始位置: ({loc.x}, {loc.y})')
-
-    offset_loc = loc.offset(50, 30)
-    print(f'右偏50，下偏30后位置: ({offset_loc.x}, {offset_loc.y})')
-
-    above_loc = loc.above(50)
-    print(f'上方50像素位置: ({above_loc.x}, {above_loc.y})')
-
-    below_loc = loc.below(50)
-    print(f'下方50像素位置: ({below_loc.x}, {below_loc.y})')
-
-    left_loc = loc.left(50)
-    print(f'左侧50像素位置: ({left_loc.x}, {left_loc.y})')
-
-    right_loc = loc.right(50)
-    print(f'右侧50像素位置: ({right_loc.x}, {right_loc.y})')
-
-    print(f'打印对象：{loc}')
+        x, y = self._get_xy()
+        return f'<class {self.__class__.__name__} at {hex(id(self))}, [{x},{y}]>'
@@ -1,44 +1,103 @@
 import pathlib
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
-from py4j.java_gateway import JavaObject
+from py4j.java_gateway import JavaObject, get_method
 
-from py_sikulix.client import get_cli
+from py_sikulix.client import _RawBacked, abs_path_str, get_cli
 from py_sikulix.location import Location
 
 
-class Pattern:
+def _existing_path_str(path: str) -> str:
+    """
+    检查图像文件存在并转换为绝对路径字符串。
+
+    每次都重新检查文件是否存在，模板被删除或移走后能及时报错；绝对路径的转换由 abs_path_str 缓存。
+
+    Args:
+        path: 图像文件路径
+
+    Returns:
+        绝对路径字符串
+    """
+    if not pathlib.Path(path).exists():
+        raise FileNotFoundError(f'file {path} does not exist')
+    return abs_path_str(path)
+
+
+class Pattern(_RawBacked):
     """
     Pattern 类用于定义要搜索的图像模式，包括图像路径、相似度阈值等属性。
+
+    Java 端的 Pattern 在首次使用时才创建，之前的设置先记录下来，创建时一并应用。
     """
 
+    __slots__ = ('_java', '_path', '_pending', '_applied', '_filename')
+
     def __init__(self, path_or_java_obj: Union[str, pathlib.Path, JavaObject]):
         """
         初始化 Pattern 对象。
 
         Args:
-            java_instance: SikuliX 中的 Pattern Java 对象
+            path_or_java_obj: 图像文件路径，或 SikuliX 中的 Pattern Java 对象
         """
+        self._java: Optional[JavaObject] = None
+        self._path: Optional[str] = None
+        # 尚未应用到 Java 对象的设置，设置项 -> (Java 方法名, 参数)，同一设置项只保留最后一次
+        self._pending: dict[str, tuple[str, tuple[Any, ...]]] = {}
+        # 已应用到 Java 对象的设置，重复设置相同的值时不再调用 Java
+        self._applied: dict[str, tuple[str, tuple[Any, ...]]] = {}
+        # Java 端返回的文件路径缓存，设置 filename 时清除
+        self._filename: Optional[str] = None
         if isinstance(path_or_java_obj, (str, pathlib.Path)):
-            path_or_java_obj = pathlib.Path(path_or_java_obj)
-            if not path_or_java_obj.exists():
-                raise FileNotFoundError(f'file {path_or_java_obj} does not exist')
-        path_or_java_obj = get_cli().Pattern(str(path_or_java_obj.absolute()))  # type: ignore
-        if not isinstance(path_or_java_obj, JavaObject):
+            self._path = _existing_path_str(str(path_or_java_obj))
+        elif isinstance(path_or_java_obj, JavaObject):
+            self._java = path_or_java_obj
+        else:
             raise ValueError(
                 'please pass in the correct types of path parameter. do not directly pass in JavaObject to create the Class.'
             )
-        self._raw = path_or_java_obj
+
+    @property
+    def _raw(self) -> JavaObject:
+        """
+        Java 端 Pattern 对象，首次访问时创建并应用之前记录的设置。
+
+        设置方法通过 get_method 调用，省去 auto_field 下新对象每个名称首次访问的字段探测往返。
+        """
+        raw = self._java
+        if raw is None:
+            raw = get_cli().Pattern(self._path)  # type: ignore
+            for name, args in self._pending.values():
+                get_method(raw, name)(*(arg._raw if isinstance(arg, _RawBacked) else arg for arg in args))
+            self._applied.update(self._pending)
+            self._pending.clear()
+            self._java = raw
+        return raw
+
+    def _apply(self, key: str, name: str, *args: Any) -> None:
+        """
+        调用 Java Pattern 的设置方法，Java 对象尚未创建时先记录，创建时再应用；与上次设置的值相同时跳过。
+
+        Args:
+            key: 设置项，同一设置项的多次设置只保留最后一次
+            name: Java 方法名
+            args: 方法参数
+        """
+        if self._java is None:
+            self._pending.pop(key, None)
+            self._pending[key] = (name, args)
+        elif self._applied.get(key) != (name, args):
+            get_method(self._java, name)(*(arg._raw if isinstance(arg, _RawBacked) else arg for arg in args))
+            self._applied[key] = (name, args)
 
     @property
     def filename(self) -> pathlib.Path:
-        return pathlib.Path(self._raw.getFilename())  # type: ignore
+        return pathlib.Path(self.get_filename())
 
     @filename.setter
     def filename(self, value: Union[str, pathlib.Path]):
-        if isinstance(value, str):
-            value = pathlib.Path(value)
-        self._raw.setFilename(str(value.absolute()))  # type: ignore
+        self._apply('filename', 'setFilename', abs_path_str(str(value)))
+        self._filename = None
 
     @property
     def resize(self) -> float:
@@ -46,7 +105,7 @@ class Pattern:
 
     @resize.setter
     def resize(self, value: float):
-        self._raw.resize(value)  # type: ignore
+        self._apply('resize', 'resize', value)
 
     @property
     def similar(self) -> float:
@@ -54,18 +113,18 @@ class Pattern:
 
     @similar.setter
     def similar(self, value: float):
-        self._raw.similar(value)  # type: ignore
+        self._apply('similar', 'similar', value)
 
     @property
     def target_offset(self) -> Location:
-        return Location(self._raw.getTargetOffset())  # type: ignore
+        return self.get_target_offset()
 
     @target_offset.setter
     def target_offset(self, value: Union[tuple[int, int], Location]):
         if isinstance(value, Location):
-            self._raw.targetOffset(value)  # type: ignore
+            self._apply('target_offset', 'targetOffset', value)
         else:
-            self._raw.targetOffset(value[0], value[1])  # type: ignore
+            self._apply('target_offset', 'targetOffset', value[0], value[1])
 
     def set_similar(self, sim: float = 0.7):
         """
@@ -78,7 +137,7 @@ class Pattern:
         Returns:
             当前 Pattern 对象，支持链式调用
         """
-        self._raw.similar(sim)  # type: ignore
+        self._apply('similar', 'similar', sim)
         return self
 
     def exact(self):
@@ -88,7 +147,7 @@ class Pattern:
         Returns:
             当前 Pattern 对象，支持链式调用
         """
-        self._raw.exact()  # type: ignore
+        self._apply('similar', 'exact')
         return self
 
     def set_resize(self, factor: float = 1):
@@ -102,7 +161,7 @@ class Pattern:
         Returns:
             当前 Pattern 对象，支持链式调用
         """
-        self._raw.resize(factor)  # type: ignore
+        self._apply('resize', 'resize', factor)
         return self
 
     def set_target_offset(self, dx: int, dy: int):
@@ -116,7 +175,7 @@ class Pattern:
         Returns:
             当前 Pattern 对象，支持链式调用
         """
-        self._raw.targetOffset(dx, dy)  # type: ignore
+        self._apply('target_offset', 'targetOffset', dx, dy)
         return self
 
     def mask(self, image_or_pattern: Optional[Union[str, pathlib.Path, 'Pattern']] = None):
@@ -133,19 +192,23 @@ class Pattern:
         if image_or_pattern:
             if not isinstance(image_or_pattern, Pattern):
                 image_or_pattern = Pattern(image_or_pattern)
-            self._raw.mask(image_or_pattern._raw)  # type: ignore
+            self._apply('mask', 'mask', image_or_pattern)
         else:
-            self._raw.mask()  # type: ignore
+            self._apply('mask', 'mask')
         return self
 
     def get_filename(self) -> str:
         """
         获取 Pattern 的图像文件路径。
 
+        文件路径只在设置 filename 时变化，首次读取后缓存。
+
         Returns:
             图像文件的绝对路径字符串
         """
-        return self._raw.getFilename()  # type: ignore
+        if self._filename is None:
+            self._filename = get_method(self._raw, 'getFilename')()
+        return self._filename  # type: ignore
 
     def get_similar(self) -> float:
         """
@@ -163,7 +226,36 @@ class Pattern:
         Returns:
             Location对象，表示相对于匹配中心的偏移点位
         """
-        return Location(self._raw.getTargetOffset())  # type: ignore
+        return Location._from_raw(get_method(self._raw, 'getTargetOffset')(), self._known_target_offset())
+
+    def get_target_offset_xy(self) -> tuple[int, int]:
+        """
+        获取目标偏移量 (dx, dy)，不创建 Location 对象。
+
+        偏移量由本对象设置时直接返回记录的值，不访问 Java；否则通过 toString() 一次取回。
+
+        Returns:
+            (X 轴偏移量, Y 轴偏移量)
+        """
+        xy = self._known_target_offset()
+        if xy is None:
+            xy = Location._from_raw(get_method(self._raw, 'getTargetOffset')())._get_xy()
+        return xy
+
+    def _known_target_offset(self) -> Optional[tuple[int, int]]:
+        """
+        获取通过本对象设置的目标偏移量，未设置过返回 None。
+
+        Returns:
+            (X 轴偏移量, Y 轴偏移量) 或 None
+        """
+        setting = self._pending.get('target_offset') or self._applied.get('target_offset')
+        if setting is None:
+            return None
+        args = setting[1]
+        if len(args) == 2:
+            return int(args[0]), int(args[1])
+        return args[0]._get_xy()
 
     def get_resize(self):
         """
@@ -181,135 +273,8 @@ class Pattern:
         Returns:
             对象的字符串表示
         """
-        return f'<class {self.__class__.__name__} at {hex(id(self))}, S:{self.similar} O:{self.target_offset.x},{self.target_offset.y} R:{self.resize} F:{self.filename}>'
-
-
-if __name__ == '__main__':
-    import pathlib
-
-    print('=' * 50)
-    print('示例1: 创建 Pattern 对象')
-    print('=' * 50)
-
-    image_path = 'examples/RecycleBin.png'
-    try:
-        pattern1 = Pattern(image_path)
-        print(f'成功创建 Pattern: {image_path}')
-    except FileNotFoundError as e:
-        print(f'文件不存在: {e}')
-
-    path_obj = pathlib.Path('examples/RecycleBin_Transparent.png')
-    try:
-        pattern2 = Pattern(path_obj)
-        print(f'使用 pathlib.Path 创建 Pattern: {path_obj}')
-    except FileNotFoundError as e:
-        print(f'文件不存在: {e}')
-
-    print('\n' + '=' * 50)
-    print('示例2: 设置相似度阈值')
-    print('=' * 50)
-
-    try:
-        pattern = Pattern('examples/RecycleBin_Transparent.png')
-        pattern.similar = 0.8
-        print(f'设置相似度: {pattern.similar}')
-    except FileNotFoundError:
-        print('跳过示例2: 测试图像不存在')
-
-    print('\n' + '=' * 50)
-    print('示例3: 精确匹配')
-    print('=' * 50)
-
-    try:
-        pattern = Pattern('examples/RecycleBin_Transparent.png')
-        pattern.exact()
-        print(f'精确匹配模式，相似度: {pattern.similar}')
-    except FileNotFoundError:
-        print('跳过示例3: 测试图像不存在')
-
-    print('\n' + '=' * 50)
-    print('示例4: 图像缩放')
-    print('=' * 50)
-
-    try:
-        pattern = Pattern('examples/RecycleBin_Transparent.png')
-        pattern.resize = 1.5
-        print('图像放大 1.5 倍')
-        pattern.set_resize(0.5)
-        print('图像缩小到 0.5 倍')
-    except FileNotFoundError:
-        print('跳过示例4: 测试图像不存在')
-
-    print('\n' + '=' * 50)
-    print('示例5: 目标偏移量')
-    print('=' * 50)
-
-    try:
-        pattern = Pattern('examples/RecycleBin_Transparent.png')
-        pattern.target_offset = 10, 20
-        location = pattern.target_offset
-        print(f'目标偏移量: x={location.x}, y={location.y}')
-    except FileNotFoundError:
-        print('跳过示例5: 测试图像不存在')
-
-    print('\n' + '=' * 50)
-    print('示例6: 蒙版功能')
-    print('=' * 50)
-
-    try:
-        pattern_black = Pattern('examples/RecycleBin_Black.png').mask()
-        print('方式1: 使用图像黑色部分作为蒙版')
-        pattern_trans = Pattern('examples/RecycleBin_Transparent.png').mask()
-        print('方式2: 使用透明部分作为蒙版')
-        pattern_mask = Pattern('examples/RecycleBin.png').mask('examples/RecycleBin_Black.png')
-        print('方式3: 使用另一个图像作为蒙版')
-    except FileNotFoundError:
-        print('跳过示例6: 测试图像不存在')
-
-    print('\n' + '=' * 50)
-    print('示例7: Getter 方法 - 获取 Pattern 属性')
-    print('=' * 50)
-
-    try:
-        pattern = Pattern('examples/RecycleBin.png').set_similar(0.85).set_target_offset(5, -10)
-        filename = pattern.get_filename()
-        print(f'图像路径: {filename}')
-        similarity = pattern.get_similar()
-        print(f'相似度: {similarity}')
-        offset = pattern.get_target_offset()
-        print(f'目标偏移: dx={offset.x}, dy={offset.y}')
-    except FileNotFoundError:
-        print('跳过示例7: 测试图像不存在')
-
-    print('\n' + '=' * 50)
-    print('示例8: 流式 API - 方法链式调用')
-    print('=' * 50)
-
-    try:
-        pattern = Pattern('examples/RecycleBin.png').set_similar(0.9).set_target_offset(0, 5).set_resize(1.2)
-        print('链式调用创建 Pattern 成功！')
-        print(f'  相似度: {pattern.get_similar()}')
-        print(f'  偏移量: {pattern.get_target_offset()}')
-        print(f'  缩放比: {pattern.get_resize()}')
-    except FileNotFoundError:
-        print('跳过示例8: 测试图像不存在')
-
-    print('\n' + '=' * 50)
-    print('示例9: 实际使用场景')
-    print('=' * 50)
-
-    try:
-        exact_pattern = Pattern('examples/RecycleBin.png').exact()
-        print('场景2: 精确匹配按钮')
-        offset_pattern = Pattern('examples/RecycleBin.png').set_target_offset(50, 0)
-        print('场景3: 点击图标右侧 50 像素处')
-        scaled_pattern = Pattern('examples/RecycleBin.png').set_resize(1.5)
-        print('场景4: 高 DPI 屏幕缩放匹配')
-        masked_pattern = Pattern('examples/RecycleBin.png').mask('examples/RecycleBin.png')
-        print('场景5: 使用蒙版忽略背景')
-    except FileNotFoundError:
-        print('跳过示例9: 测试图像不存在')
-
-    print(f'打印对象：{pattern}')  # type: ignore
-
-    print('\n所有示例完成！')
+        # 偏移量只取一次且不创建 Location，文件路径使用缓存
+        dx, dy = self.get_target_offset_xy()
+        similar = get_method(self._raw, 'getSimilar')()
+        resize = get_method(self._raw, 'getResize')()
+        return f'<class {self.__class__.__name__} at {hex(id(self))}, S:{similar} O:{dx},{dy} R:{resize} F:{self.get_filename()}>'
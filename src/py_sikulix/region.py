@@ -1,28 +1,123 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 import pathlib
+import re
+import threading
 import time
-from typing import Optional, Union
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
 
-from py4j.java_gateway import JavaObject
+from py4j.java_gateway import JavaObject, get_method
 from py4j.protocol import Py4JJavaError
 
-from py_sikulix.client import get_cli
-from py_sikulix.keys import Btn
+from py_sikulix.client import _RawBacked, abs_path_str, get_cli
+from py_sikulix.keys import Btn, Key, KeyModifier
 from py_sikulix.location import Location
 from py_sikulix.pattern import Pattern
 
+if TYPE_CHECKING:
+    from py_sikulix.extend import CrossPlatformFinder
+
 logger = logging.getLogger(__name__)
 
+# Region._from_raw 返回调用它的类（Region、Match、Screen）
+_RegionT = TypeVar('_RegionT', bound='Region')
+
+# 匹配 java.awt.Rectangle.toString() 中的整数，格式：java.awt.Rectangle[x=0,y=0,width=100,height=100]
+_RECT_INT_RE = re.compile(r'-?\d+')
+# 匹配 Region/Match/Screen.toString() 中的区域描述，格式：R[x,y wxh]@S(0)、M[x,y wxh]...、S(0)[x,y wxh]...
+_BOUNDS_RE = re.compile(r'\[(-?\d+),(-?\d+) (-?\d+)x(-?\d+)\]')
+# 匹配 Match.toString() 开头的区域描述，格式：M[x,y wxh]
+_MATCH_RECT_RE = re.compile(r'M\[(-?\d+),(-?\d+) (\d+)x(\d+)\]')
+
+
+def _image_target(target: Union[str, pathlib.Path, Pattern, JavaObject]) -> Union[str, JavaObject]:
+    """
+    将查找目标转换为 Java 接口接受的参数：路径转换为绝对路径字符串（按输入缓存），Pattern 取出原始 Java 对象。
 
-class Region:
+    wait() 等方法只在进入时转换一次，不随每次查找重复。
+    """
+    if isinstance(target, str):
+        return abs_path_str(target)
+    if isinstance(target, Pattern):
+        return target._raw
+    if isinstance(target, pathlib.PurePath):
+        return abs_path_str(str(target))
+    if isinstance(target, JavaObject):
+        return target
+    raise TypeError(f'"target" must be an image path or Pattern, not {type(target).__name__}.')
+
+
+_FINDER_LOCAL = threading.local()
+
+
+def _get_finder() -> CrossPlatformFinder:
+    """
+    获取当前线程复用的 CrossPlatformFinder，找色结果的颜色重排缓存也随之保留。
+
+    extend 模块依赖 opencv、mss 等可选包，首次使用时才导入；mss 截图对象不能跨线程使用，因此每个线程各自创建。
+    """
+    finder = getattr(_FINDER_LOCAL, 'finder', None)
+    if finder is None:
+        from py_sikulix.extend import CrossPlatformFinder
+
+        finder = _FINDER_LOCAL.finder = CrossPlatformFinder()
+    return finder
+
+
+def _check_key(key: Optional[int]) -> None:
+    """校验点击类方法的修饰键参数，提前暴露调用错误。"""
+    if key is not None and not isinstance(key, int):
+        raise TypeError('"key" must be an int modifier mask, such as KeyModifier.CTRL.')
+
+
+@functools.lru_cache(maxsize=1)
+def _modifier_masks() -> dict[str, int]:
+    """
+    获取修饰按键常量到修饰键掩码的映射，首次调用时从 JVM 获取后缓存。
+
+    Returns:
+        {Key 常量: KeyModifier 掩码}
+    """
+    return {
+        Key.CTRL: KeyModifier.CTRL,
+        Key.SHIFT: KeyModifier.SHIFT,
+        Key.ALT: KeyModifier.ALT,
+        Key.CMD: KeyModifier.CMD,
+        Key.WIN: KeyModifier.WIN,
+    }
+
+
+class Region(_RawBacked):
     """
     Region 类表示屏幕上的一个矩形区域，可以在此区域内进行图像搜索和其他操作。
     文档地址：https://sikulix-2014.readthedocs.io/en/latest/region.html
+
+    x、y、w、h 在首次读取后缓存在 Python 端，通过本对象修改几何信息时自动失效；
+    若区域在 Java 端被其它途径修改，需调用 invalidate_cache()。
     """
 
+    __slots__ = (
+        '_raw',
+        '_cx',
+        '_cy',
+        '_cw',
+        '_ch',
+        '_get_x',
+        '_get_y',
+        '_get_w',
+        '_get_h',
+        '_to_string',
+        '_click',
+        '_key_down',
+        '_key_up',
+        '_exists',
+    )
+
     def __init__(
         self,
         x_or_java_obj: Union[int, JavaObject],
@@ -42,13 +137,62 @@ class Region:
         Returns:
             新的 Region 对象
         """
-        if all([isinstance(x_or_java_obj, int), isinstance(y, int), isinstance(w, int), isinstance(h, int)]):
-            x_or_java_obj = get_cli().Region(x_or_java_obj, y, w, h)  # type: ignore
-        if not isinstance(x_or_java_obj, JavaObject):
+        if isinstance(x_or_java_obj, int) and isinstance(y, int) and isinstance(w, int) and isinstance(h, int):
+            # 新建的 Java 对象类型确定，不再重复检查
+            self._raw = get_cli().Region(x_or_java_obj, y, w, h)  # type: ignore
+        elif type(x_or_java_obj) is JavaObject or isinstance(x_or_java_obj, JavaObject):
+            # 包装 Java 对象时类型通常恰好是 JavaObject，先比较类型，子类再走 isinstance
+            self._raw = x_or_java_obj
+        else:
             raise ValueError(
                 'please pass in the correct types of x, y, w, h parameters. do not directly pass in JavaObject to create the Class.'
             )
-        self._raw = x_or_java_obj  # type: ignore
+        self.invalidate_cache()
+        self._bind_methods()
+
+    @classmethod
+    def _from_raw(cls: type[_RegionT], raw: JavaObject) -> _RegionT:
+        """
+        直接包装 Java 返回的 Region 或 Match，跳过 __init__ 的参数检查。
+
+        Args:
+            raw: Java Region 或 Match 对象
+
+        Returns:
+            新的 Region 或 Match 对象
+        """
+        obj = cls.__new__(cls)
+        obj._raw = raw
+        obj.invalidate_cache()
+        obj._bind_methods()
+        return obj
+
+    def _bind_methods(self) -> None:
+        """
+        绑定高频调用的 Java 方法引用。
+
+        py4j 开启 auto_field 时，新 JavaObject 上每个名称首次访问都会先发起一次字段探测往返，
+        使用 get_method 直接构造方法引用可跳过该探测。
+        """
+        raw = self._raw
+        self._get_x = get_method(raw, 'getX')
+        self._get_y = get_method(raw, 'getY')
+        self._get_w = get_method(raw, 'getW')
+        self._get_h = get_method(raw, 'getH')
+        self._to_string = get_method(raw, 'toString')
+        self._click = get_method(raw, 'click')
+        self._key_down = get_method(raw, 'keyDown')
+        self._key_up = get_method(raw, 'keyUp')
+        self._exists = get_method(raw, 'exists')
+
+    def invalidate_cache(self) -> None:
+        """
+        清除缓存的 x、y、w、h，下次读取时重新从 Java 端获取。
+        """
+        self._cx: Optional[int] = None
+        self._cy: Optional[int] = None
+        self._cw: Optional[int] = None
+        self._ch: Optional[int] = None
 
     def set_x(self, x: int) -> Region:
         """
@@ -122,20 +266,13 @@ class Region:
         if not psmrl:
             return
 
-        # 如果输入是字符串，将其转换为 Path 对象
-        if isinstance(psmrl, str):
-            psmrl = pathlib.Path(psmrl)
-        # 如果输入对象具有 '_raw' 属性，则提取其原始数据
-        elif hasattr(psmrl, '_raw'):
-            # 处理 Match, Pattern, Region, Location 的对象
-            psmrl = psmrl._raw  # type: ignore
-
-        # 如果输入是 Path 对象，将其转换为绝对路径的字符串形式
-        if isinstance(psmrl, pathlib.Path):
-            psmrl = str(psmrl.absolute())
-
-        # 返回处理后的结果
-        return psmrl  # type: ignore
+        # 按具体类型分派转换函数，未登记的子类在首次出现时按 isinstance 查找并登记
+        handler = _PSMRL_DISPATCH.get(type(psmrl))
+        if handler is None:
+            handler = next((h for t, h in _PSMRL_BASES if isinstance(psmrl, t)), _psmrl_keep)
+            with _PSMRL_LOCK:
+                _PSMRL_DISPATCH[type(psmrl)] = handler
+        return handler(psmrl)
 
     # ==================== 位置属性访问器 ====================
 
@@ -147,11 +284,15 @@ class Region:
         Returns:
             X 坐标值
         """
-        return self._raw.getX()  # type: ignore
+        if self._cx is None:
+            self._cx = self._get_x()
+        return self._cx  # type: ignore
 
     @x.setter
-    def x(self, value: int):
-        self._raw.setX(value)  # type: ignore
+    def x(self, value: int) -> None:
+        get_method(self._raw, 'setX')(value)
+        # Java 端可能修正传入值（如宽高最小为 1），因此清除缓存而非直接写入
+        self._cx = None
 
     @property
     def y(self) -> int:
@@ -161,11 +302,14 @@ class Region:
         Returns:
             Y 坐标值
         """
-        return self._raw.getY()  # type: ignore
+        if self._cy is None:
+            self._cy = self._get_y()
+        return self._cy  # type: ignore
 
     @y.setter
-    def y(self, value: int):
-        self._raw.setY(value)  # type: ignore
+    def y(self, value: int) -> None:
+        get_method(self._raw, 'setY')(value)
+        self._cy = None
 
     @property
     def w(self) -> int:
@@ -175,11 +319,14 @@ class Region:
         Returns:
             宽度值
         """
-        return self._raw.getW()  # type: ignore
+        if self._cw is None:
+            self._cw = self._get_w()
+        return self._cw  # type: ignore
 
     @w.setter
-    def w(self, value: int):
-        self._raw.setW(value)  # type: ignore
+    def w(self, value: int) -> None:
+        get_method(self._raw, 'setW')(value)
+        self._cw = None
 
     @property
     def h(self) -> int:
@@ -189,11 +336,14 @@ class Region:
         Returns:
             高度值
         """
-        return self._raw.getH()  # type: ignore
+        if self._ch is None:
+            self._ch = self._get_h()
+        return self._ch  # type: ignore
 
     @h.setter
-    def h(self, value: int):
-        self._raw.setH(value)  # type: ignore
+    def h(self, value: int) -> None:
+        get_method(self._raw, 'setH')(value)
+        self._ch = None
 
     def get_x(self) -> int:
         return self.x  # type: ignore
@@ -211,57 +361,122 @@ class Region:
         """
         获取区域的边界坐标和尺寸。
 
+        通过区域自身的 toString() 一次网关往返取回四个值并写入缓存，避免 getX/getY/getW/getH 各自一次往返；
+        字符串格式无法识别时改用 getRect() 的字符串表示，两者都无法解析出四个整数时抛出 ValueError。
+
         Returns:
             返回一个四元组，分别表示区域的 (x坐标, y坐标, 宽度, 高度)
         """
-        return self.x, self.y, self.w, self.h  # type: ignore
+        bounds = self._cached_bounds()
+        if bounds is None:
+            found = _BOUNDS_RE.search(self._to_string())
+            if found:
+                values = found.groups()
+            else:
+                values = tuple(_RECT_INT_RE.findall(get_method(get_method(self._raw, 'getRect')(), 'toString')()))
+            if len(values) != 4:
+                raise ValueError(f'cannot parse region bounds from {values}.')
+            x, y, w, h = int(values[0]), int(values[1]), int(values[2]), int(values[3])
+            self._cx, self._cy, self._cw, self._ch = x, y, w, h
+            bounds = (x, y, w, h)
+        return bounds
 
     # ==================== 几何方法 ====================
 
+    def get_center_xy(self) -> tuple[int, int]:
+        """
+        获取区域中心坐标，由缓存的边界计算，不创建 Location 对象；边界已缓存时不访问 Java。
+
+        与 Java 端 getCenter() 的计算方式一致：(x + w / 2, y + h / 2)，整数除法。
+
+        Returns:
+            (中心 X 坐标, 中心 Y 坐标)
+        """
+        x, y, w, h = self.get_bounds()
+        return x + w // 2, y + h // 2
+
+    def _cached_bounds(self) -> Optional[tuple[int, int, int, int]]:
+        """已缓存全部边界值时返回 (x, y, w, h)，否则返回 None，不访问 Java。"""
+        if self._cx is None or self._cy is None or self._cw is None or self._ch is None:
+            return None
+        return self._cx, self._cy, self._cw, self._ch
+
     def get_center(self) -> Location:
         """
         获取区域中心位置点。
 
+        边界已缓存时同时写入返回对象的坐标缓存，之后读取其 x、y 不再访问 Java。
+
         Returns:
             区域中心点的 Location 对象
         """
-        return Location(self._raw.getCenter())  # type: ignore
+        bounds = self._cached_bounds()
+        xy = None if bounds is None else (bounds[0] + bounds[2] // 2, bounds[1] + bounds[3] // 2)
+        return Location._from_raw(get_method(self._raw, 'getCenter')(), xy)
 
     def get_top_left(self) -> Location:
         """
         获取区域左上角位置点。
 
+        边界已缓存时同时写入返回对象的坐标缓存，之后读取其 x、y 不再访问 Java。
+
         Returns:
             区域左上角点的 Location 对象
         """
-        return Location(self._raw.getTopLeft())  # type: ignore
+        bounds = self._cached_bounds()
+        xy = None if bounds is None else bounds[:2]
+        return Location._from_raw(get_method(self._raw, 'getTopLeft')(), xy)
 
     def get_top_right(self) -> Location:
         """
         获取区域右上角位置点。
 
+        边界已缓存时同时写入返回对象的坐标缓存；SikuliX 的区域不含右、下边界，右、下侧坐标为 x + w - 1、y + h - 1。
+
         Returns:
             区域右上角点的 Location 对象
         """
-        return Location(self._raw.getTopRight())  # type: ignore
+        bounds = self._cached_bounds()
+        xy = None if bounds is None else (bounds[0] + bounds[2] - 1, bounds[1])
+        return Location._from_raw(get_method(self._raw, 'getTopRight')(), xy)
 
     def get_bottom_left(self) -> Location:
         """
         获取区域左下角位置点。
 
+        边界已缓存时同时写入返回对象的坐标缓存，坐标计算方式同 get_top_right()。
+
         Returns:
             区域左下角点的 Location 对象
         """
-        return Location(self._raw.getBottomLeft())  # type: ignore
+        bounds = self._cached_bounds()
+        xy = None if bounds is None else (bounds[0], bounds[1] + bounds[3] - 1)
+        return Location._from_raw(get_method(self._raw, 'getBottomLeft')(), xy)
 
     def get_bottom_right(self) -> Location:
         """
         获取区域右下角位置点。
 
+        边界已缓存时同时写入返回对象的坐标缓存，坐标计算方式同 get_top_right()。
+
         Returns:
             区域右下角点的 Location 对象
         """
-        return Location(self._raw.getBottomRight())  # type: ignore
+        bounds = self._cached_bounds()
+        xy = None if bounds is None else (bounds[0] + bounds[2] - 1, bounds[1] + bounds[3] - 1)
+        return Location._from_raw(get_method(self._raw, 'getBottomRight')(), xy)
+
+    def get_corners(self) -> tuple[Location, Location, Location, Location]:
+        """
+        获取区域四个角的位置点。
+
+        先取回边界（已缓存时不访问 Java），四个 Location 的坐标都由边界算出，之后读取其 x、y 不再访问 Java。
+
+        Returns:
+            (左上角, 右上角, 左下角, 右下角) 的 Location 对象
+        """
+        self.get_bounds()
+        return self.get_top_left(), self.get_top_right(), self.get_bottom_left(), self.get_bottom_right()
 
     # ==================== 鼠标操作方法 ====================
 
@@ -279,18 +494,44 @@ class Region:
 
         Returns:
             点击的次数（通常为 1）。返回 0 表示由于某些原因未能执行点击。
+            Java 端异常直接抛出，如需记录日志后继续执行可使用 log_errors()。
         """
-        try:
-            psmrl = self._handle_psmrl(psmrl)  # type: ignore
-            if psmrl is None:
-                # 点击区域中心
-                result = self._raw.click() if key is None else self._raw.click(key)  # type: ignore
-            else:
-                result = self._raw.click(psmrl) if key is None else self._raw.click(psmrl, key)  # type: ignore
-            return int(result) if result is not None else 0
-        except Exception as e:
-            logger.error(f'click 操作失败: {e}')
-            return 0
+        _check_key(key)
+        psmrl = self._handle_psmrl(psmrl)  # type: ignore
+        if psmrl is None:
+            # 点击区域中心
+            return self._click() if key is None else self._click(key)  # type: ignore
+        return self._click(psmrl) if key is None else self._click(psmrl, key)  # type: ignore
+
+    def click_until(self, target: Union[str, pathlib.Path, Pattern], max_clicks: int = 1, interval: float = 0.1) -> int:
+        """
+        反复点击区域内的目标图像，直到目标不再出现或达到最大点击次数。
+
+        每轮先用 exists(target, 0) 查找一次，不等待 AutoWaitTimeout，目标不在时立即结束；找到后点击该匹配结果。
+        第一轮同样不等待，目标可能稍后才出现时先调用 wait()。
+
+        Args:
+            target: 图像路径或 Pattern 对象
+            max_clicks: 最大点击次数
+            interval: 两次点击之间的间隔（秒）
+
+        Returns:
+            实际点击的次数：只计入找到目标且 Java 端确认点击成功的轮次，第一轮就找不到目标时返回 0
+        """
+        target = _image_target(target)
+        clicks = 0
+        while clicks < max_clicks:
+            try:
+                match = self._exists(target, 0.0)  # type: ignore
+                if not match or not self._click(match):  # type: ignore
+                    break
+            except Py4JJavaError:
+                # 图片不存在等查找错误，按找不到目标处理
+                break
+            clicks += 1
+            if clicks < max_clicks and interval > 0:
+                time.sleep(interval)
+        return clicks
 
     def double_click(
         self,
@@ -308,6 +549,7 @@ class Region:
         Returns:
             双击次数（通常为 1 次）。若为 0 则表示由于某些原因未能执行点击。
         """
+        _check_key(key)
         psmrl = self._handle_psmrl(psmrl)  # type: ignore
         if psmrl is None:
             # 点击区域中心
@@ -335,6 +577,7 @@ class Region:
         Returns:
             点击的次数（通常为 1）。返回 0 表示由于某些原因未能执行点击。
         """
+        _check_key(key)
         psmrl = self._handle_psmrl(psmrl)  # type: ignore
         if psmrl is None:
             # 点击区域中心
@@ -361,11 +604,11 @@ class Region:
             若鼠标指针可移动至点击点，则返回数字 1。返回 0 表示因某些原因无法执行移动操作。
         """
         psmrl = self._handle_psmrl(psmrl)  # type: ignore
+        hover = get_method(self._raw, 'hover')
         if psmrl is None:
-            # 点击区域中心
-            self._raw.hover()  # type: ignore
-
-        return self._raw.hover(psmrl)  # type: ignore
+            # 悬停在区域中心
+            return hover()  # type: ignore
+        return hover(psmrl)  # type: ignore
 
     def drag_drop(
         self,
@@ -389,7 +632,7 @@ class Region:
 
         return self._raw.dragDrop(drag_from, drop_dest)  # type: ignore
 
-    def mouse_down(self, button: int | None = None) -> int:
+    def mouse_down(self, button: Optional[int] = None) -> int:
         """
         按下鼠标按钮。
 
@@ -397,16 +640,11 @@ class Region:
             button: 按钮常量 Btn.LEFT、Btn.MIDDLE 或 Btn.RIGHT。
 
         Returns:
-            若操作成功则返回数字 1，否则返回 0。
+            若操作成功则返回数字 1，否则返回 0，Java 端异常直接抛出。
         """
-        try:
-            result = self._raw.mouseDown(button) if button else self._raw.mouseDown()  # type: ignore
-            return int(result) if result is not None else 0
-        except Exception as e:
-            logger.error(f'mouse_down 操作失败: {e}')
-            return 0
+        return self._raw.mouseDown() if button is None else self._raw.mouseDown(button)  # type: ignore
 
-    def mouse_up(self, button: int | None = None) -> int:
+    def mouse_up(self, button: Optional[int] = None) -> int:
         """
         释放鼠标按钮。
 
@@ -414,14 +652,9 @@ class Region:
             button: 按钮常量 Btn.LEFT、Btn.MIDDLE 或 Btn.RIGHT。
 
         Returns:
-            若操作成功则返回数字 1，否则返回 0。
+            若操作成功则返回数字 1，否则返回 0，Java 端异常直接抛出。
         """
-        try:
-            result = self._raw.mouseUp(button) if button else self._raw.mouseUp()  # type: ignore
-            return int(result) if result is not None else 0
-        except Exception as e:
-            logger.error(f'mouse_up 操作失败: {e}')
-            return 0
+        return self._raw.mouseUp() if button is None else self._raw.mouseUp(button)  # type: ignore
 
     def mouse_move(
         self,
@@ -468,21 +701,15 @@ class Region:
             steps: 滚动步数。
 
         Returns:
-            操作成功返回 1，失败返回 0。
+            操作成功返回 1，失败返回 0，Java 端异常直接抛出。
         """
         if direction is None:
             direction = Btn.WHEEL_DOWN
-        try:
-            if psmrl is None:
-                # 在区域中心执行滚轮操作
-                result = self._raw.wheel(direction, steps)  # type: ignore
-            else:
-                psmrl = self._handle_psmrl(psmrl)  # type: ignore
-                result = self._raw.wheel(psmrl, direction, steps)  # type: ignore
-            return int(result) if result is not None else 0
-        except Exception as e:
-            logger.error(f'wheel 操作失败: {e}')
-            return 0
+        if psmrl is None:
+            # 在区域中心执行滚轮操作
+            return self._raw.wheel(direction, steps)  # type: ignore
+        psmrl = self._handle_psmrl(psmrl)  # type: ignore
+        return self._raw.wheel(psmrl, direction, steps)  # type: ignore
 
     # ==================== 键盘操作方法 ====================
 
@@ -536,16 +763,12 @@ class Region:
             keys: 一个或多个按键按键常量，Key 类的静态成员变量。
 
         Returns:
-            若操作成功则返回数字 1，否则返回 0。
+            若操作成功则返回数字 1，否则返回 0，Java 端异常直接抛出。
         """
-        try:
-            if isinstance(keys, list):
-                keys = get_cli().list2java_array(keys)  # type: ignore
-            result = self._raw.keyDown(keys)  # type: ignore
-            return int(result) if result is not None else 0
-        except Exception as e:
-            logger.error(f'key_down 操作失败: {e}')
-            return 0
+        if isinstance(keys, list):
+            # SikuliX 的 keyDown/keyUp(String) 逐字符处理，多个按键拼接为一个字符串即可一次传输
+            keys = ''.join(keys)
+        return self._key_down(keys)  # type: ignore
 
     def key_up(self, keys: Union[str, list[str]]) -> int:
         """
@@ -555,16 +778,35 @@ class Region:
             keys: 一个或多个按键按键常量，Key 类的静态成员变量。
 
         Returns:
-            若操作成功则返回数字 1，否则返回 0。
+            若操作成功则返回数字 1，否则返回 0，Java 端异常直接抛出。
         """
-        try:
-            if isinstance(keys, list):
-                keys = get_cli().list2java_array(keys)  # type: ignore
-            result = self._raw.keyUp(keys)  # type: ignore
-            return int(result) if result is not None else 0
-        except Exception as e:
-            logger.error(f'key_up 操作失败: {e}')
-            return 0
+        if isinstance(keys, list):
+            # SikuliX 的 keyDown/keyUp(String) 逐字符处理，多个按键拼接为一个字符串即可一次传输
+            keys = ''.join(keys)
+        return self._key_up(keys)  # type: ignore
+
+    def hotkey(self, *keys: str) -> int:
+        """
+        按下组合键，如 hotkey(Key.CTRL, 'c')。
+
+        修饰键（Key.CTRL、Key.SHIFT、Key.ALT、Key.CMD、Key.WIN）合并为掩码，其余按键作为文本，
+        通过 type(text, modifiers) 一次调用完成按下与释放。
+
+        Args:
+            keys: 修饰键与普通按键，普通按键按传入顺序输入。
+
+        Returns:
+            若操作可执行则返回数字 1，否则返回 0。
+        """
+        masks = _modifier_masks()
+        modifiers = 0
+        text = ''
+        for key in keys:
+            if key in masks:
+                modifiers |= masks[key]
+            else:
+                text += key
+        return self._raw.type(text, modifiers)  # type: ignore
 
     # ==================== 其他方法 ====================
 
@@ -588,6 +830,40 @@ class Region:
         """
         return self._raw.highlight(color)  # type: ignore
 
+    def flash(self, seconds: float = 0.5, color: str = 'red') -> Region:
+        """
+        高亮当前区域指定秒数后自动关闭，由 Java 端控制计时，一次调用代替 highlight() 开关两次。
+
+        Args:
+            seconds: 高亮持续时间（秒），脚本在此期间暂停执行。
+            color: 高亮颜色，取值同 highlight()。
+
+        Returns:
+            当前 Region 对象（支持链式调用）
+        """
+        self._raw.highlight(float(seconds), color)  # type: ignore
+        return self
+
+    @contextlib.contextmanager
+    def highlighted(self, color: str = 'red') -> Iterator[Region]:
+        """
+        在 with 代码块内高亮当前区域，退出时关闭，共两次网关调用。
+
+            with region.highlighted('green'):
+                region.click()
+
+        Args:
+            color: 高亮颜色，取值同 highlight()。
+
+        Returns:
+            当前 Region 对象
+        """
+        self._raw.highlight(color)  # type: ignore
+        try:
+            yield self
+        finally:
+            self._raw.highlightOff()  # type: ignore
+
     def highlight_all_off(self):
         return self._raw.highlightAllOff()  # type: ignore
 
@@ -611,8 +887,12 @@ class Region:
             当前 Region 对象（支持链式调用）
         """
         if isinstance(x_or_location, int) and isinstance(y, int):
+            if self._cw is not None and self._ch is not None:
+                # 宽高已缓存时一次 setRect 完成移动，不必先创建 Java Location 再调用 moveTo
+                return self.set_rect(x_or_location, y, self._cw, self._ch)
             x_or_location = Location(x_or_location, y)
         self._raw.moveTo(x_or_location._raw)  # type: ignore
+        self.invalidate_cache()
         return self
 
     def set_roi(self, x: int, y: int, w: int, h: int) -> Region:
@@ -629,12 +909,15 @@ class Region:
             当前 Region 对象（支持链式调用）
         """
         self._raw.setROI(x, y, w, h)  # type: ignore
+        self.invalidate_cache()
         return self
 
     def set_rect(self, x: int, y: int, w: int, h: int) -> Region:
         """
         将改变区域的位置或大小（移动或缩放）。
 
+        同时修改多个值时比 set_x().set_y().set_w().set_h() 链式调用少三次网关往返。
+
         Args:
             x: 新的 X 坐标
             y: 新的 Y 坐标
@@ -644,7 +927,8 @@ class Region:
         Returns:
             当前 Region 对象（支持链式调用）
         """
-        self._raw.setRect(x, y, w, h)  # type: ignore
+        get_method(self._raw, 'setRect')(x, y, w, h)
+        self.invalidate_cache()
         return self
 
     # 区域内查找与等待视觉事件
@@ -658,18 +942,15 @@ class Region:
         Returns:
             找到的第一个匹配结果，未找到返回 None
         """
-        if isinstance(target, str):
-            target = pathlib.Path(target)
-        if isinstance(target, pathlib.Path):
-            target = str(target.absolute())
-        if isinstance(target, Pattern):
-            target = target._raw  # type: ignore
-
+        target = _image_target(target)
+        # Java 端 find 未找到时抛出 FindFailed，异常要在 JVM 构造堆栈再经网关传回；
+        # exists 同样按 AutoWaitTimeout 等待，未找到直接返回 null，省去异常开销
         try:
-            result = self._raw.find(target)  # type: ignore
+            result = self._exists(target)  # type: ignore
         except Py4JJavaError:
+            # 图片文件无法读取等其它错误
             return None
-        return Match(result)  # type: ignore
+        return Match._from_raw(result) if result else None
 
     def find_all(self, target: Union[str, pathlib.Path, Pattern]) -> list[Match]:
         """
@@ -681,90 +962,155 @@ class Region:
         Returns:
             所有匹配结果的列表
         """
-        if isinstance(target, str):
-            target = pathlib.Path(target)
-        if isinstance(target, pathlib.Path):
-            target = str(target.absolute())
-        if isinstance(target, Pattern):
-            target = target._raw  # type: ignore
-        results = self._raw.findAll(target)  # type: ignore
-        matches = []
-
-        while results.hasNext():  # type: ignore
-            matches.append(Match(results.next()))  # type: ignore
-        return matches
+        target = _image_target(target)
+        return _collect_match_list(get_method(self._raw, 'findAllList')(target))
+
+    def find_any(self, targets: list[Union[str, pathlib.Path, Pattern]]) -> list[Match]:
+        """
+        在区域内同时查找多个目标图像，返回找到的全部结果。
+
+        由 Java 端 Region.findAnyList 完成，多个目标共用同一次截图，整个调用只有一次查找往返。
+
+        Args:
+            targets: 图像路径或 Pattern 对象的列表
+
+        Returns:
+            找到的匹配结果列表，Match.get_index() 对应目标在 targets 中的下标
+        """
+        java_targets = get_cli().list2java_array([_image_target(target) for target in targets])
+        return _collect_match_list(get_method(self._raw, 'findAnyList')(java_targets))
+
+    def find_best(self, targets: list[Union[str, pathlib.Path, Pattern]]) -> Optional[Match]:
+        """
+        在区域内同时查找多个目标图像，返回相似度最高的结果。
+
+        Args:
+            targets: 图像路径或 Pattern 对象的列表
+
+        Returns:
+            相似度最高的匹配结果，全部未找到返回 None
+        """
+        java_targets = get_cli().list2java_array([_image_target(target) for target in targets])
+        result = get_method(self._raw, 'findBestList')(java_targets)
+        return Match._from_raw(result) if result else None
 
     def find_multi_color(
         self,
         color_str: str,
         similarity: float = 0.7,
     ) -> Match | None:
-        from py_sikulix.extend import CrossPlatformFinder
-
-        finder = CrossPlatformFinder()
-        ret = finder.find_multi_color(color_str, similarity, (self.x, self.y, self.w, self.h))
+        finder = _get_finder()
+        ret = finder.find_multi_color(color_str, similarity, self.get_bounds())
         if not ret:
             return None
-        return Match(get_cli().Match(Region(ret[0][0], ret[0][1], ret[0][2], ret[0][3])._raw, ret[1]))  # type: ignore
+        return Match.new_by_score(ret[0][0], ret[0][1], ret[0][2], ret[0][3], ret[1])
 
-    def wait(self, target: Union[str, pathlib.Path, Pattern], timeout: float = 30) -> Optional[Match]:
+    def find_all_of(self, targets: list[Union[str, pathlib.Path]], similarity: float = 0.7) -> list[list[Match]]:
+        """
+        在区域内查找多个模板图像的全部位置，由 Python 端 OpenCV 完成匹配，所有模板共用一次截图。
+
+        需要安装 extend 模块的依赖（opencv-python、mss、numpy）。只负责图像匹配，不读取 Pattern 的相似度等设置。
+
+        Args:
+            targets: 模板图像路径列表
+            similarity: 相似度阈值 (0.0-1.0)
+
+        Returns:
+            与 targets 一一对应的匹配结果列表，每项按相似度从高到低排列
+        """
+        finder = _get_finder()
+        results = finder.find_templates(targets, similarity, self.get_bounds())
+        return [[Match.new_by_score(*rect, score) for rect, score in matches] for matches in results]
+
+    def wait(
+        self, target: Union[str, pathlib.Path, Pattern], timeout: float = 30, scan_rate: Optional[float] = None
+    ) -> Optional[Match]:
         """
         等待目标图像出现在区域内。
 
         Args:
             target: 要等待的图像路径或 Pattern 对象
             timeout: 最大等待时间（秒）
+            scan_rate: 每秒查找次数，只对本次调用生效，返回前恢复区域原来的设置；None 时沿用区域当前设置
 
         Returns:
             找到的匹配结果，超时未找到返回 None
         """
-        if isinstance(target, str):
-            target = pathlib.Path(target)
-        if isinstance(target, pathlib.Path):
-            target = str(target.absolute())
-        if isinstance(target, Pattern):
-            target = target._raw  # type: ignore
-        current_time = time.time()
-        while True:
-            result = None
-            with contextlib.suppress(Py4JJavaError):
-                result = self._raw.find(target)  # type: ignore
-            if result:
-                return Match(result)
-            if current_time + timeout < time.time():
-                break
-            time.sleep(0.2)
-        return None
+        target = _image_target(target)
+        # 交给 Java 端 Region.wait 按扫描频率等待，整个过程只有一次网关往返；超时抛出 FindFailed
+        with self._scan_rate_override(scan_rate):
+            try:
+                result = get_method(self._raw, 'wait')(target, float(timeout))
+            except Py4JJavaError:
+                return None
+        return Match._from_raw(result) if result else None
 
-    def wait_vanish(self, target: Union[str, pathlib.Path, Pattern], timeout: float = 30.0) -> bool:
+    def wait_vanish(
+        self, target: Union[str, pathlib.Path, Pattern], timeout: float = 30.0, scan_rate: Optional[float] = None
+    ) -> bool:
         """
         等待目标图像从区域内消失。
 
         Args:
             target: 要等待消失的图像路径或 Pattern 对象
             timeout: 最大等待时间（秒）
+            scan_rate: 每秒查找次数，只对本次调用生效，返回前恢复区域原来的设置；None 时沿用区域当前设置
 
         Returns:
-            目标消失返回 True，其他情况返回 False
+            目标消失返回 True，超时仍未消失返回 False；查找出错（如图片不存在）时视为已消失，返回 True
+        """
+        target = _image_target(target)
+        # 交给 Java 端 Region.waitVanish 等待，整个过程只有一次网关往返
+        with self._scan_rate_override(scan_rate):
+            try:
+                return bool(get_method(self._raw, 'waitVanish')(target, float(timeout)))
+            except Py4JJavaError:
+                # 与查找失败一致：找不到目标（如图片不存在）视为已消失
+                return True
+
+    @contextlib.contextmanager
+    def _scan_rate_override(self, scan_rate: Optional[float]) -> Iterator[None]:
         """
-        if isinstance(target, str):
-            target = pathlib.Path(target)
-        if isinstance(target, pathlib.Path):
-            target = str(target.absolute())
-        if isinstance(target, Pattern):
-            target = target._raw  # type: ignore
+        在代码块内临时使用指定的扫描频率，退出时（包括出错时）恢复原来的设置；scan_rate 为 None 时不做修改。
 
-        current_time = time.time()
-        while True:
-            result = None
-            with contextlib.suppress(Py4JJavaError):  # 不存在图片会直接抛出异常
-                result = self._raw.find(target)  # type: ignore
-            if not result:
-                return True
-            if current_time + timeout < time.time():
-                break
-            time.sleep(0.2)
-        return False
+        Args:
+            scan_rate: 每秒查找次数
+        """
+        if scan_rate is None:
+            yield
+            return
+        previous = self.get_wait_scan_rate()
+        self.set_wait_scan_rate(scan_rate)
+        try:
+            yield
+        finally:
+            get_method(self._raw, 'setWaitScanRate')(float(previous))
+
+    def set_wait_scan_rate(self, rate: float) -> Region:
+        """
+        设置本区域 wait()、wait_vanish() 每秒查找的次数，只影响本区域。
+
+        频率越高发现目标越快，CPU 占用也越高；SikuliX 默认每秒 3 次。
+
+        Args:
+            rate: 每秒查找次数，必须大于 0
+
+        Returns:
+            当前 Region 对象（支持链式调用）
+        """
+        if rate <= 0:
+            raise ValueError('"rate" must be greater than 0.')
+        get_method(self._raw, 'setWaitScanRate')(float(rate))
+        return self
+
+    def get_wait_scan_rate(self) -> float:
+        """
+        获取本区域 wait()、wait_vanish() 每秒查找的次数。
+
+        Returns:
+            每秒查找次数
+        """
+        return get_method(self._raw, 'getWaitScanRate')()  # type: ignore
 
     def exists(self, target: Union[str, pathlib.Path, Pattern]) -> Optional[Match]:
         """
@@ -777,15 +1123,34 @@ class Region:
         Returns:
             找到的匹配结果，超时未找到返回 None
         """
-        if isinstance(target, str):
-            target = pathlib.Path(target)
-        if isinstance(target, pathlib.Path):
-            target = str(target.absolute())
-        if isinstance(target, Pattern):
-            target = target._raw  # type: ignore
+        target = _image_target(target)
+        result = self._exists(target)  # type: ignore
+        return Match._from_raw(result) if result else None
+
+    def exists_async(
+        self, target: Union[str, pathlib.Path, Pattern], timeout: Optional[float] = None
+    ) -> Future[Optional[Match]]:
+        """
+        在后台线程中执行 exists()，立即返回 Future，可同时等待多个区域或目标：
+
+            futures = [r.exists_async('button.png', 10) for r in regions]
+            for future in concurrent.futures.as_completed(futures):
+                if match := future.result():
+                    break
 
-        result = self._raw.exists(target)  # type: ignore
-        return Match(result) if result else None
+        py4j 为每个线程使用独立连接，多个查找在 Java 端并行执行。已开始的查找无法通过 Future.cancel() 中止，
+        会一直运行到找到目标或超时。
+
+        Args:
+            target: 要检查的图像路径或 Pattern 对象
+            timeout: 超时时间（秒），None 时使用区域的 AutoWaitTimeout
+
+        Returns:
+            结果为匹配对象或 None 的 Future
+        """
+        target = _image_target(target)
+        args = (target,) if timeout is None else (target, float(timeout))
+        return _EXECUTOR.submit(_exists_match, self._exists, args)
 
     def get_last_match(self) -> Optional[Match]:
         """
@@ -798,7 +1163,7 @@ class Region:
             最后一次匹配结果，无匹配返回 None
         """
         result = self._raw.getLastMatch()  # type: ignore
-        return Match(result) if result else None
+        return Match._from_raw(result) if result else None
 
     def get_last_matches(self) -> list[Match]:
         """
@@ -810,14 +1175,24 @@ class Region:
         Returns:
             所有匹配结果的列表
         """
-        results = self._raw.getLastMatches()  # type: ignore
-        matches = []
-        for r in results:  # type: ignore
-            matches.append(Match(r))
-        return matches
+        return _collect_matches(self._raw.getLastMatches())  # type: ignore
 
     # 区域内动作操作
 
+    def _derive(self, method: str, arg: Optional[int] = None) -> Region:
+        """
+        调用 Java 端返回新区域的方法（above、grow 等），直接包装结果。
+
+        Args:
+            method: Java Region 的方法名
+            arg: 方法参数，None 时调用无参版本
+
+        Returns:
+            新的区域对象
+        """
+        java_method = get_method(self._raw, method)
+        return Region._from_raw(java_method() if arg is None else java_method(arg))
+
     def above(self, height: Optional[int] = None) -> Region:
         """
         创建当前区域上方的新区域。
@@ -828,9 +1203,7 @@ class Region:
         Returns:
             当前区域上方的新区域对象
         """
-        if height is None:
-            return Region(self._raw.above())  # type: ignore
-        return Region(self._raw.above(height))  # type: ignore
+        return self._derive('above', height)
 
     def below(self, height: Optional[int] = None) -> Region:
         """
@@ -842,9 +1215,7 @@ class Region:
         Returns:
             当前区域下方的新区域对象
         """
-        if height is None:
-            return Region(self._raw.below())  # type: ignore
-        return Region(self._raw.below(height))  # type: ignore
+        return self._derive('below', height)
 
     def left(self, width: Optional[int] = None) -> Region:
         """
@@ -856,9 +1227,7 @@ class Region:
         Returns:
             当前区域左侧的新区域对象
         """
-        if width is None:
-            return Region(self._raw.left())  # type: ignore
-        return Region(self._raw.left(width))  # type: ignore
+        return self._derive('left', width)
 
     def right(self, width: Optional[int] = None) -> Region:
         """
@@ -870,9 +1239,7 @@ class Region:
         Returns:
             当前区域右侧的新区域对象
         """
-        if width is None:
-            return Region(self._raw.right())  # type: ignore
-        return Region(self._raw.right(width))  # type: ignore
+        return self._derive('right', width)
 
     def nearby(self, range: int = 50) -> Region:
         """
@@ -884,7 +1251,7 @@ class Region:
         Returns:
             扩展后的新区域对象
         """
-        return Region(self._raw.nearby(range))  # type: ignore
+        return self._derive('nearby', range)
 
     def grow(self, range: int = 50) -> Region:
         """
@@ -896,7 +1263,7 @@ class Region:
         Returns:
             扩展后的新区域对象
         """
-        return Region(self._raw.grow(range))  # type: ignore
+        return self._derive('grow', range)
 
     def __repr__(self) -> str:
         """
@@ -905,7 +1272,8 @@ class Region:
         Returns:
             对象的字符串表示
         """
-        return f'<class {self.__class__.__name__} at {hex(id(self))}, [{self.x},{self.y} {self.w}x{self.h}]>'
+        x, y, w, h = self.get_bounds()
+        return f'<class {self.__class__.__name__} at {hex(id(self))}, [{x},{y} {w}x{h}]>'
 
 
 class Match(Region):
@@ -913,9 +1281,20 @@ class Match(Region):
     Match 类表示图像匹配成功后返回的结果，包含匹配区域的位置和置信度信息。
     """
 
+    # find_all 等一次可能返回大量结果，与 Region 一样使用 __slots__ 不创建实例字典
+    __slots__ = ('_get_score', '_score')
+
+    def _bind_methods(self) -> None:
+        super()._bind_methods()
+        self._get_score = get_method(self._raw, 'getScore')
+        self._score: Optional[float] = None
+
     @classmethod
-    def new_by_score(cls, x: int, y: int, w: int, h: int, score: float):
-        return cls(get_cli().Match(get_cli().Region(x, y, w, h), score))  # type: ignore
+    def new_by_score(cls, x: int, y: int, w: int, h: int, score: float) -> Match:
+        match = cls(get_cli().Match(get_cli().Region(x, y, w, h), score))  # type: ignore
+        # 分数已知，直接写入缓存
+        match._score = float(score)
+        return match
 
     def get_target(self) -> Location:
         """
@@ -924,7 +1303,19 @@ class Match(Region):
         Returns:
             匹配目标的位置对象
         """
-        return self._raw.getTarget()  # type: ignore
+        return Location._from_raw(get_method(self._raw, 'getTarget')())
+
+    @property
+    def score(self) -> float:
+        """
+        匹配的相似度评分，匹配结果的分数不会变化，首次读取后缓存，排序、比较时不再访问 Java。
+
+        Returns:
+            匹配分数，范围 0.0-1.0
+        """
+        if self._score is None:
+            self._score = self._get_score()
+        return self._score  # type: ignore
 
     def get_score(self) -> float:
         """
@@ -933,7 +1324,16 @@ class Match(Region):
         Returns:
             匹配分数，范围 0.0-1.0
         """
-        return self._raw.getScore()  # type: ignore
+        return self.score
+
+    def get_index(self) -> int:
+        """
+        获取 find_any() 结果对应的目标下标。
+
+        Returns:
+            目标在传入列表中的下标
+        """
+        return get_method(self._raw, 'getIndex')()  # type: ignore
 
     def __lt__(self, other: Match) -> bool:
         """
@@ -945,7 +1345,7 @@ class Match(Region):
         Returns:
             当前分数是否小于另一个
         """
-        return self.get_score() < other.get_score()
+        return self.score < other.score
 
     def __le__(self, other: Match) -> bool:
         """
@@ -957,7 +1357,7 @@ class Match(Region):
         Returns:
             当前分数是否小于等于另一个
         """
-        return self.get_score() <= other.get_score()
+        return self.score <= other.score
 
     def __gt__(self, other: Match) -> bool:
         """
@@ -969,7 +1369,7 @@ class Match(Region):
         Returns:
             当前分数是否大于另一个
         """
-        return self.get_score() > other.get_score()
+        return self.score > other.score
 
     def __ge__(self, other: Match) -> bool:
         """
@@ -981,7 +1381,7 @@ class Match(Region):
         Returns:
             当前分数是否大于等于另一个
         """
-        return self.get_score() >= other.get_score()
+        return self.score >= other.score
 
     def __eq__(self, other: object) -> bool:
         """
@@ -995,7 +1395,7 @@ class Match(Region):
         """
         if not isinstance(other, Match):
             raise ValueError("the 'Match' class cannot be compared with other classes.")
-        return self.get_score() == other.get_score()
+        return self.score == other.score
 
     def __repr__(self) -> str:
         """
@@ -1004,7 +1404,97 @@ class Match(Region):
         Returns:
             对象的字符串表示
         """
-        return f'<class {self.__class__.__name__} at {hex(id(self))}, [{self.x},{self.y} {self.w}x{self.h}] S:{self.get_score():.4f}>'
+        x, y, w, h = self.get_bounds()
+        return f'<class {self.__class__.__name__} at {hex(id(self))}, [{x},{y} {w}x{h}] S:{self.score:.4f}>'
+
+
+# exists_async() 使用的线程池，线程在首次提交时才创建
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='py-sikulix')
+
+
+def _exists_match(exists: Callable[..., Any], args: tuple[Any, ...]) -> Optional[Match]:
+    result = exists(*args)
+    return Match._from_raw(result) if result else None
+
+
+def _collect_matches(results: Optional[JavaObject]) -> list[Match]:
+    """
+    取出 Java 端 Match 迭代器中的全部结果。
+
+    只调用 next()，每个结果一次网关往返，不再为每个结果额外调用 hasNext()。
+
+    Args:
+        results: Java 端返回的 Match 迭代器，可以为 None
+
+    Returns:
+        所有匹配结果的列表
+    """
+    matches: list[Match] = []
+    if results is None:
+        return matches
+    next_match = get_method(results, 'next')
+    # 迭代结束时 SikuliX 返回 null，标准迭代器则抛出 NoSuchElementException
+    with contextlib.suppress(Py4JJavaError):
+        while (raw := next_match()) is not None:
+            matches.append(Match._from_raw(raw))
+    return matches
+
+
+def _collect_match_list(results: Optional[JavaObject]) -> list[Match]:
+    """
+    取出 Java 端 Match 列表中的全部结果，并预先填入每个结果的坐标缓存。
+
+    py4j 只能逐个取回对象引用，每个结果仍需一次 get()；列表的 toString() 一次往返带回全部结果的 x、y、w、h，
+    之后读取坐标、排序、点击不必再为每个结果调用 getRect()。toString() 格式无法识别时不填缓存。
+
+    Args:
+        results: Java 端返回的 Match 列表，可以为 None
+
+    Returns:
+        所有匹配结果的列表
+    """
+    if results is None:
+        return []
+    size = get_method(results, 'size')()
+    if not size:
+        return []
+    rects = _MATCH_RECT_RE.findall(get_method(results, 'toString')())
+    get = get_method(results, 'get')
+    matches = [Match._from_raw(get(i)) for i in range(size)]
+    if len(rects) == size:
+        for match, (x, y, w, h) in zip(matches, rects):
+            match._cx, match._cy, match._cw, match._ch = int(x), int(y), int(w), int(h)
+    return matches
+
+
+def _psmrl_from_path(psmrl: Union[str, pathlib.Path]) -> str:
+    return abs_path_str(str(psmrl))
+
+
+def _psmrl_from_raw(psmrl: _RawBacked) -> JavaObject:
+    return psmrl._raw
+
+
+def _psmrl_keep(psmrl: Any) -> Any:
+    return psmrl
+
+
+# _handle_psmrl 的类型分派表：字符串与路径转换为绝对路径，封装对象（Match, Pattern, Region, Location）取出原始 Java 对象，
+# 其它 _RawBacked 子类在首次出现时经 isinstance 匹配到 _RawBacked 后登记
+_PSMRL_DISPATCH: dict[type, Callable[[Any], Any]] = {
+    str: _psmrl_from_path,
+    pathlib.PosixPath: _psmrl_from_path,
+    pathlib.WindowsPath: _psmrl_from_path,
+    Pattern: _psmrl_from_raw,
+    Location: _psmrl_from_raw,
+    Region: _psmrl_from_raw,
+    Match: _psmrl_from_raw,
+    JavaObject: _psmrl_keep,
+    _RawBacked: _psmrl_from_raw,
+}
+# isinstance 查找使用导入时的快照：_PSMRL_DISPATCH 运行中会登记新类型，其他线程（如 _EXECUTOR）同时遍历会报错
+_PSMRL_BASES: tuple[tuple[type, Callable[[Any], Any]], ...] = tuple(_PSMRL_DISPATCH.items())
+_PSMRL_LOCK = threading.Lock()
 
 
 class ObserveEvent:
@@ -1014,233 +1504,3 @@ class ObserveEvent:
 
     def __init__(self, java_instance):
         raise NotImplementedError()
-
-
-if __name__ == '__main__':
-    # 示例代码 - Region 类测试示例
-
-    import pathlib
-    import time
-
-    from py_sikulix.keys import Btn, Key
-
-    # ============================================
-    # 第一部分: Region 基础操作示例
-    print('=' * 60)
-    print('第一部分: Region 基础操作示例')
-    print('=' * 60)
-
-    # 示例1: 创建 Region 对象
-    region = Region(100, 100, 300, 200)
-    print(f'创建区域: 位置({region.x}, {region.y}), 大小({region.w}x{region.h})')
-    # # 示例2: 获取和设置 Region 属性
-    # bounds = region.get_bounds()
-    # print(f'区域边界: x={bounds[0]}, y={bounds[1]}, w={bounds[2]}, h={bounds[3]}')
-    # center = region.get_center()
-    # print(f'区域中心: ({center.x}, {center.y})')
-    # # 示例3: 修改 Region 属性（链式调用）
-    # region.set_x(200).set_y(150).set_w(400).set_h(300)
-    # print(f'改后区域: 位置({region.x}, {region.y}), 大小({region.w}x{region.h})')
-    # region.set_rect(50, 50, 500, 400)
-    # print(f'set_rect后: 位置({region.x}, {region.y}), 大小({region.w}x{region.h})')
-    # print(
-    #     f'左上角位置点：{region.get_top_left()}，左下角位置点：{region.get_bottom_left()}，右上角位置点：{region.get_top_right()}，右上角位置点：{region.get_bottom_right()}，'
-    # )
-    # region.set_roi(10, 10, 200, 100)
-    # print('设置ROI区域')
-    # # 示例4: Region 创建方法（above, below, left, right, nearby, grow）
-    # new_region = Region(0, 0, 300, 300)
-    # print(f'基础区域: ({new_region.x}, {new_region.y}), {new_region.w}x{new_region.h}')
-    # above_region = new_region.above(50)
-    # print(f'上方区域: ({above_region.x}, {above_region.y}), {above_region.w}x{above_region.h}')
-    # below_region = new_region.below(50)
-    # print(f'下方区域: ({below_region.x}, {below_region.y}), {below_region.w}x{below_region.h}')
-    # left_region = new_region.left(50)
-    # print(f'左侧区域: ({left_region.x}, {left_region.y}), {left_region.w}x{left_region.h}')
-    # right_region = new_region.right(50)
-    # print(f'右侧区域: ({right_region.x}, {right_region.y}), {right_region.w}x{right_region.h}')
-    # grown_region = new_region.grow(25)
-    # print(f'扩展区域: ({grown_region.x}, {grown_region.y}), {grown_region.w}x{grown_region.h}')
-    # new_region.highlight()
-    # print(f'高亮当前区域: {new_region}')
-
-    # # 第二部分: Region 交互操作示例
-    # print('=' * 60)
-    # print('第二部分: Region 鼠标操作示例')
-    # print('=' * 60)
-    # # 示例1: 点击类操作
-    # print(f'点击区域中心：{region.click()}')
-    # time.sleep(1)
-    # print(f'左键点击区域图像：{region.click(Pattern("examples/RecycleBin.png"))}')
-    # time.sleep(1)
-    print(f'右键点击区域中心（无效）：{region.click(key=Btn.RIGHT)}')
-    # time.sleep(1)
-    # print(f'双击区域图像：{region.double_click()}')
-    # time.sleep(1)
-    # print(f'右键点击区域图像：{region.right_click(Pattern("examples/RecycleBin.png"))}')
-    # time.sleep(1)
-    # print('点击100,100位置：region.click(Location(100, 100))')
-    # time.sleep(1)
-    # match = region.find_multi_color(
-    #     'f9fafb|030303,-9|10|7885e2|030303,-3|25|5e41c9|030303,-4|11|5950d9|030303,-1|10|5750d9|030303,-11|31|e4ddf6|030303,9|14|38cfdb|030303'
-    # )
-    # if match:
-    #     print(f'找到匹配项：{match}')
-    # else:
-    #     print('未找到匹配项')
-
-    # # 示例2: 移动类操作
-    # print(f'移动鼠标到目标图像：{region.hover(Pattern("examples/RecycleBin.png"))}')
-    # time.sleep(1)
-    # print(f'拖动到目标位置：{region.drag_drop(Pattern("examples/RecycleBin.png"), Location(200, 200))}')
-    # time.sleep(1)
-    # print(f'左键按下（不松开）：{region.mouse_down()}')
-    # time.sleep(1)
-    # print(f'鼠标移动相对当前点30,30位置：{region.mouse_move(30, 30)}')
-    # time.sleep(1)
-    # print(f'左键松开：{region.mouse_up()}')
-    # time.sleep(1)
-    # print(f'鼠标移动指定100,100位置：{region.mouse_move(Location(100, 100))}')
-    # time.sleep(1)
-    # print(f'右键按下（不松开）：{region.mouse_down(Btn.RIGHT)}')
-    # time.sleep(1)
-    # print(f'右键松开：{region.mouse_up(Btn.RIGHT)}')
-    # time.sleep(1)
-    # print(f'鼠标滚动：{region.wheel(Location(600, 600))}')
-    # time.sleep(1)
-
-    # # # 示例3: 键盘类操作
-    print(f'按键按下（无效）：{region.key_down(Key.WIN)}')
-    print(f'组合按键：{region.type("r")}')
-    print(f'按键松开（无效）：{region.key_up(Key.WIN)}')
-    # time.sleep(1)
-    # print(f'输入文本：{region.type("notepad")}')
-    # print(f'输入文本（无效）：{region.type(Key.ENTER)}')
-    # time.sleep(1)
-    # print(f'粘贴文本：{region.paste("你好中国，See u")}')
-    # time.sleep(1)
-    # print(f'文本提取（效果差）：{region.text()}')
-    # time.sleep(1)
-
-    # new_region.highlight_all_off()
-
-    # 示例代码 - Match 类测试示例
-    # from py_sikulix.screen import Screen
-
-    # # 创建屏幕实例
-    # screen = Screen()
-
-    # # ============================================
-    # # 示例1: 查找图像并获取 Match 对象
-    # print('=' * 50)
-    # print('示例1: 查找图像并获取 Match 对象')
-    # print('=' * 50)
-
-    # # 查找图像（需要先准备好测试图像）
-    # image_path = pathlib.Path('examples/RecycleBin.png')
-    # print('图像状态：', image_path.exists(), image_path.absolute())
-    # match = screen.find(image_path)
-
-    # if match:
-    #     print(f'找到匹配！左上角坐标: ({match.x}, {match.y}), 大小: {match.w}x{match.h}')
-    # else:
-    #     print('未找到匹配')
-
-    # # ============================================
-    # # 示例2: 获取匹配分数 (get_score)
-    # print('\n' + '=' * 50)
-    # print('示例2: 获取匹配分数')
-    # print('=' * 50)
-
-    # if match:
-    #     score = match.get_score()
-    #     print(f'匹配分数: {score:.4f} (范围 0.0-1.0)')
-
-    #     if score > 0.9:
-    #         print('高置信度匹配！')
-    #     elif score > 0.7:
-    #         print('中等置信度匹配')
-    #     else:
-    #         print('低置信度匹配')
-
-    # # ============================================
-    # # 示例3: 获取点击目标位置 (get_target)
-    # print('\n' + '=' * 50)
-    # print('示例3: 获取点击目标位置')
-    # print('=' * 50)
-
-    # if match:
-    #     target = match.get_target()
-    #     print(f'点击目标位置: ({target.x}, {target.y})')
-
-    # # ============================================
-    # # 示例4: Match 继承自 Region 的属性和方法
-    # print('\n' + '=' * 50)
-    # print('示例4: Match 继承自 Region 的属性')
-    # print('=' * 50)
-
-    # if match:
-    #     print(f'区域左上角: ({match.x}, {match.y})')
-    #     print(f'区域大小: {match.w} x {match.h}')
-
-    #     center = match.get_center()
-    #     print(f'区域中心: ({center.x}, {center.y})')
-
-    # # ============================================
-    # # 示例5: 比较运算符 - 比较两个 Match 的分数
-    # print('\n' + '=' * 50)
-    # print('示例5: 比较运算符')
-    # print('=' * 50)
-
-    # match_raw = screen.find('examples/RecycleBin.png')
-    # match_trn = screen.find('examples/RecycleBin_Transparent.png')
-    # print(match_raw, match_trn)
-
-    # if match_raw and match_trn:
-    #     score1 = match_raw.get_score()
-    #     score2 = match_trn.get_score()
-
-    #     print(f'MatchRaw 分数: {score1:.4f}')
-    #     print(f'MatchRrn 分数: {score2:.4f}')
-
-    #     if match_raw > match_trn:
-    #         print('MatchRaw 的分数更高 (MatchRaw > MatchRrn)')
-    #     elif match_raw < match_trn:
-    #         print('MatchRrn 的分数更高 (MatchRaw < MatchRrn)')
-    #     else:
-    #         print('两个匹配分数相同 (MatchRaw == MatchRrn)')
-
-    #     print(f'MatchRaw >= MatchRrn: {match_raw >= match_trn}')
-    #     print(f'MatchRaw <= MatchRrn: {match_raw <= match_trn}')
-
-    # # ============================================
-    # # 示例6: 使用 find_all 获取多个 Match 并排序
-    # print('\n' + '=' * 50)
-    # print('示例6: 获取多个匹配并按分数排序')
-    # print('=' * 50)
-
-    # matches = screen.find_all('examples/RecycleBin_Transparent.png')
-    # if matches:
-    #     print(f'找到 {len(matches)} 个匹配')
-
-    #     sorted_matches = sorted(matches, key=lambda m: m.get_score(), reverse=True)
-
-    #     for i, m in enumerate(sorted_matches):
-    #         print(f'匹配 {i + 1}: 分数={m.get_score():.4f}, 位置=({m.x}, {m.y})')
-
-    #     best_match = sorted_matches[0]
-    #     print(f'\n最佳匹配: 分数={best_match.get_score():.4f}')
-
-    # # ============================================
-    # # 示例7: Match 与 Pattern 配合使用
-    # print('\n' + '=' * 50)
-    # print('示例7: Match 与 Pattern 配合使用')
-    # print('=' * 50)
-
-    # pattern = Pattern('examples/RecycleBin_Transparent.png').set_similar(0.9)
-
-    # match = screen.find(pattern)
-    # if match:
-    #     print(f'使用 Pattern 找到匹配，分数: {match.get_score():.4f}，位置: ({match.x}, {match.y})')
-    #     match.click()
-    # print('\n所有示例完成！')
@@ -4,12 +4,32 @@ SikuliX Setting 类封装
 接口参考：https://javadoc.io/static/com.sikulix/sikulixapi/2.0.5/org/sikuli/basics/Setting.html
 """
 
+import contextlib
 import logging
+from collections.abc import Iterator
+from typing import Any, Callable
+
+from py4j.java_gateway import get_method
 
 from py_sikulix.client import get_cli
 
 logger = logging.getLogger(__name__)
 
+# Java 字段类型 -> (java.lang.reflect.Field 写入方法, Python 值转换)，其余类型使用 Field.set
+_FIELD_SETTERS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    'boolean': ('setBoolean', bool),
+    'int': ('setInt', int),
+    'float': ('setFloat', float),
+    'double': ('setDouble', float),
+}
+
+# 从 Java 端读回的设置值，所有 Setting 对象共用，再次读取时不再访问网关
+_CACHE: dict[str, Any] = {}
+
+# Java 端会自行修改的字段不缓存，每次都从 Java 端读取：ClickDelay、TypeDelay 和拖动延迟只对下一次操作生效，
+# 操作完成后由 SikuliX 重置
+_UNCACHED = frozenset({'ClickDelay', 'TypeDelay', 'DelayBeforeMouseDown', 'DelayBeforeDrag', 'DelayBeforeDrop'})
+
 
 class Setting:
     """
@@ -17,12 +37,93 @@ class Setting:
     如最小相似度、图像缩放、等待时间等。这些设置会影响整个应用程序的行为。
     """
 
+    __slots__ = ('_raw', '_throw_exception', '_dirty', '_writers')
+
     def __init__(self):
         """
         初始化 Setting 对象。
         """
         self._raw = get_cli().Settings  # type: ignore
         self._throw_exception = False
+        # batch() 期间暂存的写入，None 表示立即写入
+        self._dirty: dict[str, Any] | None = None
+        self._writers: dict[str, Callable[[Any], None]] = {}
+
+    def _get(self, name: str) -> Any:
+        """读取 Settings 静态字段，batch() 期间优先返回暂存的写入，其余首次读取后缓存在 Python 端。"""
+        if self._dirty is not None and name in self._dirty:
+            return self._dirty[name]
+        if name in _UNCACHED:
+            return getattr(self._raw, name)
+        try:
+            return _CACHE[name]
+        except KeyError:
+            value = _CACHE[name] = getattr(self._raw, name)
+            return value
+
+    def _set(self, name: str, value: Any) -> None:
+        """写入 Settings 静态字段，batch() 期间只记录，退出时统一写入。"""
+        if self._dirty is None:
+            self._write(name, value)
+        else:
+            self._dirty[name] = value
+
+    def _write(self, name: str, value: Any) -> None:
+        """
+        通过反射写入 Java 静态字段，写入后清除该字段的缓存，下次读取时取回 Java 端转换后的值。
+
+        py4j 的 JavaClass 不支持给静态字段赋值，直接赋值只会在 Python 代理对象上新增属性。
+        首次写入某个字段时解析 Field 对象和写入方法（几次往返），之后每次写入只需一次往返。
+        """
+        writer = self._writers.get(name)
+        if writer is None:
+            writer = self._writers[name] = self._make_writer(name)
+        writer(value)
+        _CACHE.pop(name, None)
+
+    def _make_writer(self, name: str) -> Callable[[Any], None]:
+        """解析 Java 静态字段的 Field 对象和写入方法，返回写入函数。"""
+        field = get_cli().jvm.java.lang.Class.forName(self._raw._fqn).getField(name)  # type: ignore
+        method, convert = _FIELD_SETTERS.get(field.getType().getName(), ('set', lambda v: v))  # type: ignore
+        setter = get_method(field, method)
+
+        def writer(v: Any) -> None:
+            setter(None, convert(v))
+
+        return writer
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator['Setting']:
+        """
+        批量修改设置，代码块内的写入只在本对象暂存，退出时每个字段只写入最后一次的值：
+
+            with setting.batch():
+                setting.min_similarity = 0.8
+                setting.move_mouse_delay = 0
+
+        代码块抛出异常时放弃暂存的写入。
+        """
+        if self._dirty is not None:
+            # 嵌套调用并入外层批次
+            yield self
+            return
+        self._dirty = {}
+        try:
+            yield self
+        except BaseException:
+            self._dirty = None
+            raise
+        dirty, self._dirty = self._dirty, None
+        for name, value in dirty.items():
+            self._write(name, value)
+
+    def invalidate_cache(self) -> None:
+        """
+        清空所有 Setting 对象共用的设置值缓存，下次读取时重新从 Java 端获取。
+
+        Java 端（如 SikuliX 脚本）直接修改了全局设置后调用。
+        """
+        _CACHE.clear()
 
     @property
     def action_logs(self) -> bool:
@@ -32,7 +133,7 @@ class Setting:
         Returns:
             bool: True表示启用动作日志，False表示禁用
         """
-        return self._raw.ActionLogs  # type: ignore
+        return self._get('ActionLogs')  # type: ignore
 
     @action_logs.setter
     def action_logs(self, value: bool):
@@ -42,7 +143,7 @@ class Setting:
         Args:
             value (bool): True启用日志，False禁用日志
         """
-        self._raw.ActionLogs = value  # type: ignore
+        self._set('ActionLogs', value)
 
     @property
     def info_logs(self) -> bool:
@@ -52,7 +153,7 @@ class Setting:
         Returns:
             bool: True表示启用信息日志，False表示禁用
         """
-        return self._raw.InfoLogs  # type: ignore
+        return self._get('InfoLogs')  # type: ignore
 
     @info_logs.setter
     def info_logs(self, value: bool):
@@ -62,7 +163,7 @@ class Setting:
         Args:
             value (bool): True启用信息日志，False禁用
         """
-        self._raw.InfoLogs = value  # type: ignore
+        self._set('InfoLogs', value)
 
     @property
     def debug_logs(self) -> bool:
@@ -72,7 +173,7 @@ class Setting:
         Returns:
             bool: True表示启用调试日志，False表示禁用
         """
-        return self._raw.DebugLogs  # type: ignore
+        return self._get('DebugLogs')  # type: ignore
 
     @debug_logs.setter
     def debug_logs(self, value: bool):
@@ -82,7 +183,7 @@ class Setting:
         Args:
             value (bool): True启用调试日志，False禁用
         """
-        self._raw.DebugLogs = value  # type: ignore
+        self._set('DebugLogs', value)
 
     @property
     def min_similarity(self) -> float:
@@ -92,7 +193,7 @@ class Setting:
         Returns:
             float: 当前最小相似度值（0.0-1.0之间）
         """
-        return self._raw.MinSimilarity  # type: ignore
+        return self._get('MinSimilarity')  # type: ignore
 
     @min_similarity.setter
     def min_similarity(self, value: float):
@@ -102,7 +203,7 @@ class Setting:
         Args:
             value (float): 最小相似度值，范围应该在0.0-1.0之间
         """
-        self._raw.MinSimilarity = value  # type: ignore
+        self._set('MinSimilarity', value)
 
     @property
     def throw_exception(self) -> bool:
@@ -135,7 +236,7 @@ class Setting:
         Returns:
             float: 鼠标移动所需时间（秒）
         """
-        return self._raw.MoveMouseDelay  # type: ignore
+        return self._get('MoveMouseDelay')  # type: ignore
 
     @move_mouse_delay.setter
     def move_mouse_delay(self, value: float):
@@ -145,7 +246,7 @@ class Setting:
         Args:
             value (float): 鼠标移动所需时间（秒），值应该 >= 0
         """
-        self._raw.MoveMouseDelay = value  # type: ignore
+        self._set('MoveMouseDelay', value)
 
     @property
     def delay_before_mouse_down(self) -> float:
@@ -157,7 +258,7 @@ class Setting:
         Returns:
             float: 延迟时间（秒）
         """
-        return self._raw.DelayBeforeMouseDown  # type: ignore
+        return self._get('DelayBeforeMouseDown')  # type: ignore
 
     @delay_before_mouse_down.setter
     def delay_before_mouse_down(self, value: float = 0.3):
@@ -170,7 +271,7 @@ class Setting:
         Args:
             value (float): 延迟时间（秒），默认0.3秒
         """
-        self._raw.DelayBeforeMouseDown = value  # type: ignore
+        self._set('DelayBeforeMouseDown', value)
 
     @property
     def delay_before_drag(self) -> float:
@@ -183,7 +284,7 @@ class Setting:
         Returns:
             float: 延迟时间（秒）
         """
-        return self._raw.DelayBeforeDrag  # type: ignore
+        return self._get('DelayBeforeDrag')  # type: ignore
 
     @delay_before_drag.setter
     def delay_before_drag(self, value: float = 0.3):
@@ -195,7 +296,7 @@ class Setting:
         Args:
             value (float): 延迟时间（秒）
         """
-        self._raw.DelayBeforeDrag = value  # type: ignore
+        self._set('DelayBeforeDrag', value)
 
     @property
     def delay_before_drop(self) -> float:
@@ -207,7 +308,7 @@ class Setting:
         Returns:
             float: 延迟时间（秒）
         """
-        return self._raw.DelayBeforeDrop  # type: ignore
+        return self._get('DelayBeforeDrop')  # type: ignore
 
     @delay_before_drop.setter
     def delay_before_drop(self, value: float = 0.3):
@@ -219,7 +320,7 @@ class Setting:
         Args:
             value (float): 延迟时间（秒）
         """
-        self._raw.DelayBeforeDrop = value  # type: ignore
+        self._set('DelayBeforeDrop', value)
 
     @property
     def click_delay(self) -> float:
@@ -229,7 +330,7 @@ class Setting:
         Returns:
             float: 延迟时间（秒）
         """
-        return self._raw.ClickDelay  # type: ignore
+        return self._get('ClickDelay')  # type: ignore
 
     @click_delay.setter
     def click_delay(self, value: float = 0):
@@ -239,7 +340,7 @@ class Setting:
         Args:
             value (float): 延迟时间（秒），应该 >= 0，大于 1 的值会被强制重置为 1
         """
-        self._raw.ClickDelay = value  # type: ignore
+        self._set('ClickDelay', value)
 
     @property
     def type_delay(self) -> float:
@@ -249,7 +350,7 @@ class Setting:
         Returns:
             float: 延迟时间（秒）
         """
-        return self._raw.TypeDelay  # type: ignore
+        return self._get('TypeDelay')  # type: ignore
 
     @type_delay.setter
     def type_delay(self, value: float = 0):
@@ -259,7 +360,7 @@ class Setting:
         Args:
             value (float): 延迟时间（秒），应该 >= 0，大于 1 的值会被强制重置为 1
         """
-        self._raw.TypeDelay = value  # type: ignore
+        self._set('TypeDelay', value)
 
     @property
     def slow_motion_delay(self) -> float:
@@ -270,7 +371,7 @@ class Setting:
             float: 延迟时间（秒）
         """
         logger.warning('slow_motion_delay property is not fully supported')
-        return self._raw.SlowMotionDelay  # type: ignore
+        return self._get('SlowMotionDelay')  # type: ignore
 
     @slow_motion_delay.setter
     def slow_motion_delay(self, value: float = 0):
@@ -281,7 +382,7 @@ class Setting:
             value (float): 延迟时间（秒）
         """
         logger.warning('slow_motion_delay property is not fully supported')
-        self._raw.SlowMotionDelay = value  # type: ignore
+        self._set('SlowMotionDelay', value)
 
     @property
     def wait_scan_rate(self) -> float:
@@ -291,7 +392,7 @@ class Setting:
         Returns:
             float: 图像搜索时的扫描速率（每秒扫描次数）
         """
-        return self._raw.WaitScanRate  # type: ignore
+        return self._get('WaitScanRate')  # type: ignore
 
     @wait_scan_rate.setter
     def wait_scan_rate(self, value: float):
@@ -301,7 +402,7 @@ class Setting:
         Args:
             value (float): 图像搜索时的扫描速率（每秒扫描次数）
         """
-        self._raw.WaitScanRate = value  # type: ignore
+        self._set('WaitScanRate', value)
 
     @property
     def observe_scan_rate(self) -> float:
@@ -311,7 +412,7 @@ class Setting:
         Returns:
             float: 观察模式下的扫描速率（每秒扫描次数）
         """
-        return self._raw.ObserveScanRate  # type: ignore
+        return self._get('ObserveScanRate')  # type: ignore
 
     @observe_scan_rate.setter
     def observe_scan_rate(self, value: float):
@@ -321,7 +422,7 @@ class Setting:
         Args:
             value (float): 观察模式下的扫描速率（每秒扫描次数）
         """
-        self._raw.ObserveScanRate = value  # type: ignore
+        self._set('ObserveScanRate', value)
 
     @property
     def always_resize(self) -> bool:
@@ -331,7 +432,7 @@ class Setting:
         Returns:
             float: 图像缩放值
         """
-        return self._raw.AlwaysResize  # type: ignore
+        return self._get('AlwaysResize')  # type: ignore
 
     @always_resize.setter
     def always_resize(self, value: float):
@@ -341,7 +442,7 @@ class Setting:
         Args:
             value (float): 图像缩放值，值 >= 0，当值 = 0 或值 = 1 时，将关闭缩放使用原始大小
         """
-        self._raw.AlwaysResize = value  # type: ignore
+        self._set('AlwaysResize', value)
 
     @property
     def image_callback(self) -> float:
@@ -480,33 +581,3 @@ class Setting:
             bool: 如果启用了动作显示返回 True，否则返回 False
         """
         return self._raw.isShowActions()  # type: ignore
-
-
-if __name__ == '__main__':
-    setting = Setting()
-    print(f'当前最小相似度: {setting.min_similarity}')
-
-    # 修改一些设置
-    setting.min_similarity = 0.8
-    setting.action_logs = True
-    setting.debug_logs = True
-
-    print(f'修改后的最小相似度: {setting.min_similarity}')
-    print(f'动作日志状态: {setting.action_logs}')
-    print(f'调试日志状态: {setting.debug_logs}')
-
-    # 测试新增的方法
-    print(f'数据路径: {setting.get_data_path()}')
-    print(f'文件路径分隔符: {setting.get_file_path_seperator()}')
-    print(f'图像缓存大小: {setting.get_image_cache()}')
-    print(f'操作系统: {setting.get_os()}')
-    print(f'操作系统版本: {setting.get_os_version()}')
-    print(f'路径分隔符: {setting.get_path_separator()}')
-    print(f'当前时间戳: {setting.get_timestamp()}')
-    print(f'SikuliX版本: {setting.get_version()}')
-    print(f'构建版本: {setting.get_version_build()}')
-    print(f'是否为Linux系统: {setting.is_linux()}')
-    print(f'是否为Mac系统: {setting.is_mac()}')
-    print(f'是否为Windows系统: {setting.is_windows()}')
-    print(f'是否显示动作: {setting.is_show_actions()}')
-    print(f'鼠标移动速度: {setting.move_mouse_delay}')
@@ -5,8 +5,11 @@ Pytest 配置文件
 测试时会自动检测网关是否运行，如未运行则自动启动，测试完成后自动停止。
 """
 
+import functools
 import logging
+import os
 import pathlib
+import socket
 import sys
 import time
 
@@ -25,20 +28,31 @@ logger = logging.getLogger(__name__)
 class GatewayManager:
     """网关管理器 - 自动启动和停止网关"""
 
+    __slots__ = ('port', '_gateway_launcher', '_owns_gateway')
+
     _instance = None
-    _gateway_launcher = None
-    _owns_gateway = False  # 标记是否由测试启动的网关
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            instance._gateway_launcher = None
+            instance._owns_gateway = False  # 标记是否由测试启动的网关
+            cls._instance = instance
         return cls._instance
 
     def __init__(self):
-        self.port = 25333
+        # pytest-xdist 并行时每个 worker（gw0、gw1...）使用各自的端口和网关
+        worker = os.getenv('PYTEST_XDIST_WORKER', 'gw0')
+        self.port = 25333 + int(worker[2:] or 0)
 
     def is_gateway_running(self) -> bool:
-        """检测网关是否正在运行"""
+        """检测网关端口是否在监听，只做一次 TCP 连接，不进行 py4j 握手"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.1)
+            return sock.connect_ex(('127.0.0.1', self.port)) == 0
+
+    def is_gateway_ready(self) -> bool:
+        """通过 py4j 调用 Java 方法验证网关可用，开销较大，端口可连接后只调用一次"""
         from py4j.java_gateway import GatewayParameters, JavaGateway
         from py4j.protocol import Py4JNetworkError
 
@@ -56,7 +70,7 @@ class GatewayManager:
 
     def ensure_gateway(self) -> bool:
         """确保网关运行，如未运行则启动"""
-        if self.is_gateway_running():
+        if self.is_gateway_running() and self.is_gateway_ready():
             logger.info('网关已在运行')
             self._owns_gateway = False
             return True
@@ -80,13 +94,18 @@ class GatewayManager:
                 logger.error('网关启动失败')
                 return False
 
-            # 等待网关就绪
-            for _ in range(10):
-                time.sleep(0.5)
+            # 等待网关端口可连接，轮询间隔从 20ms 指数增长到 500ms，端口可连接后再验证一次
+            deadline = time.monotonic() + 5
+            delay = 0.02
+            while time.monotonic() < deadline:
                 if self.is_gateway_running():
-                    logger.info('网关启动成功并已就绪')
-                    self._owns_gateway = True
-                    return True
+                    if self.is_gateway_ready():
+                        logger.info('网关启动成功并已就绪')
+                        self._owns_gateway = True
+                        return True
+                    break
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
 
             logger.error('网关启动后无法连接')
             return False
@@ -107,7 +126,7 @@ class GatewayManager:
 gateway_manager = GatewayManager()
 
 
-@pytest.fixture(scope='session', autouse=True)
+@pytest.fixture(scope='session')
 def ensure_sikulix_gateway():
     """
     Session 级别的 fixture，确保测试开始时网关可用，测试结束后清理
@@ -115,6 +134,7 @@ def ensure_sikulix_gateway():
     使用方式：
     - 如果网关已在运行，直接使用，不停止
     - 如果网关未运行，启动网关，测试结束后停止
+    - 全局客户端连接本 worker 端口上的网关，测试结束后恢复
     """
     logger.info('=' * 50)
     logger.info('准备测试环境...')
@@ -126,8 +146,12 @@ def ensure_sikulix_gateway():
     logger.info('测试环境准备完成，开始测试')
     logger.info('=' * 50)
 
-    # 运行所有测试
-    yield
+    # 运行所有测试，get_cli() 返回连接本 worker 网关的客户端
+    from py_sikulix import client
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(client, '_G_SKL_CLI', client.SikuliXClient(gateway_manager.port))
+        yield
 
     # 测试完成后清理
     logger.info('=' * 50)
@@ -137,6 +161,13 @@ def ensure_sikulix_gateway():
     logger.info('=' * 50)
 
 
+@pytest.fixture(autouse=True)
+def _require_gateway(request):
+    """除标记为 offline 的测试外，每个测试都依赖 session 级网关；只运行 offline 测试时不会启动网关"""
+    if request.node.get_closest_marker('offline') is None:
+        request.getfixturevalue('ensure_sikulix_gateway')
+
+
 @pytest.fixture
 def screen():
     """创建 Screen 实例"""
@@ -161,19 +192,52 @@ def location():
     return Location(100, 200)
 
 
+@functools.cache
+def _example_pngs() -> tuple[pathlib.Path, ...]:
+    """examples 目录下的示例图像，收集阶段和 fixture 共用，整个测试进程只扫描一次目录"""
+    examples_dir = pathlib.Path(__file__).parent.parent / 'examples'
+    try:
+        # scandir 的目录项自带文件类型，不必像 glob 那样逐项包装路径再匹配
+        with os.scandir(examples_dir) as entries:
+            return tuple(pathlib.Path(e.path) for e in entries if e.name.endswith('.png') and e.is_file())
+    except FileNotFoundError:
+        return ()
+
+
+def pytest_collection_modifyitems(config, items):
+    """没有示例图像时，在收集阶段直接标记跳过依赖 valid_pattern 的测试"""
+    if _example_pngs():
+        return
+    skip = pytest.mark.skip(reason='没有示例图像文件')
+    for item in items:
+        if 'valid_pattern' in getattr(item, 'fixturenames', ()):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope='session')
+def example_pngs() -> list[pathlib.Path]:
+    """examples 目录下的示例图像"""
+    return list(_example_pngs())
+
+
 @pytest.fixture
-def pattern():
-    """创建 Pattern 实例（使用示例图像）"""
-    import pathlib
+def valid_pattern(example_pngs):
+    """创建使用示例图像的 Pattern，测试会修改 Pattern，因此每个测试各自创建"""
+    from py_sikulix import Pattern
+
+    # 收集阶段已跳过这些测试，这里只作兜底
+    if not example_pngs:
+        pytest.skip('没有示例图像文件')
+    return Pattern(str(example_pngs[0]))
 
+
+@pytest.fixture
+def pattern(example_pngs):
+    """创建 Pattern 实例（使用示例图像）"""
     from py_sikulix import Pattern
 
-    # 尝试使用 examples 目录下的图像
-    examples_dir = pathlib.Path(__file__).parent.parent / 'examples'
-    if examples_dir.exists():
-        image_files = list(examples_dir.glob('*.png'))
-        if image_files:
-            return Pattern(str(image_files[0]))
+    if example_pngs:
+        return Pattern(str(example_pngs[0]))
 
     # 如果没有示例图像，创建一个无效的 Pattern（用于测试错误处理）
     return Pattern('/nonexistent/pattern.png')
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+App 类测试
+
+应用程序名称的处理不需要 SikuliX 网关，使用替身对象记录传给 Java 端的参数。
+"""
+
+import pathlib
+
+import pytest
+
+from py_sikulix.app import App, _resolve_app_name
+
+
+class _RawApp:
+    """记录 open 调用参数的 Java App 替身"""
+
+    def __init__(self):
+        self.opened = []
+
+    def open(self, name=None):
+        self.opened.append(name)
+        return self
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(App, '_bind_methods', lambda self: None)
+    obj = App.__new__(App)
+    obj._raw = _RawApp()
+    return obj
+
+
+@pytest.mark.offline
+class TestAppName:
+    """应用程序名称处理测试，不需要网关"""
+
+    @pytest.mark.parametrize('name', ['calc', 'notepad.exe', 'Google Chrome.app'])
+    def test_open_plain_name(self, app, name):
+        """测试不含路径分隔符的名称原样传给 SikuliX"""
+        app.open(name)
+
+        assert app._raw.opened == [name]
+
+    def test_open_relative_path(self, app):
+        """测试含路径分隔符的相对路径转换为绝对路径"""
+        app.open('dir/app.exe')
+
+        assert app._raw.opened == [str(pathlib.Path('dir/app.exe').absolute())]
+
+    def test_resolve_path_object(self):
+        """测试 pathlib.Path 总是视为文件路径"""
+        assert _resolve_app_name(pathlib.Path('calc')) == str(pathlib.Path('calc').absolute())
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+键盘、鼠标按键常量测试
+
+常量首次访问时从 JVM 获取，这些测试同样需要 SikuliX 网关运行。
+"""
+
+from py_sikulix.keys import Btn, Key
+
+
+class TestConstants:
+    """常量测试"""
+
+    def test_key_constants(self):
+        """测试键盘常量"""
+        assert isinstance(Key.WIN, str)
+        assert isinstance(Key.ENTER, str)
+        assert isinstance(Key.ESC, str)
+        assert isinstance(Key.TAB, str)
+        assert isinstance(Key.SPACE, str)
+        assert isinstance(Key.F1, str)
+        assert isinstance(Key.F2, str)
+        assert isinstance(Key.F3, str)
+
+    def test_button_constants(self):
+        """测试鼠标按钮常量"""
+        assert isinstance(Btn.LEFT, int)
+        assert isinstance(Btn.RIGHT, int)
+        assert isinstance(Btn.MIDDLE, int)
+        assert isinstance(Btn.WHEEL_UP, int)
+        assert isinstance(Btn.WHEEL_DOWN, int)
+
+    def test_button_values(self):
+        """测试按钮常量值"""
+        # 验证常量值符合预期
+        assert Btn.LEFT == 1024
+        assert Btn.RIGHT == 4096
+        assert Btn.MIDDLE == 2048
+        assert Btn.WHEEL_DOWN == 1
+        assert Btn.WHEEL_UP == -1
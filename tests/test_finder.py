@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+CrossPlatformFinder 匹配算法测试
+
+在合成的 BGRA 截图中放置目标后直接调用匹配内核，不需要网关、屏幕或显示器。
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+cv2 = pytest.importorskip('cv2')
+finder = pytest.importorskip('py_sikulix.extend.finder')
+
+FRAME_W, FRAME_H = 80, 60
+# 主色 ff0000，(3, 0) 处 00ff00，(0, 2) 处 0000ff，(3, 2) 处 ffff00
+COLOR_STR = 'ff0000|000000,3|0|00ff00|000000,0|2|0000ff|000000,3|2|ffff00|000000'
+# BGR 顺序的各点颜色
+PLANT = (((0, 0), (0, 0, 255)), ((3, 0), (0, 255, 0)), ((0, 2), (255, 0, 0)), ((3, 2), (0, 255, 255)))
+
+
+def _background() -> np.ndarray:
+    """生成分量都不超过 100 的随机背景，不会与目标颜色混淆"""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 100, (FRAME_H, FRAME_W, 4), dtype=np.uint8)
+    frame[:, :, 3] = 255
+    return frame
+
+
+def _plant(frame: np.ndarray, x: int, y: int) -> np.ndarray:
+    """以 (x, y) 为主点放置 COLOR_STR 描述的目标"""
+    for (dx, dy), bgr in PLANT:
+        frame[y + dy, x + dx, :3] = bgr
+    return frame
+
+
+def _run_kernels(frame: np.ndarray, similarity: float = 0.9) -> dict:
+    """分别用三种内核查找 COLOR_STR，返回 {内核名: 结果}"""
+    lower, upper, offsets, targets, biases, offset_bounds = finder.CrossPlatformFinder._compile_config(COLOR_STR)
+    pts = cv2.findNonZero(cv2.inRange(frame, lower, upper))
+    pts = np.empty((0, 2), np.int32) if pts is None else pts.reshape(-1, 2)
+    args = (frame, offsets, targets, biases, similarity, offset_bounds)
+    return {
+        'numba': finder._numba_kernel(pts[:, 1], pts[:, 0], *args),
+        'numpy': finder._numpy_kernel(pts[:, 1], pts[:, 0], *args),
+        'fused': finder._fused_kernel(frame, lower, upper, *args[1:]),
+    }
+
+
+def _assert_found(results: dict, x: int, y: int):
+    """三种内核都在 (x, y) 找到目标且结果一致"""
+    for name, ret in results.items():
+        assert ret is not None, name
+        assert tuple(int(v) for v in ret[:4]) == (x, y, 3, 2), name
+        assert ret[4] == pytest.approx(1.0), name
+        assert tuple(int(v) for v in ret[5:]) == (255, 0, 0), name
+
+
+@pytest.mark.offline
+class TestColorKernels:
+    """多点找色内核测试，不需要网关"""
+
+    def test_kernels_find_planted(self):
+        """测试三种内核找到放置的目标"""
+        _assert_found(_run_kernels(_plant(_background(), 30, 20)), 30, 20)
+
+    def test_kernels_first_match(self):
+        """测试存在多个目标时，三种内核都返回最靠上一行的第一个"""
+        frame = _plant(_plant(_plant(_background(), 50, 40), 40, 10), 10, 10)
+
+        _assert_found(_run_kernels(frame), 10, 10)
+
+    @pytest.mark.parametrize('x, y', [(0, 0), (FRAME_W - 4, FRAME_H - 3)])
+    def test_kernels_frame_edge(self, x, y):
+        """测试目标紧贴截图边缘"""
+        _assert_found(_run_kernels(_plant(_background(), x, y)), x, y)
+
+    def test_kernels_offsets_outside(self):
+        """测试偏移点超出截图时按不匹配计算，三种内核的相似度一致"""
+        frame = _plant(_background(), 10, 10)
+        # 只保留主点和 (0, 2) 处的偏移点，另两个偏移点落在截图右侧之外
+        frame[FRAME_H - 3, FRAME_W - 1, :3] = (0, 0, 255)
+        frame[FRAME_H - 1, FRAME_W - 1, :3] = (255, 0, 0)
+        frame[10, 10, :3] = 0
+
+        results = _run_kernels(frame, similarity=0.5)
+        for name, ret in results.items():
+            assert tuple(int(v) for v in ret[:4]) == (FRAME_W - 1, FRAME_H - 3, 3, 2), name
+            assert ret[4] == pytest.approx(0.5), name
+
+    def test_kernels_no_match(self):
+        """测试截图中没有目标"""
+        frame = _background()
+        # 只有主色没有偏移点颜色
+        frame[5, 5, :3] = (0, 0, 255)
+
+        assert _run_kernels(frame) == {'numba': None, 'numpy': None, 'fused': None}
+
+
+@pytest.mark.offline
+class TestMatchTemplates:
+    """模板匹配测试，不需要网关"""
+
+    @staticmethod
+    def _frame_and_template(x: int, y: int, w: int = 12, h: int = 10):
+        rng = np.random.default_rng(1)
+        frame = rng.integers(0, 256, (FRAME_H, FRAME_W, 4), dtype=np.uint8)
+        template = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+        frame[y : y + h, x : x + w, :3] = template
+        return frame, template
+
+    @pytest.mark.parametrize('x, y', [(25, 18), (0, 0), (FRAME_W - 12, FRAME_H - 10)])
+    def test_find_planted(self, x, y):
+        """测试在 BGRA 截图中找到放置的模板，包括截图边缘"""
+        frame, template = self._frame_and_template(x, y)
+
+        (matches,) = finder.CrossPlatformFinder.match_templates(frame, [template], similarity=0.9)
+
+        assert len(matches) == 1
+        assert matches[0][0] == (x, y, 12, 10)
+        assert matches[0][1] == pytest.approx(1.0, abs=1e-4)
+
+    def test_bgra_template(self):
+        """测试 BGRA 模板去掉透明通道后匹配"""
+        frame, template = self._frame_and_template(25, 18)
+
+        (matches,) = finder.CrossPlatformFinder.match_templates(frame, [cv2.cvtColor(template, cv2.COLOR_BGR2BGRA)])
+
+        assert matches[0][0] == (25, 18, 12, 10)
+
+    def test_no_match(self):
+        """测试截图中没有模板、模板大于截图时返回空列表"""
+        frame, _ = self._frame_and_template(25, 18)
+        other = np.random.default_rng(2).integers(0, 256, (10, 12, 3), dtype=np.uint8)
+        too_large = np.zeros((FRAME_H + 1, 10, 3), dtype=np.uint8)
+
+        assert finder.CrossPlatformFinder.match_templates(frame, [other, too_large], similarity=0.9) == [[], []]
+
+
+@pytest.mark.offline
+class TestSelectivityOrder:
+    """偏移点排序测试，不需要网关"""
+
+    def test_rare_color_first(self):
+        """测试命中率低的偏移点排在前面，命中率相同时保持原顺序"""
+        image = np.zeros((8, 8, 4), dtype=np.uint8)
+        image[:4, :, :3] = (10, 20, 30)
+        image[0, 0, :3] = (200, 200, 200)
+        targets = np.array([[10, 20, 30], [0, 0, 0], [200, 200, 200], [90, 90, 90]], dtype=np.uint8)
+        biases = np.zeros((4, 3), dtype=np.uint8)
+
+        order = finder._selectivity_order(image, targets, biases, step=1)
+
+        assert order.tolist() == [3, 2, 0, 1]
+
+    def test_bias(self):
+        """测试偏色范围内的像素计为命中"""
+        image = np.zeros((4, 4, 4), dtype=np.uint8)
+        image[:, :, :3] = (100, 100, 100)
+        targets = np.array([[105, 105, 105], [105, 105, 105]], dtype=np.uint8)
+        biases = np.array([[0, 0, 0], [5, 5, 5]], dtype=np.uint8)
+
+        assert finder._selectivity_order(image, targets, biases, step=1).tolist() == [0, 1]
+
+
+@pytest.mark.offline
+class TestClipRegion:
+    """搜索区域截取测试，不需要网关"""
+
+    @pytest.fixture
+    def screen_finder(self):
+        """100x80 屏幕的找色器，不创建截图对象"""
+        obj = finder.CrossPlatformFinder.__new__(finder.CrossPlatformFinder)
+        obj.left, obj.top, obj.width, obj.height = 0, 0, 100, 80
+        return obj
+
+    @pytest.fixture
+    def offset_finder(self):
+        """左上角在 (-100, 50) 的 100x80 显示器，如位于主显示器左侧的副屏"""
+        obj = finder.CrossPlatformFinder.__new__(finder.CrossPlatformFinder)
+        obj.left, obj.top, obj.width, obj.height = -100, 50, 100, 80
+        return obj
+
+    @pytest.mark.parametrize(
+        'region, expected',
+        [
+            (None, (0, 0, 100, 80)),
+            ((10, 20, 30, 40), (10, 20, 30, 40)),
+            ((10, 20), (10, 20, 90, 60)),
+            # 分别超出左、上、右、下边缘
+            ((-10, 20, 30, 40), (0, 20, 20, 40)),
+            ((10, -20, 30, 40), (10, 0, 30, 20)),
+            ((90, 20, 30, 40), (90, 20, 10, 40)),
+            ((10, 60, 30, 40), (10, 60, 30, 20)),
+            # 四边都超出
+            ((-10, -10, 200, 200), (0, 0, 100, 80)),
+        ],
+    )
+    def test_clip(self, screen_finder, region, expected):
+        """测试区域截取到屏幕范围内"""
+        assert screen_finder._clip_region(region) == expected
+
+    @pytest.mark.parametrize(
+        'region, expected',
+        [
+            (None, (-100, 50, 100, 80)),
+            ((-90, 60, 30, 40), (-90, 60, 30, 40)),
+            ((-90, 60), (-90, 60, 90, 70)),
+            # 分别超出左、上、右、下边缘
+            ((-110, 60, 30, 40), (-100, 60, 20, 40)),
+            ((-90, 40, 30, 40), (-90, 50, 30, 30)),
+            ((-10, 60, 30, 40), (-10, 60, 10, 40)),
+            ((-90, 110, 30, 40), (-90, 110, 30, 20)),
+        ],
+    )
+    def test_clip_monitor_origin(self, offset_finder, region, expected):
+        """测试按显示器在虚拟桌面中的位置截取，不以 (0, 0) 为原点"""
+        assert offset_finder._clip_region(region) == expected
+
+    @pytest.mark.parametrize('region', [(0, 60, 10, 10), (-90, 0, 10, 10), (-200, 60, 100, 10)])
+    def test_outside_monitor(self, offset_finder, region):
+        """测试区域在显示器之外时抛出 ValueError，包括主显示器上的区域"""
+        with pytest.raises(ValueError):
+            offset_finder._clip_region(region)
+
+    @pytest.mark.parametrize(
+        'region', [(-30, 0, 30, 10), (0, -10, 10, 10), (100, 0, 10, 10), (0, 80, 10, 10), (0, 0, 0, 10), (5,)]
+    )
+    def test_invalid(self, screen_finder, region):
+        """测试区域完全在屏幕外、为空或格式错误时抛出 ValueError"""
+        with pytest.raises(ValueError):
+            screen_finder._clip_region(region)
+
+
+@pytest.mark.offline
+class TestGrab:
+    """截图测试，用替身代替 mss，不需要网关或显示器"""
+
+    def test_grab_clipped(self):
+        """测试按截取后的区域截图，显示器不在原点时坐标不变换，返回只读 BGRA 数组"""
+        grabbed = []
+
+        class FakeShot:
+            def __init__(self, monitor):
+                self.width, self.height = monitor['width'], monitor['height']
+                self.raw = bytes(self.width * self.height * 4)
+
+        class FakeMss:
+            def grab(self, monitor):
+                grabbed.append(monitor)
+                return FakeShot(monitor)
+
+        obj = finder.CrossPlatformFinder.__new__(finder.CrossPlatformFinder)
+        obj.left, obj.top, obj.width, obj.height, obj.screen = 1920, 0, 100, 80, FakeMss()
+
+        frame = obj.grab((1910, 70, 30, 20))
+
+        assert grabbed == [{'left': 1920, 'top': 70, 'width': 20, 'height': 10}]
+        assert frame.shape == (10, 20, 4)
+        assert not frame.flags.writeable
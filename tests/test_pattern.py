@@ -6,8 +6,6 @@ Pattern 类集成测试
 测试会自动启动网关（如未运行），测试完成后自动停止。
 """
 
-import pathlib
-
 import pytest
 
 from py_sikulix import Pattern
@@ -16,31 +14,23 @@ from py_sikulix import Pattern
 class TestPatternCreation:
     """Pattern 创建测试"""
 
-    def test_create_pattern_with_string(self):
+    def test_create_pattern_with_string(self, example_pngs):
         """测试使用字符串路径创建 Pattern"""
         # 使用示例图像（如果存在）
-        examples_dir = pathlib.Path(__file__).parent.parent / 'examples'
-
-        if examples_dir.exists():
-            image_files = list(examples_dir.glob('*.png'))
-            if image_files:
-                pattern = Pattern(str(image_files[0]))
-                assert isinstance(pattern, Pattern)
-                return
+        if example_pngs:
+            pattern = Pattern(str(example_pngs[0]))
+            assert isinstance(pattern, Pattern)
+            return
 
         # 如果没有示例图像，跳过
         pytest.skip('没有示例图像文件')
 
-    def test_create_pattern_with_pathlib(self):
+    def test_create_pattern_with_pathlib(self, example_pngs):
         """测试使用 pathlib.Path 创建 Pattern"""
-        examples_dir = pathlib.Path(__file__).parent.parent / 'examples'
-
-        if examples_dir.exists():
-            image_files = list(examples_dir.glob('*.png'))
-            if image_files:
-                pattern = Pattern(image_files[0])
-                assert isinstance(pattern, Pattern)
-                return
+        if example_pngs:
+            pattern = Pattern(example_pngs[0])
+            assert isinstance(pattern, Pattern)
+            return
 
         pytest.skip('没有示例图像文件')
 
@@ -60,18 +50,6 @@ class TestPatternCreation:
 class TestPatternModification:
     """Pattern 修改测试"""
 
-    @pytest.fixture
-    def valid_pattern(self):
-        """创建一个有效的 Pattern"""
-        examples_dir = pathlib.Path(__file__).parent.parent / 'examples'
-
-        if examples_dir.exists():
-            image_files = list(examples_dir.glob('*.png'))
-            if image_files:
-                return Pattern(str(image_files[0]))
-
-        pytest.skip('没有示例图像文件')
-
     def test_set_similar(self, valid_pattern):
         """测试设置相似度（使用 set_similar 方法）"""
         result = valid_pattern.set_similar(0.8)
@@ -127,29 +105,13 @@ class TestPatternModification:
 class TestPatternMask:
     """Pattern 蒙版测试"""
 
-    @pytest.fixture
-    def valid_pattern(self):
-        """创建一个有效的 Pattern"""
-        examples_dir = pathlib.Path(__file__).parent.parent / 'examples'
-
-        if examples_dir.exists():
-            image_files = list(examples_dir.glob('*.png'))
-            if image_files:
-                return Pattern(str(image_files[0]))
-
-        pytest.skip('没有示例图像文件')
-
-    def test_mask_with_pattern(self, valid_pattern):
+    def test_mask_with_pattern(self, valid_pattern, example_pngs):
         """测试使用另一个 Pattern 作为蒙版"""
-        examples_dir = pathlib.Path(__file__).parent.parent / 'examples'
-
-        if examples_dir.exists():
-            image_files = list(examples_dir.glob('*.png'))
-            if len(image_files) >= 2:
-                mask_pattern = Pattern(str(image_files[1]))
-                result = valid_pattern.mask(mask_pattern)
-                assert result is valid_pattern
-                return
+        if len(example_pngs) >= 2:
+            mask_pattern = Pattern(str(example_pngs[1]))
+            result = valid_pattern.mask(mask_pattern)
+            assert result is valid_pattern
+            return
 
         pytest.skip('没有足够的示例图像文件')
 
@@ -163,18 +125,6 @@ class TestPatternMask:
 class TestPatternGetters:
     """Pattern 获取方法测试"""
 
-    @pytest.fixture
-    def valid_pattern(self):
-        """创建一个有效的 Pattern"""
-        examples_dir = pathlib.Path(__file__).parent.parent / 'examples'
-
-        if examples_dir.exists():
-            image_files = list(examples_dir.glob('*.png'))
-            if image_files:
-                return Pattern(str(image_files[0]))
-
-        pytest.skip('没有示例图像文件')
-
     def test_get_filename(self, valid_pattern):
         """测试获取文件名"""
         filename = valid_pattern.get_filename()
@@ -207,20 +157,42 @@ class TestPatternGetters:
 class TestPatternRepr:
     """Pattern 字符串表示测试"""
 
-    @pytest.fixture
-    def valid_pattern(self):
-        """创建一个有效的 Pattern"""
-        examples_dir = pathlib.Path(__file__).parent.parent / 'examples'
-
-        if examples_dir.exists():
-            image_files = list(examples_dir.glob('*.png'))
-            if image_files:
-                return Pattern(str(image_files[0]))
-
-        pytest.skip('没有示例图像文件')
-
     def test_repr(self, valid_pattern):
         """测试 repr"""
         repr_str = repr(valid_pattern)
 
         assert 'Pattern' in repr_str
+
+
+@pytest.mark.offline
+class TestPatternPath:
+    """Pattern 路径检查测试，Java 端 Pattern 延迟创建，不需要网关"""
+
+    def test_missing_file(self, tmp_path):
+        """测试文件不存在时抛出 FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            Pattern(tmp_path / 'missing.png')
+
+    def test_file_removed(self, tmp_path):
+        """测试模板被删除后再次创建 Pattern 仍会报错"""
+        image = tmp_path / 'button.png'
+        image.write_bytes(b'')
+        Pattern(str(image))
+
+        image.unlink()
+        with pytest.raises(FileNotFoundError):
+            Pattern(str(image))
+
+    def test_relative_path_follows_cwd(self, tmp_path, monkeypatch):
+        """测试相对路径按创建时的工作目录转换，切换目录后不沿用旧目录"""
+        for name in ('a', 'b'):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / 'button.png').write_bytes(b'')
+
+        monkeypatch.chdir(tmp_path / 'a')
+        first = Pattern('button.png')._path
+        monkeypatch.chdir(tmp_path / 'b')
+        second = Pattern('button.png')._path
+
+        assert first == str(tmp_path / 'a' / 'button.png')
+        assert second == str(tmp_path / 'b' / 'button.png')
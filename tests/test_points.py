@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+LocationArray 类测试
+
+坐标运算在 Python 端完成，不需要网关；取出单个点时用替身代替 Location。
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+points = pytest.importorskip('py_sikulix.extend.points')
+LocationArray = points.LocationArray
+
+
+@pytest.fixture
+def fake_location(monkeypatch):
+    """用 (x, y) 元组代替需要网关的 Location"""
+    monkeypatch.setattr(points, 'Location', lambda x, y: (x, y))
+
+
+@pytest.mark.offline
+class TestLocationArray:
+    """LocationArray 测试，不需要网关"""
+
+    def test_create(self):
+        """测试由坐标序列创建"""
+        arr = LocationArray([(1, 2), (3, 4)])
+
+        assert len(arr) == 2
+        assert arr.xy.dtype == np.int32
+        assert arr.xy.tolist() == [[1, 2], [3, 4]]
+
+    def test_create_empty(self):
+        """测试创建空数组"""
+        arr = LocationArray([])
+
+        assert len(arr) == 0
+        assert arr.xy.shape == (0, 2)
+
+    def test_xy_readonly(self):
+        """测试坐标数组只读"""
+        arr = LocationArray([(1, 2)])
+
+        with pytest.raises(ValueError):
+            arr.xy[0, 0] = 5
+
+    def test_grid(self):
+        """测试按行排列的网格坐标"""
+        arr = LocationArray.grid(10, 20, cols=3, rows=2, dx=5, dy=7)
+
+        assert arr.xy.tolist() == [[10, 20], [15, 20], [20, 20], [10, 27], [15, 27], [20, 27]]
+
+    def test_offset(self):
+        """测试偏移返回新对象，原对象不变"""
+        arr = LocationArray([(1, 2), (3, 4)])
+        moved = arr.offset(10, -1)
+
+        assert moved.xy.tolist() == [[11, 1], [13, 3]]
+        assert arr.xy.tolist() == [[1, 2], [3, 4]]
+
+    def test_directions(self):
+        """测试上下左右偏移"""
+        arr = LocationArray([(10, 10)])
+
+        assert arr.above(3).xy.tolist() == [[10, 7]]
+        assert arr.below(3).xy.tolist() == [[10, 13]]
+        assert arr.left(3).xy.tolist() == [[7, 10]]
+        assert arr.right(3).xy.tolist() == [[13, 10]]
+
+    def test_getitem(self, fake_location):
+        """测试整数下标取出单个点，支持负数下标"""
+        arr = LocationArray([(1, 2), (3, 4)])
+
+        assert arr[0] == (1, 2)
+        assert arr[-1] == (3, 4)
+        assert arr[np.int64(1)] == (3, 4)
+
+    def test_getitem_bounds(self, fake_location):
+        """测试下标越界抛出 IndexError"""
+        arr = LocationArray([(1, 2), (3, 4)])
+
+        with pytest.raises(IndexError):
+            arr[2]
+        with pytest.raises(IndexError):
+            arr[-3]
+
+    def test_getitem_slice(self):
+        """测试切片返回新的 LocationArray"""
+        arr = LocationArray.grid(0, 0, cols=4, rows=1, dx=1, dy=0)
+        part = arr[1:3]
+
+        assert isinstance(part, LocationArray)
+        assert part.xy.tolist() == [[1, 0], [2, 0]]
+        assert arr[::-2].xy.tolist() == [[3, 0], [1, 0]]
+
+    def test_getitem_invalid(self):
+        """测试非整数、非切片下标抛出 TypeError"""
+        arr = LocationArray([(1, 2), (3, 4)])
+
+        with pytest.raises(TypeError):
+            arr[[0, 1]]
+        with pytest.raises(TypeError):
+            arr[0.5]
@@ -6,7 +6,9 @@ Region 类集成测试
 测试会自动启动网关（如未运行），测试完成后自动停止。
 """
 
+import contextlib
 import pathlib
+import threading
 import time
 
 import pytest
@@ -14,6 +16,16 @@ import pytest
 from py_sikulix import Btn, Key, Location, Match, Pattern, Region, Screen
 
 
+@contextlib.contextmanager
+def region_snapshot(region: Region):
+    """记录区域边界（一次往返），退出时用一次 set_rect 恢复，断言失败时同样恢复"""
+    bounds = region.get_bounds()
+    try:
+        yield
+    finally:
+        region.set_rect(*bounds)
+
+
 class TestRegionCreation:
     """Region 创建测试"""
 
@@ -55,45 +67,43 @@ class TestRegionCreation:
         assert region.x <= center.x <= region.x + region.w
         assert region.y <= center.y <= region.y + region.h
 
+    def test_get_center_xy(self, region):
+        """测试中心坐标与 Java 端计算结果一致"""
+        center = Region(region.x, region.y, region.w, region.h).get_center()
+
+        assert region.get_center_xy() == (center.x, center.y)
+
 
 class TestRegionSetters:
     """Region 属性设置测试"""
 
     def test_set_x(self, region):
         """测试设置 X 坐标"""
-        original_x = region.x
-        region.set_x(200)
+        with region_snapshot(region):
+            region.set_x(200)
 
-        assert region.x == 200
-        # 恢复原值
-        region.set_x(original_x)
+            assert region.x == 200
 
     def test_set_y(self, region):
         """测试设置 Y 坐标"""
-        original_y = region.y
-        region.set_y(300)
+        with region_snapshot(region):
+            region.set_y(300)
 
-        assert region.y == 300
-        # 恢复原值
-        region.set_y(original_y)
+            assert region.y == 300
 
     def test_set_w(self, region):
         """测试设置宽度"""
-        original_w = region.w
-        region.set_w(500)
+        with region_snapshot(region):
+            region.set_w(500)
 
-        assert region.w == 500
-        # 恢复原值
-        region.set_w(original_w)
+            assert region.w == 500
 
     def test_set_h(self, region):
         """测试设置高度"""
-        original_h = region.h
-        region.set_h(400)
+        with region_snapshot(region):
+            region.set_h(400)
 
-        assert region.h == 400
-        # 恢复原值
-        region.set_h(original_h)
+            assert region.h == 400
 
     def test_chain_setters(self, region):
         """测试链式设置"""
@@ -160,16 +170,12 @@ class TestRegionGeometry:
 
     def test_set_roi(self, region):
         """测试设置 ROI"""
-        original_bounds = region.get_bounds()
+        with region_snapshot(region):
+            region.set_roi(10, 10, 100, 100)
 
-        region.set_roi(10, 10, 100, 100)
-
-        # ROI 只影响搜索区域，不改变区域本身
-        # 这个测试验证方法可调用
-        assert callable(region.set_roi)
-
-        # 恢复
-        region.set_roi(0, 0, original_bounds[2], original_bounds[3])
+            # ROI 只影响搜索区域，不改变区域本身
+            # 这个测试验证方法可调用
+            assert callable(region.set_roi)
 
 
 class TestRegionLocation:
@@ -210,132 +216,87 @@ class TestRegionLocation:
         assert bottom_right.x == region.x + region.w - 1
         assert bottom_right.y == region.y + region.h - 1
 
-    def test_move_to(self, region):
-        """测试移动区域"""
-        original_x, original_y = region.x, region.y
+    def test_get_corners(self, region):
+        """测试一次获取四个角"""
+        top_left, top_right, bottom_left, bottom_right = region.get_corners()
+        x, y, w, h = region.get_bounds()
 
-        # 移动到新位置
-        new_location = Location(500, 500)
-        region.move_to(new_location)
+        assert (top_left.x, top_left.y) == (x, y)
+        assert (top_right.x, top_right.y) == (x + w - 1, y)
+        assert (bottom_left.x, bottom_left.y) == (x, y + h - 1)
+        assert (bottom_right.x, bottom_right.y) == (x + w - 1, y + h - 1)
+        # 坐标由边界算出，应与 Java 端一致
+        assert bottom_right.x == region.get_bottom_right().x
 
-        # 验证位置已改变
-        assert region.x == 500
-        assert region.y == 500
+    def test_move_to(self, region):
+        """测试移动区域"""
+        with region_snapshot(region):
+            # 移动到新位置
+            new_location = Location(500, 500)
+            region.move_to(new_location)
 
-        # 恢复
-        region.move_to(Location(original_x, original_y))
+            # 验证位置已改变
+            assert region.x == 500
+            assert region.y == 500
 
     def test_set_rect(self, region):
         """测试设置矩形"""
-        original_bounds = region.get_bounds()
+        with region_snapshot(region):
+            region.set_rect(100, 100, 400, 300)
 
-        region.set_rect(100, 100, 400, 300)
-
-        assert region.x == 100
-        assert region.y == 100
-        assert region.w == 400
-        assert region.h == 300
-
-        # 恢复
-        region.set_rect(*original_bounds)
+            assert region.x == 100
+            assert region.y == 100
+            assert region.w == 400
+            assert region.h == 300
 
 
 @pytest.mark.interactive
 class TestRegionMouse:
     """区域鼠标操作测试"""
 
-    def test_click(self, region):
-        """测试点击"""
-        # 这是一个基本测试，验证方法可调用
-        # 实际点击会移动鼠标，可以观察
-        result = region.click()
-
-        # 返回值应该是整数（点击次数或状态码）
-        assert isinstance(result, int)
-
-    def test_click_with_button(self, region):
-        """测试使用按键点击"""
-        # 测试右键点击
-        result = region.click(key=Btn.RIGHT)
-
-        assert isinstance(result, int)
-
-    def test_double_click(self, region):
-        """测试双击"""
-        result = region.double_click()
-
-        assert isinstance(result, int)
-
-    def test_right_click(self, region):
-        """测试右键点击"""
-        result = region.right_click()
-
-        assert isinstance(result, int)
-
-    def test_hover(self, region):
-        """测试悬停"""
-        result = region.hover()
-
-        assert isinstance(result, int)
-
-    def test_mouse_down(self, region):
-        """测试鼠标按下"""
-        result = region.mouse_down()
-
-        assert isinstance(result, int)
-
-    def test_mouse_up(self, region):
-        """测试鼠标释放"""
-        result = region.mouse_up()
-
-        assert isinstance(result, int)
-
-    def test_mouse_move(self, region):
-        """测试鼠标移动"""
-        result = region.mouse_move(50, 50)
-
-        assert isinstance(result, int)
-
-    def test_wheel(self, region):
-        """测试滚轮"""
-        result = region.wheel(direction=Btn.WHEEL_DOWN)
-
-        assert isinstance(result, int)
-
-    def test_wheel_up(self, region):
-        """测试滚轮向上"""
-        result = region.wheel(direction=Btn.WHEEL_UP)
-
-        assert isinstance(result, int)
+    # 每项只验证方法可调用，实际操作会移动鼠标，可以观察；返回值应该是整数（点击次数或状态码）
+    @pytest.mark.parametrize(
+        'op',
+        [
+            pytest.param(lambda r: r.click(), id='click'),
+            pytest.param(lambda r: r.click(key=Btn.RIGHT), id='click_with_button'),
+            pytest.param(lambda r: r.double_click(), id='double_click'),
+            pytest.param(lambda r: r.right_click(), id='right_click'),
+            pytest.param(lambda r: r.hover(), id='hover'),
+            pytest.param(lambda r: r.mouse_down(), id='mouse_down'),
+            pytest.param(lambda r: r.mouse_up(), id='mouse_up'),
+            pytest.param(lambda r: r.mouse_move(50, 50), id='mouse_move'),
+            pytest.param(lambda r: r.wheel(direction=Btn.WHEEL_DOWN), id='wheel'),
+            pytest.param(lambda r: r.wheel(direction=Btn.WHEEL_UP), id='wheel_up'),
+        ],
+    )
+    def test_mouse_op(self, region, op):
+        """测试鼠标操作"""
+        assert isinstance(op(region), int)
+
+    def test_click_invalid_key(self, region):
+        """测试非法修饰键参数"""
+        with pytest.raises(TypeError):
+            region.click(key='ctrl')  # type: ignore
 
 
 @pytest.mark.interactive
 class TestRegionKeyboard:
     """区域键盘操作测试"""
 
-    def test_key_down(self, region):
-        """测试按键按下"""
-        result = region.key_down(Key.WIN)
-
-        assert isinstance(result, int)
-
-    def test_key_up(self, region):
-        """测试按键释放"""
-        result = region.key_up(Key.WIN)
-
-        assert isinstance(result, int)
-
-    def test_type_text(self, region):
-        """测试输入文本"""
-        result = region.type('test')
-
-        assert isinstance(result, int)
-
-    def test_paste_text(self, region):
-        """测试粘贴文本"""
-        result = region.paste('paste test')
-
-        assert isinstance(result, int)
+    @pytest.mark.parametrize(
+        'op',
+        [
+            pytest.param(lambda r: r.key_down(Key.WIN), id='key_down'),
+            pytest.param(lambda r: r.key_up(Key.WIN), id='key_up'),
+            pytest.param(lambda r: r.type('test'), id='type_text'),
+            pytest.param(lambda r: r.paste('paste test'), id='paste_text'),
+            pytest.param(lambda r: r.hotkey(Key.SHIFT, 'a'), id='hotkey'),
+        ],
+    )
+    def test_keyboard_op(self, region, op):
+        """测试键盘操作"""
+        assert isinstance(op(region), int)
 
 
 class TestRegionFind:
@@ -363,6 +324,32 @@ class TestRegionFind:
         # 超时应该返回 False
         assert result is False
 
+    def test_exists_async_nonexistent(self, region):
+        """测试后台查找不存在的图像"""
+        future = region.exists_async('nonexistent_image.png', timeout=1)
+        assert future.result(timeout=10) is None
+
+    def test_find_any_nonexistent(self, region):
+        """测试同时查找多个不存在的图像"""
+        assert region.find_any(['nonexistent_image.png', 'nonexistent_image2.png']) == []
+        assert region.find_best(['nonexistent_image.png']) is None
+
+    def test_wait_scan_rate(self, region):
+        """测试设置等待扫描频率"""
+        region.set_wait_scan_rate(10)
+        assert region.get_wait_scan_rate() == 10
+
+        with pytest.raises(ValueError):
+            region.set_wait_scan_rate(0)
+
+    def test_wait_scan_rate_restored(self, region):
+        """测试 wait、wait_vanish 的 scan_rate 参数只对本次调用生效"""
+        region.set_wait_scan_rate(3)
+        region.wait('nonexistent_image.png', timeout=0.5, scan_rate=10)
+        region.wait_vanish('nonexistent_image.png', timeout=0.5, scan_rate=10)
+
+        assert region.get_wait_scan_rate() == 3
+
 
 class TestRegionHighlight:
     """区域高亮测试"""
@@ -381,6 +368,18 @@ class TestRegionHighlight:
         # 再关闭
         region.highlight_all_off()
 
+    def test_highlighted(self, region):
+        """测试高亮上下文管理器"""
+        with region.highlighted('yellow') as r:
+            assert r is region
+
+    def test_flash(self, region):
+        """测试定时高亮"""
+        result = region.flash(0.1, 'green')
+
+        # 支持链式调用
+        assert result is region
+
 
 class TestRegionText:
     """区域文本提取测试"""
@@ -393,30 +392,95 @@ class TestRegionText:
         assert isinstance(result, str)
 
 
-class TestConstants:
-    """常量测试"""
-
-    def test_key_constants(self):
-        """测试键盘常量"""
-        assert isinstance(Key.WIN, str)
-        assert isinstance(Key.ENTER, str)
-        assert isinstance(Key.ESC, str)
-        assert isinstance(Key.TAB, str)
-        assert isinstance(Key.SPACE, str)
-
-    def test_button_constants(self):
-        """测试鼠标按钮常量"""
-        assert isinstance(Btn.LEFT, int)
-        assert isinstance(Btn.RIGHT, int)
-        assert isinstance(Btn.MIDDLE, int)
-        assert isinstance(Btn.WHEEL_UP, int)
-        assert isinstance(Btn.WHEEL_DOWN, int)
-
-    def test_button_values(self):
-        """测试按钮常量值"""
-        # 验证常量值符合预期
-        assert Btn.LEFT == 1024
-        assert Btn.RIGHT == 4096
-        assert Btn.MIDDLE == 2048
-        assert Btn.WHEEL_DOWN == 1
-        assert Btn.WHEEL_UP == -1
+@pytest.mark.offline
+class TestHandlePsmrl:
+    """psmrl 参数转换测试，不需要网关"""
+
+    def test_handle_psmrl_concurrent(self):
+        """测试多个线程同时遇到未登记的类型时，分派表的登记与查找不会互相干扰"""
+        from py_sikulix.client import _RawBacked
+        from py_sikulix.region import _PSMRL_DISPATCH
+
+        class RawHolder(_RawBacked):
+            __slots__ = ('_raw',)
+
+            @property
+            def __class__(self):
+                # isinstance 会读取 __class__，在这里让出 GIL，使查找分派表的过程中切换到其他线程
+                time.sleep(0)
+                return type(self)
+
+        # 每个类型都是未登记的子类，首次出现时都会走 isinstance 查找并写入分派表
+        str_types = [type(f'PathStr{i}', (str,), {}) for i in range(100)]
+        raw_types = [type(f'RawHolder{i}', (RawHolder,), {'__slots__': ()}) for i in range(100)]
+        expected_path = str(pathlib.Path('a.png').absolute())
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def worker(offset: int):
+            barrier.wait()
+            try:
+                for i in range(100):
+                    str_type = str_types[(i + offset * 13) % 100]
+                    assert Region._handle_psmrl(str_type('a.png')) == expected_path
+                    holder = raw_types[(i + offset * 7) % 100]()
+                    holder._raw = offset
+                    assert Region._handle_psmrl(holder) == offset
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert all(t in _PSMRL_DISPATCH for t in str_types + raw_types)
+
+
+@pytest.mark.offline
+class TestClickUntil:
+    """click_until 计数测试，用替身代替 Java 方法，不需要网关"""
+
+    @staticmethod
+    def _region(found: list, calls: list) -> Region:
+        """exists 依次返回 found 中的结果，找完后返回 None；点击成功返回 1"""
+        region = Region.__new__(Region)
+        found = iter(found)
+
+        def exists(target, timeout):
+            calls.append(('exists', timeout))
+            return next(found, None)
+
+        def click(match):
+            calls.append(('click', match))
+            return 1
+
+        region._exists = exists
+        region._click = click
+        return region
+
+    def test_click_until_vanished(self):
+        """测试目标消失后立即停止，查找不等待 AutoWaitTimeout"""
+        calls = []
+        region = self._region(['m1', 'm2'], calls)
+
+        assert region.click_until('button.png', max_clicks=5, interval=0) == 2
+        assert calls == [('exists', 0.0), ('click', 'm1'), ('exists', 0.0), ('click', 'm2'), ('exists', 0.0)]
+
+    def test_click_until_max_clicks(self):
+        """测试达到最大点击次数后停止"""
+        calls = []
+        region = self._region(['m1', 'm2', 'm3'], calls)
+
+        assert region.click_until('button.png', max_clicks=2, interval=0) == 2
+        assert calls.count(('exists', 0.0)) == 2
+
+    def test_click_until_not_found(self):
+        """测试第一轮就找不到目标时返回 0"""
+        calls = []
+        region = self._region([], calls)
+
+        assert region.click_until('button.png', max_clicks=3) == 0
+        assert calls == [('exists', 0.0)]